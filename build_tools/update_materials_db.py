@@ -5,6 +5,7 @@ def load_materials_database():
     import pymongo
     import pickle
     import os
+    from scilightcon.datasets._materials_store import save_materials_store
 
     CONN_STR = os.environ['CONN_STR']
 
@@ -17,5 +18,10 @@ def load_materials_database():
 
     materials = {element['Key'] : element['Value'] for element in cursor}
 
-    with open(os.path.join(os.path.dirname(os.path.realpath(__file__)), '../scilightcon/datasets/data/toolbox_materials.pkl'), 'wb') as f:
-        pickle.dump(materials, f)
\ No newline at end of file
+    data_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), '../scilightcon/datasets/data')
+
+    with open(os.path.join(data_dir, 'toolbox_materials.pkl'), 'wb') as f:
+        pickle.dump(materials, f)
+
+    # columnar, memory-mappable copy used by scilightcon.datasets.load_materials()
+    save_materials_store(materials, os.path.join(data_dir, 'toolbox_materials.npz'))
\ No newline at end of file
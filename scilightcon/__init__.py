@@ -1,10 +1,14 @@
 __version__ = "0.4.1"
 
-from . import plot
-from . import utils
-from . import datasets
-from . import optics
-from . import fitting
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import plot
+    from . import utils
+    from . import datasets
+    from . import optics
+    from . import fitting
 
 __all__ = [
     "plot",
@@ -13,3 +17,12 @@ __all__ = [
     "optics",
     "fitting"
 ]
+
+def __getattr__(name):
+    # subpackages are imported on first access, so that `import scilightcon` does not pull in matplotlib or scipy
+    if name in __all__:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
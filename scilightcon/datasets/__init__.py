@@ -1,7 +1,8 @@
 """Module for loading datasets"""
 
-from ._base import load_EKSMA_OPTICS_mirror_reflections, load_EO_filter_transmissions, load_THORLABS_filter_transmissions, load_csv_data, load_zipped_csv_data, load_atmospheric_data, DATA_MODULE
+from ._base import load_EKSMA_OPTICS_mirror_reflections, load_EO_filter_transmissions, load_THORLABS_filter_transmissions, load_csv_data, load_zipped_csv_data, load_atmospheric_data, load_lamp_spectrum, set_dataset_cache_dir, DATA_MODULE
 from ._logs_reader import LogsReader
+from ._catalog import list_optical_curves, load_optical_curves
 
 __all__ = [
     "load_EKSMA_OPTICS_mirror_reflections",
@@ -10,8 +11,19 @@ __all__ = [
     "load_csv_data",
     "load_zipped_csv_data",
     "load_atmospheric_data",
+    "load_lamp_spectrum",
     "load_csv_data",
-    "LogsReader"
+    "LogsReader",
+    "set_dataset_cache_dir",
+    "list_optical_curves",
+    "load_optical_curves"
 ]
 
-_materials = _base.load_materials()
+def __getattr__(name):
+    # the material database is unpickled and indexed on first access
+    global _materials, _materials_index, _materials_terms
+    if name in ("_materials", "_materials_index", "_materials_terms"):
+        _materials = _base.load_materials()
+        _materials_index, _materials_terms = _base._index_materials(_materials)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,28 +1,43 @@
 """Base data loading code for all datasets
 
 """
+import bz2
 import csv
 import gzip
+import hashlib
+import io
+import json
+import lzma
 import os
 import pickle
-import numpy as np
-import shutil
 import tempfile
-from typing import Tuple, List
+import numpy as np
+from functools import lru_cache
+from typing import Tuple, List, Dict, Union
 from typing_extensions import Literal
 import scilightcon
 from ..utils._fixes import _open_text, _open_binary
+from ._materials_store import load_materials_store
 from scilightcon.utils._fixes import _get_path
 
 DATA_MODULE = "scilightcon.datasets.data"
 DATA_MODULE_THORLABS = "scilightcon.datasets.data.thorlabs"
 DATA_MODULE_EO = "scilightcon.datasets.data.EO"
 MATERIALS_PICKLE_FILENAME = "toolbox_materials.pkl"
+MATERIALS_STORE_FILENAME = "toolbox_materials.npz"
+# number of characters of a csv file parsed at once
+CSV_CHUNK_SIZE = 1 << 20
+# number of parsed datasets kept in memory by the filter, mirror and atmosphere loaders
+DATASET_CACHE_SIZE = 128
+
+_dataset_cache_dir = os.environ.get("SCILIGHTCON_CACHE_DIR")
 
 def load_csv_data(
     data_file_name,
     *,
-    data_module=DATA_MODULE
+    data_module=DATA_MODULE,
+    dtype=np.float64,
+    usecols=None
 ):
     """
     Loads `data_file_name` from `data_module` with `importlib.resources`.
@@ -30,10 +45,15 @@ def load_csv_data(
     Examples:
         >>> from scilightcon.datasets import load_csv_data
         >>> data, header = load_csv_data('Hg_lines.csv')
+        >>> wavelengths, header = load_csv_data('atmosphere.csv', dtype=np.float32, usecols=[0])
+        >>> wavelengths.dtype, header
+        (dtype('float32'), ['Wavelength (um)'])
 
     Args:
         data_file_name (str): Name of csv file to be loaded from `data_module/data_file_name`.
         data_module (str or module):  Module where data lives. The default is `'scilightcon.datasets.data'`
+        dtype (dtype): Data type of the returned array, e.g. `np.float32` to halve the memory of large files
+        usecols (list): Indices of the columns to load, all columns if `None`
 
     Returns:
         data (ndarray): A 2D array with each row representing one sample and each column representing the features of a given sample. Shape: n_samples, n_features
@@ -42,63 +62,196 @@ def load_csv_data(
 
     """
     csv_file_path = _get_path(data_module, data_file_name)
-    return _read_csv_file(csv_file_path)
+    return _read_csv_file(csv_file_path, dtype=dtype, usecols=usecols)
 
-def _read_csv_file(csv_file_path):
+def _read_csv_file(csv_file_path, dtype=np.float64, usecols=None):
     with open(csv_file_path, 'r') as csv_file:
-        data_file = csv.reader(csv_file)
-        n_header = 0
-        possibly_header = next(data_file)
-        header = [''] * len(possibly_header)
-        is_header = possibly_header[0][0] == '#'
-        if is_header:
-            header = possibly_header
-            header[0] = header[0][1:]
-            header = [entry.strip() for entry in header]
-
-        while is_header:
-            n_header = n_header + 1
-            is_header = next(data_file)[0][0] == '#'
-
-        csv_file.seek(n_header)
-        n_samples = sum(1 for row in data_file) - n_header
-        csv_file.seek(n_header)
-        temp = next(data_file)
-        n_features = len(temp)
-        csv_file.seek(n_header)
-        data = np.empty((n_samples, n_features))
-
-        for i, ir in enumerate(data_file):
-            if i>=n_header:
-                data[i-n_header] = np.asarray(ir, dtype=np.float64)
-
-        return data, header
-
-def load_zipped_csv_data(data_file_name, *, data_module=DATA_MODULE):
-    """Extracts gzip file to csv.
+        return _read_csv_stream(csv_file, dtype=dtype, usecols=usecols)
+
+def _read_csv_stream(csv_stream, dtype=np.float64, usecols=None):
+    """Parses comma separated numbers from a text stream in a single pass.
+
+    The first line is the header if it starts with `#`, any following `#` lines are skipped. The rest is read in chunks
+    of about `CSV_CHUNK_SIZE` characters, each parsed by `np.loadtxt` and copied into a buffer that doubles when full."""
+    first_line = csv_stream.readline()
+    header = None
+    if first_line.startswith('#'):
+        header = [entry.strip() for entry in next(csv.reader([first_line[1:]]))]
+        first_line = csv_stream.readline()
+        while first_line.startswith('#'):
+            first_line = csv_stream.readline()
+
+    data = None
+    n_samples = 0
+    lines = [first_line] if first_line else []
+    while True:
+        lines += csv_stream.readlines(CSV_CHUNK_SIZE)
+        if not lines:
+            break
+        chunk = np.loadtxt(lines, delimiter=',', dtype=dtype, usecols=usecols, ndmin=2)
+        lines = []
+        if data is None:
+            data = chunk
+        else:
+            if n_samples + len(chunk) > len(data):
+                buffer = np.empty((max(2 * len(data), n_samples + len(chunk)), data.shape[1]), dtype=dtype)
+                buffer[:n_samples] = data[:n_samples]
+                data = buffer
+            data[n_samples:n_samples + len(chunk)] = chunk
+        n_samples += len(chunk)
+
+    if header is not None and usecols is not None:
+        header = [header[i] for i in np.atleast_1d(usecols)]
+    if data is None:
+        n_features = len(header) if header is not None else 0
+        data = np.empty((0, n_features), dtype=dtype)
+    elif len(data) > n_samples:
+        data.resize((n_samples, data.shape[1]), refcheck=False)
+    if header is None:
+        header = [''] * data.shape[1]
+    return data, header
+
+def load_zipped_csv_data(data_file_name, *, data_module=DATA_MODULE, dtype=np.float64, usecols=None):
+    """Loads a compressed csv file, parsing it straight from the decompression stream.
+
+    The compression is recognized from the first bytes of the file: gzip, bzip2, xz/lzma or, if the `zstandard` package
+    is installed, zstd. Uncompressed files are read as they are.
 
     Examples:
-        >>> from scilightcon.datasets import load_zipped_csv_data # doctest: +SKIP
-        >>> data_file_name = r'C:\Code\lightcon-scipack\scilightcon\datasets\data\data_test_detect_peaks.csv.gz' # doctest: +SKIP
-        >>> data, header = _load_zipped_csv_data(data_file_name) # doctest: +SKIP
+        >>> from scilightcon.datasets import load_zipped_csv_data
+        >>> data, header = load_zipped_csv_data('data_test_detect_peaks.csv.gz')
+        >>> header
+        ['Wavelength (nm)', 'Background (mV)']
 
     Args:
-        data_file_name (str): Path of the file that needs to be extracted
+        data_file_name (str): Name of the compressed csv file in `data_module`
         data_module (str or module):  Module where data lives. The default is `'scilightcon.datasets.data'`
+        dtype (dtype): Data type of the returned array
+        usecols (list): Indices of the columns to load, all columns if `None`
 
     Returns:
         data (Ndarray): A 2D array of data with headers excluded. Shape (n_samples, n_columns)
         header (List): Column names or empty strings. Shape (n_columns)
     """
-    temp_dir = tempfile.gettempdir()
-    temp_path = os.path.join(temp_dir, 'extracted.csv')
+    with _open_binary(data_module, data_file_name) as compressed_file:
+        with _open_decompressed_text(compressed_file) as csv_stream:
+            return _read_csv_stream(csv_stream, dtype=dtype, usecols=usecols)
+
+def _open_decompressed_text(binary_file):
+    """Wraps a binary file object into a text stream that decompresses it on the fly"""
+    magic = binary_file.read(6)
+    binary_file.seek(0)
+    if magic.startswith(b'\x1f\x8b'):
+        return gzip.open(binary_file, 'rt')
+    if magic.startswith(b'BZh'):
+        return bz2.open(binary_file, 'rt')
+    if magic.startswith(b'\xfd7zXZ\x00') or magic.startswith(b'\x5d\x00\x00'):
+        return lzma.open(binary_file, 'rt')
+    if magic.startswith(b'\x28\xb5\x2f\xfd'):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("Reading zstd compressed files requires the zstandard package")
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(binary_file))
+    return io.TextIOWrapper(binary_file)
+
+def set_dataset_cache_dir(path: Union[None, str, os.PathLike]) -> None:
+    """Sets a directory for binary copies of the bundled datasets, or disables them with `None`.
+
+    The first load of a dataset stores its parsed array as a `.npy` file, with the size, modification time and
+    SHA-256 hash of the source csv file in a `.json` file next to it. Later processes load the array instead of
+    parsing the csv file again, as long as the source is unchanged. The default is the `SCILIGHTCON_CACHE_DIR`
+    environment variable, if it is set.
+
+    Examples:
+        >>> from scilightcon.datasets import set_dataset_cache_dir
+        >>> set_dataset_cache_dir(None)
+
+    Args:
+        path (str): Directory of the binary copies, created if it does not exist
+    """
+    global _dataset_cache_dir
+    _dataset_cache_dir = None if path is None else os.fspath(path)
+
+@lru_cache(maxsize=DATASET_CACHE_SIZE)
+def _load_cached_csv_data(data_module: str, data_file_name: str) -> Tuple[np.ndarray, Tuple[str, ...]]:
+    """Loads a csv dataset once per process. The array is read-only, since every caller shares it."""
+    csv_file_path = _get_path(data_module, data_file_name)
+    cached = _load_sidecar(data_module, data_file_name, csv_file_path)
+    if cached is not None:
+        return cached
 
-    gz_file_path = _get_path(scilightcon.datasets.DATA_MODULE, data_file_name)
-    with gzip.open(gz_file_path, 'r') as file_in:
-            with open(temp_path, 'wb') as file_out:
-                shutil.copyfileobj(file_in, file_out)
+    data, header = _read_csv_file(csv_file_path)
+    _save_sidecar(data_module, data_file_name, csv_file_path, data, header)
+    data.flags.writeable = False
+    return data, tuple(header)
 
-    return _read_csv_file(temp_path)
+def _get_sidecar_paths(data_module: str, data_file_name: str) -> Tuple[str, str]:
+    base_name = os.path.join(_dataset_cache_dir, f"{data_module}.{data_file_name}")
+    return base_name + ".npy", base_name + ".json"
+
+def _get_source_signature(csv_file_path) -> Union[None, dict]:
+    """Returns size and modification time of a dataset, `None` if it is not a file on disk (e.g. in a zip archive)"""
+    try:
+        status = os.stat(csv_file_path)
+    except (TypeError, OSError):
+        return None
+    return {"size": status.st_size, "mtime_ns": status.st_mtime_ns}
+
+def _get_source_hash(csv_file_path) -> str:
+    with open(csv_file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def _load_sidecar(data_module: str, data_file_name: str, csv_file_path) -> Union[None, Tuple[np.ndarray, Tuple[str, ...]]]:
+    """Returns the binary copy of a dataset if it matches its source, `None` otherwise"""
+    if _dataset_cache_dir is None:
+        return None
+    signature = _get_source_signature(csv_file_path)
+    if signature is None:
+        return None
+    data_path, meta_path = _get_sidecar_paths(data_module, data_file_name)
+    try:
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        if meta["size"] != signature["size"]:
+            return None
+        if meta["mtime_ns"] != signature["mtime_ns"]:
+            # e.g. a reinstalled package, the content decides
+            if meta["sha256"] != _get_source_hash(csv_file_path):
+                return None
+            _write_atomically(meta_path, lambda f: f.write(json.dumps(dict(meta, **signature)).encode()))
+        data = np.load(data_path)
+    except (OSError, ValueError, KeyError):
+        return None
+    data.flags.writeable = False
+    return data, tuple(meta["header"])
+
+def _save_sidecar(data_module: str, data_file_name: str, csv_file_path, data: np.ndarray, header: List[str]) -> None:
+    if _dataset_cache_dir is None:
+        return
+    signature = _get_source_signature(csv_file_path)
+    if signature is None:
+        return
+    meta = dict(signature, sha256=_get_source_hash(csv_file_path), header=list(header))
+    data_path, meta_path = _get_sidecar_paths(data_module, data_file_name)
+    try:
+        os.makedirs(_dataset_cache_dir, exist_ok=True)
+        _write_atomically(data_path, lambda f: np.save(f, data))
+        _write_atomically(meta_path, lambda f: f.write(json.dumps(meta).encode()))
+    except OSError:
+        # the binary copy is only an optimization
+        pass
+
+def _write_atomically(path: str, write) -> None:
+    """Writes a file through a temporary file in the same directory, so that concurrent processes never read a partial file"""
+    handle, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'wb') as f:
+            write(f)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
 
 def load_EO_filter_transmissions(
         filter: Literal
@@ -117,20 +270,17 @@ def load_EO_filter_transmissions(
         filter (str): `lp_400nm`, `lp_450nm`, `lp_500nm`, `lp_550nm`, `lp_600nm`, `lp_600nm`, `lp_700nm`, `lp_750nm`, `sp_400nm`, `sp_500nm`, `sp_600nm` or `sp_700nm`
 
     Returns:
-        data (Ndarray): A 2D array of data with headers excluded. Shape (n_samples, n_columns)
+        data (Ndarray): A read-only 2D array of data with headers excluded, shared by all callers. Shape (n_samples, n_columns)
         header (List): Column names or empty strings. Shape (n_columns)
     """
     data_file_name = 'transmission_EO_{:}.csv'.format(filter)
 
     try:
-        data, header = load_csv_data(
-            data_file_name=data_file_name,
-            data_module=DATA_MODULE_EO
-        )
+        data, header = _load_cached_csv_data(DATA_MODULE_EO, data_file_name)
     except FileNotFoundError:
         raise ValueError
 
-    return data, header
+    return data, list(header)
 
 def load_THORLABS_filter_transmissions(
         filter: Literal
@@ -149,20 +299,17 @@ def load_THORLABS_filter_transmissions(
         filter (str): `DMLP425`, `DMLP550`, `DMLP650`, `FB340-10`, `FBH343-10`, `FBH400-40`, `FBH515-10`, `FBH520-40`, `FBH550-40`, `FEL0400`, `FEL0450`, `FEL0500`, `FEL0550`, `FEL0600`, `FEL0650`, `FEL0700`, `FEL0750`, `FEL0800`, `FEL0850`, `FEL0900`, `FEL0950`, `FEL1000`, `FEL1050`, `FEL1100`, `FEL1150`, `FEL1200`, `FEL1250`, `FEL01300`, `FEL1350`, `FEL1400`, `FEL1450`, `FEL1500`, `FELH1000`, `FELH1050`, `FELH1100`, `FELH1250`, `FELH1500`, `FES0450`, `FES0500`, `FES0550`, `FES0600`, `FES0650`, `FES0700`, `FES0750`, `FES0800`, `FES0850`, `FES0900`, `FES0950`, `FES1000`, `FESH0450`, `FES0500`, `FES0600`, `FES0700`, `FES0750`,  `FGB37`, `FGB39`, `FGS550`, `FGS700`, `FGS900`, `FGUV5`, `FGUV11`, `FL514.5-10`, `FL530-10`, `MF460-60`, `NDUV01B`, `NDUV02B`, `NDUV06B`, `NDUV10B`, `NDUV20B`, `NDUV30B`, `NDUV40B`, `NE01B`, `NE06B`, `NE10B`, `NE20B`, `NE30B`, `NE40B`, `NE50B` or `NE60B`
 
     Returns:
-        data (Ndarray): A 2D array of data with headers excluded. Shape (n_samples, n_columns)
+        data (Ndarray): A read-only 2D array of data with headers excluded, shared by all callers. Shape (n_samples, n_columns)
         header (List): Column names or empty strings. Shape (n_columns)
     """
     data_file_name = 'transmission_THORLABS_{:}.csv'.format(filter)
 
     try:
-        data, header = load_csv_data(
-            data_file_name=data_file_name,
-            data_module=DATA_MODULE_THORLABS
-        )
+        data, header = _load_cached_csv_data(DATA_MODULE_THORLABS, data_file_name)
     except FileNotFoundError:
         raise ValueError
 
-    return data, header
+    return data, list(header)
 
 def load_EKSMA_OPTICS_mirror_reflections(
     material: Literal['Al', 'Ag', 'Au']
@@ -183,20 +330,18 @@ def load_EKSMA_OPTICS_mirror_reflections(
         material (str): `Ag`, `Au` or `Al`
 
     Returns:
-        data (Ndarray): A 2D array of data with headers excluded. Shape (n_samples, n_columns)
+        data (Ndarray): A read-only 2D array of data with headers excluded, shared by all callers. Shape (n_samples, n_columns)
         header (List): Column names or empty strings. Shape (n_columns)
 
     """
     data_file_name = 'reflection_EKSMA_{:}.csv'.format(material)
 
     try:
-        data, header = load_csv_data(
-            data_file_name=data_file_name
-        )
+        data, header = _load_cached_csv_data(DATA_MODULE, data_file_name)
     except FileNotFoundError:
         raise ValueError
 
-    return data, header
+    return data, list(header)
 
 def load_atmospheric_data() -> Tuple[np.ndarray, list]:
     """
@@ -207,25 +352,87 @@ def load_atmospheric_data() -> Tuple[np.ndarray, list]:
         >>> data, header = load_atmospheric_data()
 
     Returns:
-        data (Ndarray): A 2D array of data with headers excluded. Shape (n_samples, n_columns)
+        data (Ndarray): A read-only 2D array of data with headers excluded, shared by all callers. Shape (n_samples, n_columns)
         header (List): Column names or empty strings. Shape (n_columns)
 
     """
     data_file_name = 'atmosphere.csv'
 
     try:
-        data, header = load_csv_data(
-            data_file_name=data_file_name
-        )
+        data, header = _load_cached_csv_data(DATA_MODULE, data_file_name)
     except FileNotFoundError:
         raise ValueError
 
-    return data, header
+    return data, list(header)
+
+def load_lamp_spectrum(lamp: Literal['Hg', 'Ar', 'White_LED']) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Loads the emission lines of a mercury or argon calibration lamp, or the spectrum of a white LED, sorted by wavelength.
+
+    Examples:
+        >>> from scilightcon.datasets import load_lamp_spectrum
+        >>> wl, intensity = load_lamp_spectrum('Hg')
+        >>> bool(np.all(np.diff(wl) >= 0))
+        True
+
+    Args:
+        lamp (str): `Hg`, `Ar` or `White_LED`
+
+    Returns:
+        wl (Ndarray): A read-only array of wavelengths in nm, shared by all callers
+        intensity (Ndarray): A read-only array of relative intensities at `wl`
+
+    """
+    if lamp not in _LAMP_FILES:
+        raise ValueError(f"Unknown lamp {lamp}")
+    return _load_sorted_spectrum(_LAMP_FILES[lamp])
+
+_LAMP_FILES = {'Hg': 'Hg_lines.csv', 'Ar': 'Ar_lines.csv', 'White_LED': 'White_LED_spectrum.csv'}
+
+@lru_cache(maxsize=None)
+def _load_sorted_spectrum(data_file_name: str) -> Tuple[np.ndarray, np.ndarray]:
+    data, header = _load_cached_csv_data(DATA_MODULE, data_file_name)
+    order = np.argsort(data[:, 0], kind='stable')
+    wl = np.ascontiguousarray(data[order, 0], dtype=np.float64)
+    intensity = np.ascontiguousarray(data[order, 1], dtype=np.float64)
+    wl.flags.writeable = False
+    intensity.flags.writeable = False
+    return wl, intensity
 
 def load_materials():
     """
     Loads material database as scilightcon.datasets.materials
+
+    The memory-mapped columnar store is used when it is available, otherwise the pickle of nested dicts is loaded.
     """
+    store_path = _get_path(DATA_MODULE, MATERIALS_STORE_FILENAME)
+    if store_path.is_file():
+        return load_materials_store(store_path)
+
     with _open_binary(DATA_MODULE, MATERIALS_PICKLE_FILENAME) as f:
         materials = pickle.load(f)
         return materials
+
+def _index_materials(materials: dict) -> Tuple[Dict[str, str], Dict[str, Tuple[str, ...]]]:
+    """
+    Builds case-insensitive lookup tables for the material database.
+
+    Returns:
+        index (dict): Lower-cased name, chemformula or alias mapped to the database key. The database key itself
+            is used only when it does not clash with any name. When several materials share a name, the first one wins.
+        terms (dict): Database key mapped to all lower-cased names of the material, including the key
+    """
+    terms = {}
+    for key, material in materials.items():
+        names = [material["Name"], material["Chemformula"]] + list(material["Alias"]) + [key]
+        terms[key] = tuple(dict.fromkeys(name.lower() for name in names if name))
+
+    index = {}
+    for key, material in materials.items():
+        for name in [material["Name"], material["Chemformula"]] + list(material["Alias"]):
+            if name:
+                index.setdefault(name.lower(), key)
+    for key in materials:
+        index.setdefault(key.lower(), key)
+
+    return index, terms
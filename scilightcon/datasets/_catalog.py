@@ -0,0 +1,144 @@
+"""Catalog of the bundled filter transmission and mirror reflection curves
+
+"""
+import re
+from functools import lru_cache
+from typing import List, Sequence, Tuple, Union
+import numpy as np
+from ..utils._fixes import _list_files
+from ._base import DATA_MODULE, DATA_MODULE_EO, DATA_MODULE_THORLABS, _load_cached_csv_data
+
+# (data module, file name pattern, vendor, measured quantity)
+_SOURCES = (
+    (DATA_MODULE_THORLABS, r"transmission_THORLABS_(.+)\.csv", "THORLABS", "transmission"),
+    (DATA_MODULE_EO, r"transmission_EO_(.+)\.csv", "EO", "transmission"),
+    (DATA_MODULE, r"reflection_EKSMA_(.+)\.csv", "EKSMA OPTICS", "reflection"),
+    (DATA_MODULE, r"reflection_EDMUND_(.+)\.csv", "EDMUND", "reflection"),
+)
+
+# part name prefix, filter type and the position of the nominal wavelength in the name
+_PART_TYPES = (
+    (r"FELH?(\d+)$", "longpass"),
+    (r"FESH?(\d+)$", "shortpass"),
+    (r"DMLP(\d+)$", "dichroic longpass"),
+    (r"(?:FBH?|FL|MF)(\d+(?:\.\d+)?)-\d+$", "bandpass"),
+    (r"(?:NE|NDUV)\d+B$", "neutral density"),
+    (r"FG", "colored glass"),
+    (r"lp_(\d+)nm$", "longpass"),
+    (r"sp_(\d+)nm$", "shortpass"),
+)
+
+def list_optical_curves(vendor: Union[None, str] = None, type: Union[None, str] = None, quantity: Union[None, str] = None) -> List[dict]:
+    """
+    Lists the bundled filter transmission and mirror reflection curves.
+
+    Every entry is a dict with the part `name` accepted by the vendor loader (e.g. `load_THORLABS_filter_transmissions()`),
+    `vendor`, filter `type` (`longpass`, `shortpass`, `dichroic longpass`, `bandpass`, `neutral density`, `colored glass`
+    or `mirror`), measured `quantity` (`transmission` or `reflection`), nominal `wavelength` in nm taken from the part name
+    (cut-on of longpass, cut-off of shortpass and center of bandpass filters, `None` otherwise) and the wavelength range
+    `wl_min`, `wl_max` in nm covered by the data.
+
+    Examples:
+        >>> from scilightcon.datasets import list_optical_curves
+        >>> longpass = list_optical_curves(vendor='THORLABS', type='longpass')
+        >>> longpass[0]['name'], longpass[0]['wavelength']
+        ('FEL0400', 400.0)
+
+    Args:
+        vendor (str): Only curves of this vendor, `THORLABS`, `EO`, `EKSMA OPTICS` or `EDMUND`
+        type (str): Only curves of this type
+        quantity (str): Only `transmission` or `reflection` curves
+
+    Returns:
+        A list of curve entries
+    """
+    return [dict(entry) for entry in _get_catalog()
+            if (vendor is None or entry['vendor'] == vendor) and (type is None or entry['type'] == type)
+            and (quantity is None or entry['quantity'] == quantity)]
+
+def load_optical_curves(wl: np.ndarray, curves: Union[None, Sequence[Union[str, dict]]] = None, percent: bool = False,
+                        fill_value: float = np.nan) -> Tuple[np.ndarray, List[dict]]:
+    """
+    Loads bundled curves resampled by linear interpolation onto a common wavelength grid as rows of one matrix,
+    so that all filters can be compared with array operations.
+
+    Examples:
+        >>> import numpy as np
+        >>> from scilightcon.datasets import list_optical_curves, load_optical_curves
+        >>> wl = np.linspace(400, 700, 301)
+        >>> matrix, curves = load_optical_curves(wl, list_optical_curves(type='longpass'))
+        >>> band = (wl > 600) & (wl < 650)
+        >>> best = np.nanargmax(np.nanmean(matrix[:, band], axis=1) - np.nanmean(matrix[:, ~band], axis=1))
+        >>> curves[best]['name']
+        'FEL0600'
+
+    Args:
+        wl (ndarray): Wavelength grid in nm
+        curves (list): Entries of `list_optical_curves()` or part names, all curves if `None`
+        percent (bool): Whether to return values in percent rather than as fractions
+        fill_value (float): Value outside the wavelength range of a curve
+
+    Returns:
+        matrix (ndarray): Curves on the grid, shape (n_curves, n_wavelengths)
+        curves (list): Entries of the loaded curves in the order of the rows
+    """
+    wl = np.asarray(wl, dtype=np.float64)
+    catalog = _get_catalog()
+    if curves is None:
+        entries = list(catalog)
+    else:
+        names = {entry['name']: entry for entry in catalog}
+        entries = []
+        for curve in curves:
+            name = curve['name'] if isinstance(curve, dict) else curve
+            if name not in names:
+                raise ValueError(f"Unknown curve {name}")
+            entries.append(names[name])
+
+    matrix = np.empty((len(entries), wl.size))
+    for row, entry in zip(matrix, entries):
+        curve_wl, values = _get_sorted_curve(entry['module'], entry['file'])
+        row[:] = np.interp(wl.ravel(), curve_wl, values, left=fill_value, right=fill_value)
+    if not percent:
+        matrix /= 100.0
+    return matrix.reshape((len(entries),) + wl.shape), [dict(entry) for entry in entries]
+
+@lru_cache(maxsize=None)
+def _get_catalog() -> Tuple[dict, ...]:
+    entries = []
+    for data_module, pattern, vendor, quantity in _SOURCES:
+        for file_name in _list_files(data_module):
+            match = re.fullmatch(pattern, file_name)
+            if match is None:
+                continue
+            name = match.group(1)
+            curve_type, wavelength = _get_part_type(name) if quantity == "transmission" else ("mirror", None)
+            curve_wl, _ = _get_sorted_curve(data_module, file_name)
+            entries.append({
+                'name': name,
+                'vendor': vendor,
+                'type': curve_type,
+                'quantity': quantity,
+                'wavelength': wavelength,
+                'wl_min': float(curve_wl[0]),
+                'wl_max': float(curve_wl[-1]),
+                'module': data_module,
+                'file': file_name,
+            })
+    return tuple(entries)
+
+def _get_part_type(name: str) -> Tuple[Union[None, str], Union[None, float]]:
+    for pattern, curve_type in _PART_TYPES:
+        match = re.match(pattern, name)
+        if match is not None:
+            return curve_type, float(match.group(1)) if match.groups() else None
+    return None, None
+
+@lru_cache(maxsize=None)
+def _get_sorted_curve(data_module: str, file_name: str) -> Tuple[np.ndarray, np.ndarray]:
+    data, _ = _load_cached_csv_data(data_module, file_name)
+    order = np.argsort(data[:, 0], kind='stable')
+    curve_wl, values = data[order, 0], data[order, 1]
+    curve_wl.flags.writeable = False
+    values.flags.writeable = False
+    return curve_wl, values
@@ -1,5 +1,4 @@
 import datetime
-import pytest
 from datetime import date
 import numpy as np
 import os
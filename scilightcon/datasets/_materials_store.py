@@ -0,0 +1,195 @@
+"""Columnar on-disk format of the material database
+
+The catalog is stored as an uncompressed `.npz` archive. Numeric fields of material parameters are
+packed into matrices (fixed width fields like Sellmeier coefficients) or into flat arrays indexed by
+per-parameter lengths (tabulated `DataN`, `DataNWl`, `DataK` and `DataKWl`). All the remaining fields
+are kept in a small JSON document stored in the same archive. When the archive is a regular file, its
+members are memory-mapped, so records handed out by `MaterialsStore` are read-only views into
+the shared file pages.
+"""
+import json
+import os
+import struct
+import zipfile
+from collections.abc import Mapping
+from typing import Dict, Iterator
+import numpy as np
+
+STORE_FORMAT_VERSION = 1
+
+# parameter fields packed as rows of zero-padded matrices
+_FIXED_FIELDS = {
+    "WlNRange": 2,
+    "WlKRange": 2,
+    "WlRange": 2,
+    "TTunningMargins": 2,
+    "DndT": 3,
+    "SellmeierCoeffs": 17,
+    "XC": 11,
+    "YC": 11,
+    "ZC": 11,
+}
+
+# parameter fields of arbitrary length packed one after another into flat arrays
+_TABULATED_FIELDS = ("DataN", "DataNWl", "DataK", "DataKWl")
+
+_ZIP_LOCAL_HEADER_SIZE = 30
+
+def save_materials_store(materials: dict, file) -> None:
+    """Writes the material database (dict of material records) to an uncompressed `.npz` archive.
+
+    Args:
+        materials (dict): Material records keyed by database key, as stored in `toolbox_materials.pkl`
+        file (str or file): Target file name or file object
+    """
+    parameters = [parameter for material in materials.values() for parameter in material["Parameters"]]
+    n_parameters = len(parameters)
+    array_fields = set(_FIXED_FIELDS) | set(_TABULATED_FIELDS) | {"Formula"}
+
+    arrays = {"param.Formula": np.array([parameter["Formula"] for parameter in parameters], dtype=np.int8)}
+
+    for field, width in _FIXED_FIELDS.items():
+        matrix = np.zeros((n_parameters, width))
+        lengths = np.full(n_parameters, -1, dtype=np.int16)
+        for i, parameter in enumerate(parameters):
+            if parameter[field] is not None:
+                lengths[i] = len(parameter[field])
+                matrix[i, :lengths[i]] = parameter[field]
+        arrays["param." + field] = matrix
+        arrays["param." + field + ".length"] = lengths
+
+    for field in _TABULATED_FIELDS:
+        values = [parameter[field] for parameter in parameters]
+        arrays["param." + field] = np.array([value for entry in values if entry for value in entry], dtype=np.float64)
+        arrays["param." + field + ".length"] = np.array([-1 if entry is None else len(entry) for entry in values], dtype=np.int64)
+
+    meta = {
+        "version": STORE_FORMAT_VERSION,
+        "materials": [
+            dict({field: value for field, value in material.items() if field != "Parameters"},
+                 Key=key,
+                 Parameters=[{field: value for field, value in parameter.items() if field not in array_fields}
+                             for parameter in material["Parameters"]])
+            for key, material in materials.items()
+        ]
+    }
+    arrays["meta"] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+
+    np.savez(file, **arrays)
+
+def load_materials_store(path) -> "MaterialsStore":
+    """Opens the material database saved by `save_materials_store`, memory-mapping it when possible.
+
+    Args:
+        path (str or Traversable): Path of the `.npz` archive
+
+    Returns:
+        Material records keyed by database key
+    """
+    if isinstance(path, (str, os.PathLike)) and os.path.isfile(path):
+        arrays = _memory_map_npz(path)
+    else:
+        with path.open("rb") as f:
+            with np.load(f) as archive:
+                arrays = {name: archive[name] for name in archive.files}
+
+    return MaterialsStore(arrays)
+
+class MaterialsStore(Mapping):
+    """Read-only mapping of database keys to material records, backed by columnar arrays.
+
+    Records have the same fields as the ones in `toolbox_materials.pkl`, numeric fields of parameters
+    are read-only array views into the store instead of lists. A record is assembled on first access
+    and reused afterwards.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        meta = json.loads(arrays["meta"].tobytes().decode("utf-8"))
+        if meta["version"] != STORE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported materials store version {meta['version']}")
+
+        self._arrays = arrays
+        self._meta = {material["Key"]: material for material in meta["materials"]}
+        self._records = {}
+
+        self._first_parameter = {}
+        n_parameters = 0
+        for key, material in self._meta.items():
+            self._first_parameter[key] = n_parameters
+            n_parameters += len(material["Parameters"])
+
+        self._offsets = {}
+        for field in _TABULATED_FIELDS:
+            self._offsets[field] = np.concatenate(([0], np.cumsum(np.maximum(arrays["param." + field + ".length"], 0))))
+
+    @property
+    def formulas(self) -> np.ndarray:
+        """Formula index of every parameter set in storage order"""
+        return self._arrays["param.Formula"]
+
+    def get_matrix(self, field: str) -> np.ndarray:
+        """Returns the packed, zero-padded matrix of a fixed width parameter field (e.g. `SellmeierCoeffs`),
+        one row per parameter set in storage order"""
+        return self._arrays["param." + field]
+
+    def __getitem__(self, key: str) -> dict:
+        if key not in self._records:
+            self._records[key] = self._build_record(key)
+        return self._records[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._meta)
+
+    def __len__(self) -> int:
+        return len(self._meta)
+
+    def __contains__(self, key) -> bool:
+        return key in self._meta
+
+    def _build_record(self, key: str) -> dict:
+        material = self._meta[key]
+        record = {field: value for field, value in material.items() if field not in ("Key", "Parameters")}
+        record["Parameters"] = []
+        for i, parameter_meta in enumerate(material["Parameters"]):
+            row = self._first_parameter[key] + i
+            parameter = dict(parameter_meta)
+            parameter["Formula"] = int(self._arrays["param.Formula"][row])
+            for field in _FIXED_FIELDS:
+                length = self._arrays["param." + field + ".length"][row]
+                parameter[field] = None if length < 0 else self._arrays["param." + field][row, :length]
+            for field in _TABULATED_FIELDS:
+                length = self._arrays["param." + field + ".length"][row]
+                start = self._offsets[field][row]
+                parameter[field] = None if length < 0 else self._arrays["param." + field][start:start + length]
+            record["Parameters"].append(parameter)
+        return record
+
+def _memory_map_npz(path) -> Dict[str, np.ndarray]:
+    """Memory-maps members of an uncompressed `.npz` archive, compressed members are read into memory"""
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as f:
+        for info in archive.infolist():
+            name = info.filename[:-len(".npy")] if info.filename.endswith(".npy") else info.filename
+            with archive.open(info) as member:
+                version = np.lib.format.read_magic(member)
+                if version == (1, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(member)
+                else:
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(member)
+                header_size = member.tell()
+
+                if info.compress_type != zipfile.ZIP_STORED or dtype.hasobject:
+                    arrays[name] = np.lib.format.read_array(archive.open(info))
+                    continue
+
+            f.seek(info.header_offset)
+            local_header = f.read(_ZIP_LOCAL_HEADER_SIZE)
+            name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+            offset = info.header_offset + _ZIP_LOCAL_HEADER_SIZE + name_length + extra_length + header_size
+
+            if int(np.prod(shape)) == 0:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape,
+                                         order="F" if fortran_order else "C")
+    return arrays
@@ -2,8 +2,10 @@
 
 from ._detect_peaks import detect_peaks
 from ._fitting_2d_beam_profiles import fit_beam_profile_2d
+from ._calibrate_wavelength import calibrate_wavelength
 
 __all__ = [
     "detect_peaks",
-    "fit_beam_profile_2d"       
+    "fit_beam_profile_2d",
+    "calibrate_wavelength"
 ]
\ No newline at end of file
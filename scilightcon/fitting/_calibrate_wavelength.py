@@ -0,0 +1,217 @@
+from typing import Union
+import warnings
+import numpy as np
+from scilightcon.datasets import load_lamp_spectrum
+
+# 1.4826 * median absolute deviation estimates the standard deviation of normally distributed residuals
+_MAD_TO_SIGMA = 1.4826
+# residuals below this many nm are never rejected, so that exact data does not lose matches to rounding errors
+_MIN_SIGMA = 1e-4
+
+def calibrate_wavelength(spectra: np.ndarray, wl_guess: np.ndarray, lines: Union[str, np.ndarray] = 'Hg', degree: int = 3,
+                         tolerance: float = 1.0, threshold: float = 0.05, line_threshold: float = 0.0,
+                         n_sigma: float = 3.0, max_iterations: int = 20, n_passes: int = 2) -> dict:
+    """
+    Wavelength calibration of spectrometers against the emission lines of a calibration lamp.
+
+    Peaks are detected in all spectra at once and located with subpixel precision. Each peak is assigned
+    to the nearest reference line by a binary search over the sorted line table, using the approximate
+    wavelength of its pixel. A polynomial pixel to wavelength mapping is fitted to the matched peaks of every
+    spectrum together, as a batch of weighted least squares problems. The match of every spectrum deviating most
+    from its fit is rejected and the fit repeated while that deviation exceeds `n_sigma` robust standard deviations. With
+    `n_passes` > 1 the peaks are matched again using the fitted mapping.
+
+    Examples:
+        >>> import numpy as np
+        >>> from scilightcon.fitting import calibrate_wavelength
+        >>> from scilightcon.optics import get_Ar_spectrum
+        >>> pixels = np.arange(2048)
+        >>> wl_true = 650.0 + 0.15 * pixels - 3e-6 * pixels**2
+        >>> spectra = get_Ar_spectrum(wl_true, 0.3)
+        >>> result = calibrate_wavelength(spectra, 650.5 + 0.1495 * pixels - 3e-6 * pixels**2, lines='Ar', degree=2)
+        >>> bool(np.max(np.abs(result['wavelength'] - wl_true)) < 1e-3)
+        True
+
+    Args:
+        spectra (ndarray): Spectrum (n_pixels,) or a batch of spectra (n_spectra, n_pixels)
+        wl_guess (ndarray): Approximate wavelength of every pixel in nm, (n_pixels,) or (n_spectra, n_pixels)
+        lines (str or ndarray): `Hg`, `Ar`, `HgAr` for the bundled line tables, or wavelengths of reference lines in nm
+        degree (int): Degree of the calibration polynomial
+        tolerance (float): Largest distance in nm between the approximate wavelength of a peak and its reference line
+        threshold (float): Smallest peak height as a fraction of the highest peak of each spectrum above its median
+        line_threshold (float): Smallest intensity of a bundled reference line as a fraction of the strongest line
+        n_sigma (float): Rejection threshold in robust standard deviations of the residuals
+        max_iterations (int): Maximum number of rejections per spectrum in every pass
+        n_passes (int): Number of matching passes
+
+    Returns:
+        wavelength (ndarray): Calibrated wavelength of every pixel in nm, (n_spectra, n_pixels) or (n_pixels,)
+        coefficients (ndarray): Polynomial coefficients in pixels, highest power first as in `np.polyval`
+        rms (ndarray): RMS residual of the accepted matches in nm
+        n_matched (ndarray): Number of accepted matches
+        peaks (ndarray): Subpixel peak positions, `nan` padded, (n_spectra, n_peaks) or (n_peaks,)
+        matched_lines (ndarray): Reference line of every peak in nm, `nan` for rejected or unmatched peaks
+    """
+    spectra = np.asarray(spectra, dtype=np.float64)
+    single = spectra.ndim == 1
+    spectra = np.atleast_2d(spectra)
+    n_spectra, n_pixels = spectra.shape
+    wl_guess = np.broadcast_to(np.asarray(wl_guess, dtype=np.float64), spectra.shape)
+    reference = _get_reference_lines(lines, line_threshold)
+
+    peaks, heights = _find_peaks(spectra, threshold)
+    valid_peaks = ~np.isnan(peaks)
+    wl_peaks = _interpolate_rows(wl_guess, peaks)
+
+    # polynomials are fitted in a pixel coordinate normalized to [-1, 1]
+    center = 0.5 * (n_pixels - 1)
+    scale = max(center, 1.0)
+    x = (peaks - center) / scale
+
+    coefficients = np.full((n_spectra, degree + 1), np.nan)
+    for _ in range(n_passes):
+        matched, distance = _match_lines(wl_peaks, reference)
+        accepted = valid_peaks & (distance <= tolerance)
+        accepted &= _is_unique_match(matched, distance, accepted)
+        coefficients, accepted = _fit_with_rejection(x, matched, np.sqrt(np.maximum(heights, 0.0)), accepted, degree, n_sigma, max_iterations)
+        # spectra that could not be fitted keep their approximate wavelengths
+        wl_peaks = np.where(np.isnan(coefficients[:, :1]), wl_peaks, _polyval_rows(coefficients, x))
+
+    residuals = np.where(accepted, wl_peaks - matched, 0.0)
+    n_matched = np.sum(accepted, axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rms = np.sqrt(np.sum(residuals**2, axis=1) / n_matched)
+
+    pixel_coefficients = coefficients @ _get_denormalization(degree, center, scale).T
+    result = {
+        'wavelength': _polyval_rows(coefficients, (np.arange(n_pixels) - center) / scale),
+        'coefficients': pixel_coefficients,
+        'rms': rms,
+        'n_matched': n_matched,
+        'peaks': peaks,
+        'matched_lines': np.where(accepted, matched, np.nan),
+    }
+    if single:
+        result = {key: value[0] for key, value in result.items()}
+    return result
+
+def _get_reference_lines(lines: Union[str, np.ndarray], line_threshold: float) -> np.ndarray:
+    if not isinstance(lines, str):
+        return np.sort(np.asarray(lines, dtype=np.float64).ravel())
+
+    lamps = {'Hg': ['Hg'], 'Ar': ['Ar'], 'HgAr': ['Hg', 'Ar']}
+    if lines not in lamps:
+        raise ValueError(f"Unknown calibration lamp {lines}")
+    reference = []
+    for lamp in lamps[lines]:
+        wl_lines, I_lines = load_lamp_spectrum(lamp)
+        reference.append(wl_lines[I_lines >= line_threshold * I_lines.max()])
+    return np.sort(np.concatenate(reference))
+
+# scilightcon.fitting.detect_peaks() is not used here: it takes one spectrum at a time, loops over its points in Python
+# and returns index ranges where the signal exceeds a threshold, so close lines merge into one range and the
+# subpixel position of every line would still have to be found separately
+def _find_peaks(spectra: np.ndarray, threshold: float):
+    """Finds local maxima higher than `threshold` of the highest peak above the median of every spectrum and
+    refines their positions to subpixel precision. Returns (n_spectra, n_peaks) arrays of positions
+    and heights, padded with `nan`."""
+    baseline = np.median(spectra, axis=1, keepdims=True)
+    height = spectra - baseline
+    level = threshold * np.max(height, axis=1, keepdims=True)
+
+    is_peak = np.zeros(spectra.shape, dtype=bool)
+    is_peak[:, 1:-1] = (height[:, 1:-1] > height[:, :-2]) & (height[:, 1:-1] >= height[:, 2:]) & (height[:, 1:-1] > level)
+    rows, columns = np.nonzero(is_peak)
+
+    # a parabola through the logarithm of the three points is exact for Gaussian lines
+    tiny = np.finfo(np.float64).tiny
+    left, middle, right = [np.log(np.maximum(height[rows, columns + shift], tiny)) for shift in (-1, 0, 1)]
+    curvature = left - 2.0 * middle + right
+    with np.errstate(invalid='ignore', divide='ignore'):
+        offset = np.where(curvature < 0.0, 0.5 * (left - right) / curvature, 0.0)
+
+    # peaks of every spectrum are packed into consecutive slots of a padded array
+    counts = np.bincount(rows, minlength=spectra.shape[0])
+    slots = np.arange(rows.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    positions = np.full((spectra.shape[0], max(counts.max(initial=0), 1)), np.nan)
+    heights = np.zeros(positions.shape)
+    positions[rows, slots] = columns + np.clip(offset, -0.5, 0.5)
+    heights[rows, slots] = height[rows, columns]
+    return positions, heights
+
+def _interpolate_rows(values: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Linearly interpolates every row of `values` at fractional indices `positions` of the same row"""
+    index = np.clip(np.floor(np.nan_to_num(positions)).astype(np.intp), 0, values.shape[1] - 2)
+    fraction = positions - index
+    rows = np.arange(values.shape[0])[:, np.newaxis]
+    return values[rows, index] * (1.0 - fraction) + values[rows, index + 1] * fraction
+
+def _match_lines(wl: np.ndarray, reference: np.ndarray):
+    """Returns the nearest reference line of every wavelength and the distance to it"""
+    index = np.clip(np.searchsorted(reference, np.nan_to_num(wl)), 1, len(reference) - 1)
+    below, above = reference[index - 1], reference[index]
+    matched = np.where(np.abs(wl - below) <= np.abs(wl - above), below, above)
+    distance = np.abs(wl - matched)
+    return matched, np.where(np.isnan(distance), np.inf, distance)
+
+def _fit_with_rejection(x: np.ndarray, y: np.ndarray, weights: np.ndarray, accepted: np.ndarray, degree: int, n_sigma: float, max_iterations: int):
+    vander = np.nan_to_num(x)[..., np.newaxis] ** np.arange(degree, -1, -1)
+    y = np.nan_to_num(y)
+
+    for iteration in range(max_iterations + 1):
+        coefficients = _solve_weighted(vander, y, np.where(accepted, weights, 0.0))
+        residuals = np.abs(np.einsum('spk,sk->sp', vander, coefficients) - y)
+
+        with warnings.catch_warnings():
+            # spectra without any accepted match
+            warnings.simplefilter('ignore', RuntimeWarning)
+            sigma = _MAD_TO_SIGMA * np.nanmedian(np.where(accepted, residuals, np.nan), axis=1, keepdims=True)
+        sigma = np.maximum(sigma, _MIN_SIGMA)
+        # only the worst outlier of every spectrum is rejected, since it also biases the residuals of the others
+        normalized = np.where(accepted, residuals / sigma, 0.0)
+        worst = np.argmax(normalized, axis=1)
+        rows = np.flatnonzero((normalized[np.arange(len(worst)), worst] > n_sigma) & (np.sum(accepted, axis=1) > degree + 2))
+        if rows.size == 0 or iteration == max_iterations:
+            break
+        accepted[rows, worst[rows]] = False
+
+    return coefficients, accepted
+
+def _is_unique_match(y: np.ndarray, distance: np.ndarray, accepted: np.ndarray) -> np.ndarray:
+    """Keeps only the first accepted peak matched to each reference line of a spectrum"""
+    unique = np.zeros(accepted.shape, dtype=bool)
+    rows, columns = np.nonzero(accepted)
+    order = np.lexsort((distance[rows, columns], y[rows, columns], rows))
+    rows, columns = rows[order], columns[order]
+    first = np.ones(rows.size, dtype=bool)
+    first[1:] = (rows[1:] != rows[:-1]) | (y[rows[1:], columns[1:]] != y[rows[:-1], columns[:-1]])
+    unique[rows[first], columns[first]] = True
+    return unique
+
+def _solve_weighted(vander: np.ndarray, y: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Solves the weighted normal equations of every spectrum, `nan` coefficients where they are underdetermined"""
+    n_coefficients = vander.shape[-1]
+    normal = np.einsum('sp,spi,spj->sij', weights, vander, vander)
+    rhs = np.einsum('sp,spi,sp->si', weights, vander, y)
+    solvable = np.count_nonzero(weights, axis=1) >= n_coefficients
+    normal[~solvable] = np.eye(n_coefficients)
+    coefficients = np.linalg.solve(normal, rhs[..., np.newaxis])[..., 0]
+    coefficients[~solvable] = np.nan
+    return coefficients
+
+def _polyval_rows(coefficients: np.ndarray, x: np.ndarray) -> np.ndarray:
+    result = np.zeros(x.shape) + coefficients[:, :1]
+    for k in range(1, coefficients.shape[1]):
+        result = result * x + coefficients[:, k:k + 1]
+    return result
+
+def _get_denormalization(degree: int, center: float, scale: float) -> np.ndarray:
+    """Matrix mapping coefficients in (pixel - center) / scale to coefficients in pixels, both highest power first"""
+    matrix = np.zeros((degree + 1, degree + 1))
+    binomial = [1]
+    for power in range(degree + 1):
+        # ((p - center) / scale)^power expanded in powers of p, binomial is the row `power` of Pascal's triangle
+        for k in range(power + 1):
+            matrix[degree - k, degree - power] = binomial[k] * (-center) ** (power - k) / scale**power
+        binomial = [1] + [a + b for a, b in zip(binomial[:-1], binomial[1:])] + [1]
+    return matrix
@@ -1,13 +1,27 @@
 """Module for calculating optical parameters"""
 
-from ._materials import load_material, Material
+from ._materials import load_material, list_materials, find_materials, evaluate_catalog, Material
+from ._tables import DispersionTable
+from ._phase_matching import PhaseMatching
+from ._nonlinear import get_peak_intensity, get_B_integral
+from ._stack import OpticalStack
+from ._propagation import PulsePropagator
 from ._spectra import get_Hg_spectrum
 from ._spectra import get_Ar_spectrum
 from ._spectra import get_White_LED_spectrum
 
 __all__ = [
     "load_material",
+    "list_materials",
+    "find_materials",
+    "evaluate_catalog",
     "Material",
+    "DispersionTable",
+    "PhaseMatching",
+    "get_peak_intensity",
+    "get_B_integral",
+    "OpticalStack",
+    "PulsePropagator",
     "get_Hg_spectrum",
     "get_Ar_spectrum",
     "get_White_LED_spectrum"
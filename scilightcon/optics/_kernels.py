@@ -0,0 +1,218 @@
+"""Dispersion kernels of the material formulas
+
+Every formula of the material database is registered as a kernel keyed by its formula index. A kernel
+is bound to the coefficients of a material once, which pads the coefficients and drops the terms with
+zero amplitude, and then evaluates the refractive index together with its derivatives of any order with
+respect to the wavelength. Formulas are written once in terms of the truncated Taylor series arithmetic
+of `_taylor`. Tabulated refractive index data (formula 0) are bound to a shape-preserving
+cubic interpolant instead.
+"""
+import math
+from typing import Callable, Dict, List
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+from ._taylor import Series, _constant, _power, _add, _scale, _shift, _mul, _inv, _sqrt, _to_derivatives
+
+N_COEFFS = 17
+
+_KERNELS: Dict[int, "_KernelDefinition"] = {}
+
+class _KernelDefinition:
+    def __init__(self, evaluate: Callable, active_terms: Callable):
+        self.evaluate = evaluate
+        self.active_terms = active_terms
+
+def _register_kernel(formula: int, terms: range):
+    """Registers a dispersion formula. `terms` are coefficient indices of term amplitudes,
+    a term is evaluated only if its amplitude is not zero."""
+    def active_terms(C):
+        return [k for k in terms if np.any(C[k] != 0)]
+
+    def decorator(evaluate):
+        _KERNELS[formula] = _KernelDefinition(evaluate, active_terms)
+        return evaluate
+    return decorator
+
+class _BoundKernel:
+    """Dispersion formula bound to a set of coefficients"""
+
+    def __init__(self, formula: int, coeffs: List[float]):
+        if formula not in _KERNELS:
+            raise ValueError(f"Formula {formula} is not supported")
+
+        C = np.zeros(N_COEFFS)
+        C[:len(coeffs)] = coeffs
+        self.formula = formula
+        self.C = C
+        self.terms = _KERNELS[formula].active_terms(C)
+        self._evaluate = _KERNELS[formula].evaluate
+        self._scalar_C = C.tolist()
+
+    def evaluate(self, wl: np.ndarray, order: int = 0) -> List[np.ndarray]:
+        """Returns `[n, dn/dwl, ..., d^order n/dwl^order]` at wavelengths `wl` (in micrometers)"""
+        return _to_derivatives(self.evaluate_series(wl, order))
+
+    def evaluate_series(self, wl: np.ndarray, order: int = 0) -> Series:
+        """Returns Taylor coefficients of the refractive index up to `order` around wavelengths `wl` (in micrometers)"""
+        return _KERNELS[self.formula].evaluate(self.C, self.terms, _Powers(wl, order))
+
+    def evaluate_scalar(self, wl: float) -> float:
+        """Returns the refractive index at a single wavelength `wl` (in micrometers), evaluated with Python floats"""
+        return self._evaluate(self._scalar_C, self.terms, _Powers(wl, 0))[0]
+
+def _stack_kernels(kernels: List[_BoundKernel]) -> _BoundKernel:
+    """Stacks kernels of the same formula and terms into one kernel evaluating to arrays of shape (len(kernels), *wl.shape)"""
+    stacked = _BoundKernel.__new__(_BoundKernel)
+    stacked.formula = kernels[0].formula
+    stacked.C = np.stack([kernel.C for kernel in kernels], axis=1)[:, :, np.newaxis]
+    stacked.terms = kernels[0].terms
+    return stacked
+
+class _TabulatedKernel:
+    """Shape-preserving (PCHIP) cubic interpolant of tabulated refractive index data, built once per material axis.
+    Unlike a cubic spline it does not overshoot between sparse or unevenly spaced data points."""
+
+    formula = 0
+
+    def __init__(self, wl_data: List[float], n_data: List[float]):
+        self.interpolant = PchipInterpolator(np.asarray(wl_data, dtype=np.float64), np.asarray(n_data, dtype=np.float64))
+
+    def evaluate(self, wl: np.ndarray, order: int = 0) -> List[np.ndarray]:
+        """Returns `[n, dn/dwl, ..., d^order n/dwl^order]` at wavelengths `wl` (in micrometers)"""
+        return _to_derivatives(self.evaluate_series(wl, order))
+
+    def evaluate_series(self, wl: np.ndarray, order: int = 0) -> Series:
+        """Returns Taylor coefficients of the refractive index up to `order` around wavelengths `wl` (in micrometers)"""
+        series = [self.interpolant(wl, nu) / math.factorial(nu) for nu in range(min(order, 3) + 1)]
+        return series + [np.zeros_like(series[0])] * (order + 1 - len(series))
+
+    def evaluate_scalar(self, wl: float) -> float:
+        """Returns the refractive index at a single wavelength `wl` (in micrometers)"""
+        return float(self.interpolant(wl))
+
+class _Powers:
+    """Taylor series of the powers of the wavelength, computed once per evaluation"""
+
+    def __init__(self, wl: np.ndarray, order: int):
+        self.wl = wl
+        self.order = order
+        self._cache = {}
+
+    def __call__(self, p: float) -> Series:
+        if isinstance(p, np.ndarray):
+            return _power(self.wl, p, self.order)
+        if p not in self._cache:
+            self._cache[p] = _power(self.wl, p, self.order)
+        return self._cache[p]
+
+    def constant(self, value) -> Series:
+        return _constant(value, self.wl, self.order)
+
+def _pole(x: _Powers, p: float, b: float) -> Series:
+    """Series of 1 / (wl^p - b)"""
+    return _inv(_shift(x(p), -b))
+
+@_register_kernel(1, range(1, 17, 2))
+def _formula_1(C, terms, x):
+    # n^2 = 1 + C0 + sum C[k] wl^2 / (wl^2 - C[k+1]^2)
+    eps = x.constant(1 + C[0] + sum(C[k] for k in terms))
+    for k in terms:
+        eps = _add(eps, _scale(_pole(x, 2, C[k + 1] ** 2), C[k] * C[k + 1] ** 2))
+    return _sqrt(eps)
+
+@_register_kernel(2, range(1, 17, 2))
+def _formula_2(C, terms, x):
+    # n^2 = 1 + C0 + sum C[k] wl^2 / (wl^2 - C[k+1])
+    eps = x.constant(1 + C[0] + sum(C[k] for k in terms))
+    for k in terms:
+        eps = _add(eps, _scale(_pole(x, 2, C[k + 1]), C[k] * C[k + 1]))
+    return _sqrt(eps)
+
+@_register_kernel(3, range(1, 17, 2))
+def _formula_3(C, terms, x):
+    # n^2 = C0 + sum C[k] wl^C[k+1]
+    eps = x.constant(C[0])
+    for k in terms:
+        eps = _add(eps, _scale(x(C[k + 1]), C[k]))
+    return _sqrt(eps)
+
+@_register_kernel(4, (1, 5, 9, 11, 13, 15))
+def _formula_4(C, terms, x):
+    # n^2 = C0 + sum_{k=1,5} C[k] wl^C[k+1] / (wl^2 - C[k+2]^C[k+3]) + sum_{k=9..15} C[k] wl^C[k+1]
+    eps = x.constant(C[0])
+    for k in terms:
+        if k < 9:
+            eps = _add(eps, _scale(_mul(x(C[k + 1]), _pole(x, 2, C[k + 2] ** C[k + 3])), C[k]))
+        else:
+            eps = _add(eps, _scale(x(C[k + 1]), C[k]))
+    return _sqrt(eps)
+
+@_register_kernel(5, range(1, 11, 2))
+def _formula_5(C, terms, x):
+    # n = C0 + sum C[k] wl^C[k+1]
+    n = x.constant(C[0])
+    for k in terms:
+        n = _add(n, _scale(x(C[k + 1]), C[k]))
+    return n
+
+@_register_kernel(6, range(1, 11, 2))
+def _formula_6(C, terms, x):
+    # n = 1 + C0 + sum C[k] / (C[k+1] - wl^-2)
+    n = x.constant(1 + C[0])
+    for k in terms:
+        n = _add(n, _scale(_pole(x, -2, C[k + 1]), -C[k]))
+    return n
+
+@_register_kernel(7, range(1, 6))
+def _formula_7(C, terms, x):
+    # n = C0 + C1 / (wl^2 - 0.028) + C2 / (wl^2 - 0.028)^2 + C3 wl^2 + C4 wl^4 + C5 wl^6
+    n = x.constant(C[0])
+    pole = _pole(x, 2, 0.028)
+    for k in terms:
+        if k == 1:
+            n = _add(n, _scale(pole, C[1]))
+        elif k == 2:
+            n = _add(n, _scale(_mul(pole, pole), C[2]))
+        else:
+            n = _add(n, _scale(x(2 * (k - 2)), C[k]))
+    return n
+
+@_register_kernel(8, (1, 3))
+def _formula_8(C, terms, x):
+    # t = C0 + C1 wl^2 / (wl^2 - C2) + C3 wl^2, n^2 = (2 t + 1) / (1 - t)
+    t = x.constant(C[0])
+    for k in terms:
+        if k == 1:
+            t = _add(_shift(t, C[1]), _scale(_pole(x, 2, C[2]), C[1] * C[2]))
+        else:
+            t = _add(t, _scale(x(2), C[3]))
+    return _sqrt(_mul(_shift(_scale(t, 2), 1), _inv(_shift(_scale(t, -1), 1))))
+
+@_register_kernel(9, (1, 3))
+def _formula_9(C, terms, x):
+    # n^2 = C0 + C1 / (wl^2 - C2) + C3 (wl - C4) / ((wl - C4)^2 + C5)
+    eps = x.constant(C[0])
+    for k in terms:
+        if k == 1:
+            eps = _add(eps, _scale(_pole(x, 2, C[2]), C[1]))
+        else:
+            shifted = _shift(x(1), -C[4])
+            eps = _add(eps, _scale(_mul(shifted, _inv(_shift(_mul(shifted, shifted), C[5]))), C[3]))
+    return _sqrt(eps)
+
+@_register_kernel(10, range(1, 11, 2))
+def _formula_10(C, terms, x):
+    # n^2 = C0 + C1 / (wl^2 - C2) + C3 wl^2 / (C4 wl^2 - 1) + C5 / (wl^4 - C6) + C7 wl^2 / (C8 wl^4 - 1) + C9 wl^4 / (C10 wl^4 - 1)
+    eps = x.constant(C[0])
+    for k in terms:
+        if k == 1:
+            eps = _add(eps, _scale(_pole(x, 2, C[2]), C[1]))
+        elif k == 3:
+            eps = _add(eps, _scale(_mul(x(2), _inv(_shift(_scale(x(2), C[4]), -1))), C[3]))
+        elif k == 5:
+            eps = _add(eps, _scale(_pole(x, 4, C[6]), C[5]))
+        elif k == 7:
+            eps = _add(eps, _scale(_mul(x(2), _inv(_shift(_scale(x(4), C[8]), -1))), C[7]))
+        else:
+            eps = _add(eps, _scale(_mul(x(4), _inv(_shift(_scale(x(4), C[10]), -1))), C[9]))
+    return _sqrt(eps)
@@ -1,12 +1,12 @@
-from typing import List
 import numpy as np
-from typing import List, Tuple
-from scipy.interpolate import interp1d
+from typing import List, Tuple, Union, Callable, Sequence
+from functools import lru_cache
+from scipy.interpolate import PchipInterpolator
 from scilightcon.utils import c
 import math
-from ._utils import _get_refractive_index_from_raw_data
-from ._GVD_and_TOD_calculator import _get_refractive_index_second_derivative
-from ._GVD_and_TOD_calculator import _get_refractive_index_third_derivative
+from ._kernels import _BoundKernel, _TabulatedKernel, _stack_kernels
+from ._taylor import _compose, _to_derivatives
+from ._tables import DispersionTable, _build_table
 
 class Material:
     """Class for storing and calculating optical properties (refractive index, GVD, TOD) of different materials.
@@ -31,8 +31,13 @@ class Material:
     _info = {}
     def __init__ (self, info):
         self._info = info
+        self._parameters = _get_axis_parameters(info)
+        self._kernels = [_bind_kernel(parameter, parameter_index) for parameter_index, parameter in enumerate(self._parameters)]
+        self._wl_ranges = [(float(parameter["WlNRange"][0]), float(parameter["WlNRange"][1])) for parameter in self._parameters]
+        self._extinction = [_get_extinction_interpolant(parameter) for parameter in self._parameters]
+        self._thermo_optic = [_get_thermo_optic_coefficients(parameter, parameter_index) for parameter_index, parameter in enumerate(self._parameters)]
 
-    def get_GVD (self, wl: float, ray = 'o') -> List[float]:
+    def get_GVD (self, wl: Union[float, np.ndarray], ray = 'o') -> np.ndarray:
         """  
         The function computes and returns the group velocity dispersion (GVD) for a specific material, considering the chosen wavelength and a type of ray.
         Examples:
@@ -43,40 +48,16 @@ class Material:
             array([283.0382719])
         
         Args:
-            wl (float): Wavelength in micrometers   
-            ray (str): `o` for ordinary, `e` for extraordinary
+            wl (float or ndarray): Wavelength in micrometers, a scalar or an array of any shape
+            ray (str): `o` for ordinary, `e` for extraordinary, `z` for the third principal axis of biaxial crystals
 
         Returns:
-            An array of material's GVD       
+            An array of material's GVD in fs^2/mm, of shape (1,) for a scalar `wl` and of the shape of `wl` otherwise
         """
-        
-        indices_dict = {'o': [0], 'e': [1]}
-        indices = indices_dict[ray]
+        gvd, = self._get_dispersion(wl, (2,), ray, "GVD")
+        return np.array([gvd]) if np.ndim(gvd) == 0 else gvd
 
-        for parameter_index in indices:
-            formula_index = self._info["Parameters"][parameter_index]["Formula"]
-            if formula_index == 0:
-                raise ValueError(f"GVD can not be calculated for material with formula index = 0")
-            if len(indices) == 1 and parameter_index >= len(self._info["Parameters"]):
-                raise ValueError(f"GVD index can not be calculated for {'ordinary' if 0 == parameter_index else 'extraordinary'} type of ray ")
-            wl_range = self._info["Parameters"][parameter_index]["WlNRange"]
-            if wl<wl_range[0] or wl>wl_range[1]:
-                raise ValueError(f"For {'ordinary' if 0 == parameter_index else 'extraordinary'} type of ray " +
-                                 f"the wavelenght should be in range between {wl_range[0]} and {wl_range[1]}")
-            
-            wl_t = self._info["Parameters"][parameter_index]["WlNRange"][1]
-            data_n_wl = self._info["Parameters"][parameter_index]["DataNWl"]
-            data_n =self._info["Parameters"][parameter_index]["DataN"]
-            sellmeier_coeffs = self._info["Parameters"][parameter_index]["SellmeierCoeffs"]
-            XC = self._info["Parameters"][parameter_index]["XC"]
-            YC = self._info["Parameters"][parameter_index]["YC"]
-            
-        second_derivative =np.array(_get_refractive_index_second_derivative(wl, wl_t, formula_index, parameter_index, sellmeier_coeffs, data_n_wl, data_n, XC, YC))
-        
-        gvd = second_derivative * (wl**3 / (2.0 * math.pi * c * c))*10**-3
-        return gvd
-
-    def get_TOD (self, wl: float, ray = 'o') -> List[float]:
+    def get_TOD (self, wl: Union[float, np.ndarray], ray = 'o') -> np.ndarray:
         """  
         The function computes and returns the third-order dispersion (TOD) for a specific material, considering the chosen wavelength and a type of ray.
         
@@ -86,43 +67,126 @@ class Material:
             >>> tod = zinc_oxide.get_TOD(1.03, ray='o')
         
         Args:
-            wl (float): Wavelength in micrometers   
-            ray (str): `o` for ordinary, `e` for extraordinary  
+            wl (float or ndarray): Wavelength in micrometers, a scalar or an array of any shape
+            ray (str): `o` for ordinary, `e` for extraordinary, `z` for the third principal axis of biaxial crystals
         
         Returns:
-            An array of material's TOD       
+            An array of material's TOD in fs^3/mm, of shape (1,) for a scalar `wl` and of the shape of `wl` otherwise
         """
-        indices_dict = {'o': [0], 'e': [1]}
-        indices = indices_dict[ray]
+        tod, = self._get_dispersion(wl, (3,), ray, "TOD")
+        return np.array([tod]) if np.ndim(tod) == 0 else tod
 
-        for parameter_index in indices:
-            formula_index = self._info["Parameters"][parameter_index]["Formula"]
-            if formula_index == 0:
-                raise ValueError(f"TOD can not be calculated for material with formula index = 0")
-            if len(indices) == 1 and parameter_index >= len(self._info["Parameters"]):
-                raise ValueError(f"TOD index can not be calculated for {'ordinary' if 0 == parameter_index else 'extraordinary'} type of ray ")
-            wl_range = self._info["Parameters"][parameter_index]["WlNRange"]
-            if wl<wl_range[0] or wl>wl_range[1]:
-                raise ValueError(f"For {'ordinary' if 0 == parameter_index else 'extraordinary'} type of ray " +
-                                 f"the wavelenght should be in range between {wl_range[0]} and {wl_range[1]}")
-            
-            wl_b = self._info["Parameters"][parameter_index]["WlNRange"][0]
-            wl_t = self._info["Parameters"][parameter_index]["WlNRange"][1]
-            data_n_wl = self._info["Parameters"][parameter_index]["DataNWl"]
-            data_n =self._info["Parameters"][parameter_index]["DataN"]
-            sellmeier_coeffs = self._info["Parameters"][parameter_index]["SellmeierCoeffs"]
-            XC = self._info["Parameters"][parameter_index]["XC"]
-            YC = self._info["Parameters"][parameter_index]["YC"]
-            
-        third_derivative =np.array(_get_refractive_index_third_derivative(wl, wl_b, wl_t, formula_index, parameter_index, sellmeier_coeffs, data_n_wl, data_n, XC, YC))
-        second_derivative =np.array(_get_refractive_index_second_derivative(wl, wl_t, formula_index, parameter_index, sellmeier_coeffs, data_n_wl, data_n, XC, YC))
-        
-        tod = (-wl**4 / (4 * math.pi * math.pi * c * c * c)) * (3* second_derivative + wl* third_derivative) * 1.0e-6 
-        return tod
+    def get_dispersion (self, wl: Union[float, np.ndarray], orders: Tuple[int, ...] = (0, 1, 2, 3), ray = 'o', temperature: Union[None, float, np.ndarray] = None) -> List[np.ndarray]:
+        """
+        The function computes the refractive index, group delay (GD), group velocity dispersion (GVD) and third-order dispersion (TOD)
+        of a material in a single evaluation of the dispersion formula.
+
+        Examples:
+            >>> from scilightcon.optics import load_material
+            >>> zinc_oxide = load_material('Zinc oxide')
+            >>> n, gd, gvd, tod = zinc_oxide.get_dispersion(1.03, ray='o')
+            >>> round(float(gvd), 4)
+            283.0383
+            >>> gvd, tod = zinc_oxide.get_dispersion(np.linspace(1.0, 2.0, 100), orders=(2, 3))
+            >>> tod.shape
+            (100,)
+            >>> fod, = zinc_oxide.get_dispersion(1.03, orders=(4,))
+            >>> round(float(fod), 2)
+            166.31
+            >>> lbo = load_material('LiB3O5')
+            >>> n, gd = lbo.get_dispersion(np.linspace(0.8, 1.2, 5)[:, np.newaxis], orders=(0, 1), temperature=np.array([25.0, 50.0, 75.0]))
+            >>> n.shape
+            (5, 3)
+
+        Args:
+            wl (float or ndarray): Wavelength in micrometers, a scalar or an array of any shape
+            orders (tuple): Requested quantities, 0 - refractive index, 1 - GD in fs/mm, 2 - GVD in fs^2/mm, 3 - TOD in fs^3/mm,
+                any higher order m - m-th order dispersion in fs^m/mm (e.g. 4 - FOD)
+            ray (str): `o` for ordinary, `e` for extraordinary, `z` for the third principal axis of biaxial crystals
+            temperature (float or ndarray): Temperature in degrees Celsius, broadcast against `wl`. If `None`, the data at
+                the reference temperature of the material are used. Wavelengths outside of the range of the thermo-optic data
+                (`TTunningMargins`) and temperatures below absolute zero raise ValueError
+
+        Returns:
+            A list of requested quantities in the order of `orders`, each of the broadcast shape of `wl` and `temperature`
+        """
+        return self._get_dispersion(wl, orders, ray, "Dispersion", temperature)
+
+    def tabulate (self, wl_min: float, wl_max: float, tol: float = 1e-10, ray = 'o', orders: Tuple[int, ...] = (0, 1, 2, 3)) -> DispersionTable:
+        """
+        The function builds a piecewise polynomial approximation of the dispersion quantities over a wavelength range.
+        The returned table is fast to evaluate repeatedly and can be pickled to share it between processes.
 
-    def get_refractive_index (self, wl: float, ray = 'both') -> List[float]:
+        Examples:
+            >>> from scilightcon.optics import load_material
+            >>> zinc_oxide = load_material('Zinc oxide')
+            >>> table = zinc_oxide.tabulate(1.0, 2.0, orders=(0, 2))
+            >>> n, gvd = table.evaluate(np.linspace(1.0, 2.0, 1000))
+            >>> n.shape
+            (1000,)
+
+        Args:
+            wl_min (float): Lower limit of the wavelength range in micrometers
+            wl_max (float): Upper limit of the wavelength range in micrometers
+            tol (float): Maximum approximation error of each quantity relative to its largest magnitude over the range
+            ray (str): `o` for ordinary, `e` for extraordinary, `z` for the third principal axis of biaxial crystals
+            orders (tuple): Tabulated quantities, as in `get_dispersion()`. Materials given by tabulated refractive index data
+                are already interpolated piecewise, with derivatives that jump at the data points, and are not tabulated
+
+        Returns:
+            DispersionTable of the requested quantities
+        """
+        parameter_index = {'o': 0, 'e': 1, 'z': 2}[ray]
+        if parameter_index < len(self._kernels) and isinstance(self._kernels[parameter_index], _TabulatedKernel):
+            raise ValueError(f"{self._info['Name']} is given by tabulated data, which can not be tabulated to a tolerance, use get_dispersion() instead")
+
+        coefficients = _build_table(lambda wl: self.get_dispersion(wl, orders=orders, ray=ray), len(orders), wl_min, wl_max, tol)
+        return DispersionTable(wl_min, wl_max, orders, coefficients)
+
+    def _get_dispersion (self, wl: Union[float, np.ndarray], orders: Tuple[int, ...], ray: str, quantity: str, temperature: Union[None, float, np.ndarray] = None) -> List[np.ndarray]:
+        # a float wavelength is evaluated with Python floats, without 0-d array arithmetic
+        scalar = temperature is None and type(wl) in (float, int)
+        wl = float(wl) if scalar else np.asarray(wl, dtype=np.float64)
+        indices_dict = {'o': 0, 'e': 1, 'z': 2}
+        series = self._get_series(wl, indices_dict[ray], max(orders), quantity)
+        if temperature is not None:
+            series[0] = series[0] + self._get_temperature_correction(indices_dict[ray], wl, temperature)
+        if max(orders) > 0:
+            beta = _get_propagation_constant_derivatives(wl, series)
+        values = [series[0] if order == 0 else beta[order] for order in orders]
+        if scalar:
+            return [np.float64(value) for value in values]
+        shape = np.broadcast(series[0], wl).shape
+        return [value if np.shape(value) == shape else np.broadcast_to(value, shape).copy() for value in values]
+
+    def _get_temperature_correction (self, parameter_index: int, wl: Union[float, np.ndarray], temperature: Union[float, np.ndarray]) -> np.ndarray:
+        """Returns the change of the refractive index from the reference temperature of the material"""
+        if self._thermo_optic[parameter_index] is None:
+            raise ValueError(f"Temperature dependence of the refractive index is not available for {self._info['Name']}")
+        dn_dT, reference_temperature, wl_range = self._thermo_optic[parameter_index]
+        temperature = np.asarray(temperature, dtype=np.float64)
+        if not np.all(temperature >= _ABSOLUTE_ZERO):
+            raise ValueError(f"The temperature should be a number above {_ABSOLUTE_ZERO} degrees Celsius")
+        if np.any((np.asarray(wl) < wl_range[0]) | (np.asarray(wl) > wl_range[1])):
+            raise ValueError(f"Temperature dependence of the refractive index of {self._info['Name']} is only available " +
+                             f"for wavelengths between {wl_range[0]} and {wl_range[1]}")
+        return dn_dT * (temperature - reference_temperature)
+
+    def _get_series (self, wl: np.ndarray, parameter_index: int, order: int, quantity: str) -> List[np.ndarray]:
+        """Returns Taylor coefficients of the refractive index up to `order` around wavelengths `wl`"""
+        if parameter_index >= len(self._parameters):
+            raise ValueError(f"{quantity} can not be calculated for {_RAY_NAMES[parameter_index]} type of ray ")
+
+        wl_min, wl_max = self._wl_ranges[parameter_index]
+        if type(wl) is not float or wl < wl_min or wl > wl_max:
+            _check_wavelength_range(wl, self._parameters[parameter_index]["WlNRange"], parameter_index)
+
+        return self._kernels[parameter_index].evaluate_series(wl, order)
+
+    def get_refractive_index (self, wl: Union[float, np.ndarray], ray = 'both', temperature: Union[None, float, np.ndarray] = None) -> List[Union[float, np.ndarray]]:
        """  
         The function computes and returns the refractive index of a specific material, considering the chosen wavelength and the type of ray.
+        The wavelength can be a scalar or an array of any shape, in which case the whole array is evaluated at once.
     
         Examples:
             >>> from scilightcon.optics import load_material
@@ -132,78 +196,456 @@ class Material:
             1.9417466542383048
             >>> n_e
             1.9565995766753679
+            >>> n_o, n_e = zinc_oxide.get_refractive_index(np.linspace(1.0, 2.0, 1000))
+            >>> n_o.shape
+            (1000,)
 
                
         Args:
-            wl (float): Wavelength in micrometers   
-            ray (str): `o` for ordinary, `e` for extraordinary, `both` for both ordinary and extraordinary rays respectively
+            wl (float or ndarray): Wavelength in micrometers, a scalar or an array of any shape
+            ray (str): `o` for ordinary, `e` for extraordinary, `z` for the third principal axis of biaxial crystals, `both` for both ordinary and extraordinary rays respectively
+            temperature (float or ndarray): Temperature in degrees Celsius, broadcast against `wl`. If `None`, the data at
+                the reference temperature of the material are used. Wavelengths outside of the range of the thermo-optic data
+                (`TTunningMargins`) and temperatures below absolute zero raise ValueError
 
         Returns:
-            An array of material's refractive index or indexes if calculated for both types of rays       
+            A list of material's refractive index or indexes if calculated for both types of rays. For an array `wl` each entry is an array of the same shape as `wl`
+            (broadcast with `temperature`, if given)
        """
-       indices_dict = {'o': [0], 'e': [1], 'both': [0,1]}
+       if temperature is None and type(wl) in (float, int):
+           return self._get_scalar_refractive_index(float(wl), ray)
+
+       wl = np.asarray(wl, dtype=np.float64)
+       indices_dict = {'o': [0], 'e': [1], 'z': [2], 'both': [0,1]}
        indices = indices_dict[ray]
        refractive_index_list = []
        for parameter_index in indices:
 
-            if len(indices) == 1 and parameter_index >= len(self._info["Parameters"]):
-                raise ValueError(f"Refractive index can not be calculated for {'ordinary' if 0 == parameter_index else 'extraordinary'} type of ray ")
+            if len(indices) == 1 and parameter_index >= len(self._parameters):
+                raise ValueError(f"Refractive index can not be calculated for {_RAY_NAMES[parameter_index]} type of ray ")
                                    
-            if parameter_index >= len(self._info["Parameters"]):
+            if parameter_index >= len(self._parameters):
                  refractive_index_list.append(None)
                  continue
             
-            formula = self._info["Parameters"][parameter_index]["Formula"]
-            wl_range = self._info["Parameters"][parameter_index]["WlNRange"]
-            if wl<wl_range[0] or wl>wl_range[1]:
-                raise ValueError(f"For {'ordinary' if 0 == parameter_index else 'extraordinary'} type of ray " +
-                                 f"the wavelenght should be in range between {wl_range[0]} and {wl_range[1]}")
+            wl_range = self._parameters[parameter_index]["WlNRange"]
+            _check_wavelength_range(wl, wl_range, parameter_index)
                 
-            if formula == 0:
-                n = _get_refractive_index_from_raw_data(
-                    wl,
-                    self._info["Parameters"][parameter_index]["DataNWl"], 
-                    self._info["Parameters"][parameter_index]["DataN"])
-                refractive_index_list.append(n)
-            else:           
-                if formula > 0 and formula < 10: 
-                    sellmeier_coeffs = self._info["Parameters"][parameter_index]["SellmeierCoeffs"]
-                elif formula == 10:
-                    if parameter_index ==0: 
-                        sellmeier_coeffs = self._info["Parameters"][parameter_index]["XC"]
-                    else: 
-                        sellmeier_coeffs = self._info["Parameters"][parameter_index]["YC"]
-
-                refractive_index_list.append(_get_refractive_index_from_sellmeier_coeffs(wl, formula, sellmeier_coeffs))
+            n = self._kernels[parameter_index].evaluate(wl)[0]
+            if temperature is not None:
+                n = n + self._get_temperature_correction(parameter_index, wl, temperature)
+            refractive_index_list.append(n)
             
        return refractive_index_list
 
-def _get_refractive_index_from_sellmeier_coeffs(wl: float, formula_index: int, sellmeier_coeffs: List[float]) -> float:
-    n_coeffs = len(sellmeier_coeffs)
-    if n_coeffs ==0: return ([None]*len(wl))
-    C = np.append(sellmeier_coeffs, [0]*(17-len(sellmeier_coeffs)))
-    
-    if formula_index==1:
-        return np.sqrt(1+C[0]+C[1]/(1-(C[2]/wl)**2)+C[3]/(1-(C[4]/wl)**2)+C[5]/(1-(C[6]/wl)**2)+C[7]/(1-(C[8]/wl)**2)+C[9]/(1-(C[10]/wl)**2)+C[11]/(1-(C[12]/wl)**2)+C[13]/(1-(C[14]/wl)**2)+C[15]/(1-(C[16]/wl)**2))
-    if formula_index==2:
-        return np.sqrt(1+C[0]+C[1]/(1-C[2]/(wl)**2)+C[3]/(1-C[4]/(wl)**2)+C[5]/(1-C[6]/(wl)**2)+C[7]/(1-C[8]/(wl)**2)+C[9]/(1-C[10]/(wl)**2)+C[11]/(1-C[12]/(wl)**2)+C[13]/(1-C[14]/(wl)**2)+C[15]/(1-C[16]/(wl)**2))
-    if formula_index==3:
-        return np.sqrt(C[0]+C[1]*(wl)**C[2]+C[3]*(wl)**C[4]+C[5]*(wl)**C[6]+C[7]*(wl)**C[8]+C[9]*(wl)**C[10]+C[11]*(wl)**C[12]+C[13]*(wl)**C[14]+C[15]*(wl)**C[16])
-    if formula_index==4:
-        return np.sqrt(C[0]+C[1]*(wl)**C[2]/((wl)**2-(C[3])**C[4])+C[5]*(wl)**C[6]/((wl)**2-(C[7])**C[8])+C[9]*(wl)**C[10]+C[11]*(wl)**C[12]+C[13]*(wl)**C[14]+C[15]*(wl)**C[16])
-    if formula_index==5:
-        return C[0]+C[1]*(wl)**C[2]+C[3]*(wl)**C[4]+C[5]*(wl)**C[6]+C[7]*(wl)**C[8]+C[9]*(wl)**C[10]
-    if formula_index==6:
-        return 1+C[0]+C[1]/(C[2]-(wl)**-2)+C[3]/(C[4]-(wl)**-2)+C[5]/(C[6]-(wl)**-2)+C[7]/(C[8]-(wl)**-2)+C[9]/(C[10]-(wl)**-2)
-    if formula_index==7:
-        return C[0]+C[1]/((wl)**2-0.028)+C[2]/(wl**2-0.028)**2+C[3]*(wl)**2+C[4]*(wl)**4+C[5]*(wl)**6
-    if formula_index==8:
-        tmp = C[0]+C[1]*(wl)**2/((wl)**2-C[2])+C[3]*(wl)**2
-        return np.sqrt((2*tmp+1)/(1-tmp))
-    if formula_index==9:
-        return np.sqrt(C[0]+C[1]/((wl)**2-C[2])+C[3]*(wl-C[4])/((wl-C[4])**2+C[5])) 
-    if formula_index==10:
-        return np.sqrt( C[0] + C[1] / ((wl ** 2) - C[2]) + (C[3] * (wl ** 2)) / ((wl ** 2) * C[4] - 1) + C[5] / ((wl ** 4) - C[6]) + (C[7] * (wl ** 2)) / (C[8] * (wl ** 4) - 1) + (C[9] * (wl ** 4)) / (C[10] * (wl ** 4) - 1)); 
+    def _get_scalar_refractive_index (self, wl: float, ray: str) -> List[Union[None, float]]:
+        """Same as `get_refractive_index()` for a Python float wavelength, without array conversions"""
+        indices = _RAY_INDICES[ray]
+        refractive_index_list = []
+        for parameter_index in indices:
+            if parameter_index >= len(self._parameters):
+                if len(indices) == 1:
+                    raise ValueError(f"Refractive index can not be calculated for {_RAY_NAMES[parameter_index]} type of ray ")
+                refractive_index_list.append(None)
+                continue
+
+            wl_min, wl_max = self._wl_ranges[parameter_index]
+            if wl < wl_min or wl > wl_max:
+                _check_wavelength_range(wl, self._parameters[parameter_index]["WlNRange"], parameter_index)
+            refractive_index_list.append(np.float64(self._kernels[parameter_index].evaluate_scalar(wl)))
+        return refractive_index_list
+
+    def get_principal_indices (self, wl: Union[float, np.ndarray], temperature: Union[None, float, np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The function computes the refractive indices along the three principal axes of the index ellipsoid,
+        (n_o, n_o, n_e) for uniaxial crystals and (n, n, n) for isotropic materials.
+
+        Examples:
+            >>> from scilightcon.optics import load_material
+            >>> lbo = load_material('LiB3O5')
+            >>> n_x, n_y, n_z = lbo.get_principal_indices(1.064)
+            >>> bool(n_x < n_y < n_z)
+            True
+
+        Args:
+            wl (float or ndarray): Wavelength in micrometers, a scalar or an array of any shape
+            temperature (float or ndarray): Temperature in degrees Celsius, as in `get_refractive_index()`
+
+        Returns:
+            A tuple of refractive indices (n_x, n_y, n_z)
+        """
+        return tuple(series[0] for series in self._get_principal_series(wl, 0, temperature))
+
+    def _get_principal_series (self, wl: Union[float, np.ndarray], order: int, temperature: Union[None, float, np.ndarray] = None) -> List[List[np.ndarray]]:
+        """Returns Taylor coefficients of the refractive index up to `order` along the x, y and z principal axes"""
+        wl = np.asarray(wl, dtype=np.float64)
+        axes = []
+        for parameter_index in range(len(self._parameters)):
+            series = self._get_series(wl, parameter_index, order, "Refractive index")
+            if temperature is not None:
+                series[0] = series[0] + self._get_temperature_correction(parameter_index, wl, temperature)
+            axes.append(series)
+        if len(axes) == 1:
+            return [axes[0], axes[0], axes[0]]
+        if len(axes) == 2:
+            return [axes[0], axes[0], axes[1]]
+        return axes
+
+    def get_effective_index (self, wl: Union[float, np.ndarray], theta: Union[float, np.ndarray], phi: Union[float, np.ndarray] = 0.0,
+                             temperature: Union[None, float, np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The function computes refractive indices of the two eigen-polarizations propagating along the direction given by
+        polar angle `theta` (measured from the z axis) and azimuthal angle `phi` (measured from the x axis in the xy plane),
+        as solutions of the Fresnel equation of wave normals. All arguments are broadcast against each other.
+
+        Examples:
+            >>> from scilightcon.optics import load_material
+            >>> bbo = load_material('BBO')
+            >>> n_slow, n_fast = bbo.get_effective_index(1.03, np.radians(23.4))
+            >>> n_o, = bbo.get_refractive_index(1.03, ray='o')
+            >>> bool(np.isclose(n_slow, n_o))
+            True
+            >>> lbo = load_material('LiB3O5')
+            >>> n_1, n_2 = lbo.get_effective_index(np.linspace(0.8, 1.2, 5)[:, np.newaxis], np.pi / 2, np.radians(np.arange(0, 91, 10)))
+            >>> n_1.shape
+            (5, 10)
+
+        Args:
+            wl (float or ndarray): Wavelength in micrometers
+            theta (float or ndarray): Polar angle in radians
+            phi (float or ndarray): Azimuthal angle in radians
+            temperature (float or ndarray): Temperature in degrees Celsius, as in `get_refractive_index()`
+
+        Returns:
+            A tuple of the larger (slow) and the smaller (fast) refractive index
+        """
+        n_x, n_y, n_z = self.get_principal_indices(wl, temperature)
+        return _get_effective_indices(n_x, n_y, n_z, theta, phi)
+
+    def get_group_index (self, wl: Union[float, np.ndarray], ray = 'o', temperature: Union[None, float, np.ndarray] = None) -> np.ndarray:
+        """
+        The function computes the group index n_g = n - wl dn/dwl from the first-order Taylor coefficients of the dispersion formula,
+        the same evaluation that provides GD and GVD in `get_dispersion()`.
+
+        Examples:
+            >>> from scilightcon.optics import load_material
+            >>> fused_silica = load_material('fused_silica')
+            >>> round(float(fused_silica.get_group_index(0.8)), 5)
+            1.46714
+            >>> fused_silica.get_group_index(np.linspace(0.5, 1.5, 11)).shape
+            (11,)
+
+        Args:
+            wl (float or ndarray): Wavelength in micrometers, a scalar or an array of any shape
+            ray (str): `o` for ordinary, `e` for extraordinary, `z` for the third principal axis of biaxial crystals
+            temperature (float or ndarray): Temperature in degrees Celsius, as in `get_dispersion()`
+
+        Returns:
+            Group index of the broadcast shape of `wl` and `temperature`
+        """
+        gd, = self._get_dispersion(wl, (1,), ray, "Group index", temperature)
+        return gd * c
+
+    def get_group_delay (self, wl: Union[float, np.ndarray], ray = 'o', temperature: Union[None, float, np.ndarray] = None) -> np.ndarray:
+        """
+        The function computes the group delay per unit length, the inverse group velocity n_g / c.
+
+        Examples:
+            >>> from scilightcon.optics import load_material
+            >>> fused_silica = load_material('fused_silica')
+            >>> round(float(fused_silica.get_group_delay(0.8)), 1)
+            4893.9
+
+        Args:
+            wl (float or ndarray): Wavelength in micrometers, a scalar or an array of any shape
+            ray (str): `o` for ordinary, `e` for extraordinary, `z` for the third principal axis of biaxial crystals
+            temperature (float or ndarray): Temperature in degrees Celsius, as in `get_dispersion()`
+
+        Returns:
+            Group delay in fs/mm of the broadcast shape of `wl` and `temperature`
+        """
+        gd, = self._get_dispersion(wl, (1,), ray, "Group delay", temperature)
+        return gd
+
+    def get_walk_off_angle (self, wl: Union[float, np.ndarray], theta: Union[float, np.ndarray], phi: Union[float, np.ndarray] = 0.0,
+                            temperature: Union[None, float, np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The function computes the spatial walk-off angle, between the wave vector and the Poynting vector, of the two eigen-polarizations
+        propagating along the direction given by `theta` and `phi` as in `get_effective_index()`. The angles follow from
+        closed-form derivatives of the effective indices with respect to the propagation direction, tan(rho) = |grad n| / n.
+        All arguments are broadcast against each other.
+
+        Examples:
+            >>> from scilightcon.optics import load_material
+            >>> bbo = load_material('BBO')
+            >>> rho_slow, rho_fast = bbo.get_walk_off_angle(0.515, np.radians(23.4))
+            >>> round(float(rho_slow), 6), round(float(np.degrees(rho_fast)), 2)
+            (0.0, 3.26)
+
+        Args:
+            wl (float or ndarray): Wavelength in micrometers
+            theta (float or ndarray): Polar angle in radians
+            phi (float or ndarray): Azimuthal angle in radians
+            temperature (float or ndarray): Temperature in degrees Celsius, as in `get_refractive_index()`
+
+        Returns:
+            A tuple of walk-off angles in radians of the slow and the fast eigen-polarization
+        """
+        n_x, n_y, n_z = self.get_principal_indices(wl, temperature)
+        return _get_walk_off_angles(n_x, n_y, n_z, theta, phi)
+
+    def get_nonlinear_index (self, wl: Union[float, np.ndarray], ray = 'o') -> np.ndarray:
+        """
+        The function returns the nonlinear refractive index n2 of a material, linearly interpolated between
+        the wavelengths it was measured at and held constant outside of them.
+
+        Examples:
+            >>> from scilightcon.optics import load_material
+            >>> fused_silica = load_material('fused_silica')
+            >>> float(fused_silica.get_nonlinear_index(1.053))
+            2.74e-16
+
+        Args:
+            wl (float or ndarray): Wavelength in micrometers, a scalar or an array of any shape
+            ray (str): `o` for ordinary, `e` for extraordinary
+
+        Returns:
+            Nonlinear refractive index in cm^2/W
+        """
+        if ray not in ('o', 'e'):
+            raise ValueError(f"Nonlinear refractive index is only available for ordinary and extraordinary rays, not for {ray}")
+        n2 = {'o': self._info.get("N2_O"), 'e': self._info.get("N2_E")}[ray]
+        if not self._info.get("N2_Defined") or n2 is None:
+            raise ValueError(f"Nonlinear refractive index is not available for {_RAY_NAMES[{'o': 0, 'e': 1}[ray]]} type of ray of {self._info['Name']}")
+        return np.interp(np.asarray(wl, dtype=np.float64), self._info["N2_Wl"], n2)
+
+    def get_extinction_coefficient (self, wl: Union[float, np.ndarray], ray = 'both') -> List[Union[float, np.ndarray]]:
+        """
+        The function computes and returns the extinction coefficient (imaginary part of the refractive index) of a material
+        by interpolating its tabulated absorption data.
+
+        Examples:
+            >>> from scilightcon.optics import load_material
+            >>> gold = load_material('Au')
+            >>> k, _ = gold.get_extinction_coefficient(np.array([1.0, 1.55]))
+            >>> k.shape
+            (2,)
+
+        Args:
+            wl (float or ndarray): Wavelength in micrometers, a scalar or an array of any shape
+            ray (str): `o` for ordinary, `e` for extraordinary, `z` for the third principal axis of biaxial crystals, `both` for both ordinary and extraordinary rays respectively
+
+        Returns:
+            A list of material's extinction coefficients, `None` for a missing ray if calculated for both types of rays
+        """
+        wl = np.asarray(wl, dtype=np.float64)
+        indices_dict = {'o': [0], 'e': [1], 'z': [2], 'both': [0,1]}
+        indices = indices_dict[ray]
+        extinction_list = []
+        for parameter_index in indices:
+            if parameter_index >= len(self._parameters):
+                if len(indices) == 1:
+                    raise ValueError(f"Extinction coefficient can not be calculated for {_RAY_NAMES[parameter_index]} type of ray ")
+                extinction_list.append(None)
+                continue
+
+            if self._extinction[parameter_index] is None:
+                raise ValueError(f"Extinction coefficient data are not available for {self._info['Name']}")
+
+            _check_wavelength_range(wl, self._parameters[parameter_index]["WlKRange"], parameter_index)
+            extinction_list.append(self._extinction[parameter_index](wl))
+
+        return extinction_list
+
+    def get_complex_index (self, wl: Union[float, np.ndarray], ray = 'both') -> List[Union[complex, np.ndarray]]:
+        """
+        The function computes and returns the complex refractive index n + ik of a material.
+
+        Examples:
+            >>> from scilightcon.optics import load_material
+            >>> gold = load_material('Au')
+            >>> n, = gold.get_complex_index(1.0, ray='o')
+            >>> bool(n.imag > 0)
+            True
+
+        Args:
+            wl (float or ndarray): Wavelength in micrometers, a scalar or an array of any shape
+            ray (str): `o` for ordinary, `e` for extraordinary, `z` for the third principal axis of biaxial crystals, `both` for both ordinary and extraordinary rays respectively
+
+        Returns:
+            A list of material's complex refractive indexes, `None` for a missing ray if calculated for both types of rays
+        """
+        n_list = self.get_refractive_index(wl, ray)
+        k_list = self.get_extinction_coefficient(wl, ray)
+        return [None if n is None else n + 1j * k for n, k in zip(n_list, k_list)]
+
+    def get_internal_transmission (self, wl: Union[float, np.ndarray], thickness: Union[float, np.ndarray], ray = 'o') -> np.ndarray:
+        """
+        The function computes the internal transmission exp(-4 pi k d / wl) of a material slab, excluding surface reflections.
+
+        Examples:
+            >>> from scilightcon.optics import load_material
+            >>> amtir = load_material('AMTIR')
+            >>> t = amtir.get_internal_transmission(np.linspace(2.0, 12.0, 11), np.array([1.0, 10.0])[:, np.newaxis])
+            >>> t.shape
+            (2, 11)
+
+        Args:
+            wl (float or ndarray): Wavelength in micrometers
+            thickness (float or ndarray): Thickness in millimeters, broadcast against `wl`
+            ray (str): `o` for ordinary, `e` for extraordinary, `z` for the third principal axis of biaxial crystals
+
+        Returns:
+            Internal transmission (fraction) of the broadcast shape of `wl` and `thickness`
+        """
+        wl = np.asarray(wl, dtype=np.float64)
+        k, = self.get_extinction_coefficient(wl, ray)
+        return np.exp(-4.0 * math.pi * k * np.asarray(thickness, dtype=np.float64) * 1.0e3 / wl)
+
+_RAY_NAMES = ('ordinary', 'extraordinary', 'z axis')
+_RAY_INDICES = {'o': (0,), 'e': (1,), 'z': (2,), 'both': (0, 1)}
+_ABSOLUTE_ZERO = -273.15
+
+def _get_axis_parameters(info: dict) -> List[dict]:
+    """Returns parameter sets of the ordinary, extraordinary and, for biaxial crystals, z axis rays.
+    Biaxial crystals store the coefficients of all three principal axes (`XC`, `YC`, `ZC`) in every parameter set."""
+    parameters = info["Parameters"][:2]
+    if info.get("NumberOfAxis") == 2:
+        parameters = parameters + parameters[1:]
+    return parameters
+
+def _get_effective_indices(n_x: np.ndarray, n_y: np.ndarray, n_z: np.ndarray, theta: Union[float, np.ndarray], phi: Union[float, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Solves the Fresnel equation of wave normals for the slow and fast refractive index"""
+    theta = np.asarray(theta, dtype=np.float64)
+    phi = np.asarray(phi, dtype=np.float64)
+    s_x2 = (np.sin(theta) * np.cos(phi))**2
+    s_y2 = (np.sin(theta) * np.sin(phi))**2
+    s_z2 = np.cos(theta)**2
+    a_x, a_y, a_z = n_x**-2.0, n_y**-2.0, n_z**-2.0
+
+    # Fresnel equation as a quadratic in 1/n^2: x^2 - b x + c = 0
+    b = s_x2 * (a_y + a_z) + s_y2 * (a_x + a_z) + s_z2 * (a_x + a_y)
+    c = s_x2 * a_y * a_z + s_y2 * a_x * a_z + s_z2 * a_x * a_y
+    root = np.sqrt(np.maximum(b * b - 4.0 * c, 0.0))
+    return 1.0 / np.sqrt(0.5 * (b - root)), 1.0 / np.sqrt(0.5 * (b + root))
+
+def _get_effective_index_slopes(n_x: np.ndarray, n_y: np.ndarray, n_z: np.ndarray, theta: Union[float, np.ndarray], phi: Union[float, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns derivatives of the slow and fast refractive index with respect to theta at fixed phi, differentiating
+    the Fresnel equation of wave normals implicitly"""
+    theta = np.asarray(theta, dtype=np.float64)
+    phi = np.asarray(phi, dtype=np.float64)
+    s_x2 = (np.sin(theta) * np.cos(phi))**2
+    s_y2 = (np.sin(theta) * np.sin(phi))**2
+    s_z2 = np.cos(theta)**2
+    a_x, a_y, a_z = n_x**-2.0, n_y**-2.0, n_z**-2.0
+    b = s_x2 * (a_y + a_z) + s_y2 * (a_x + a_z) + s_z2 * (a_x + a_y)
+    c = s_x2 * a_y * a_z + s_y2 * a_x * a_z + s_z2 * a_x * a_y
+    root = np.sqrt(np.maximum(b * b - 4.0 * c, 0.0))
+
+    d_x2, d_y2, d_z2 = np.sin(2 * theta) * np.cos(phi)**2, np.sin(2 * theta) * np.sin(phi)**2, -np.sin(2 * theta)
+    d_b = d_x2 * (a_y + a_z) + d_y2 * (a_x + a_z) + d_z2 * (a_x + a_y)
+    d_c = d_x2 * a_y * a_z + d_y2 * a_x * a_z + d_z2 * a_x * a_y
+
+    slopes = []
+    for sign in (-1.0, 1.0):
+        # x = 1/n^2 solves x^2 - b x + c = 0, so dx = (x db - dc) / (2x - b) and dn = -dx / (2 x^(3/2))
+        x = 0.5 * (b + sign * root)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = -(x * d_b - d_c) / ((2.0 * x - b) * 2.0 * x**1.5)
+        # the indices are not differentiable along optic axes, where the two roots coincide
+        slopes.append(np.where(root > 1e-7 * b, slope, 0.0))
+    return tuple(slopes)
+
+def _get_walk_off_angles(n_x: np.ndarray, n_y: np.ndarray, n_z: np.ndarray, theta: Union[float, np.ndarray], phi: Union[float, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns walk-off angles of the slow and fast eigen-polarizations from the derivatives of the Fresnel equation
+    of wave normals with respect to theta and, divided by sin(theta), phi"""
+    theta = np.asarray(theta, dtype=np.float64)
+    phi = np.asarray(phi, dtype=np.float64)
+    s_x2 = (np.sin(theta) * np.cos(phi))**2
+    s_y2 = (np.sin(theta) * np.sin(phi))**2
+    s_z2 = np.cos(theta)**2
+    a_x, a_y, a_z = n_x**-2.0, n_y**-2.0, n_z**-2.0
+    b = s_x2 * (a_y + a_z) + s_y2 * (a_x + a_z) + s_z2 * (a_x + a_y)
+    c = s_x2 * a_y * a_z + s_y2 * a_x * a_z + s_z2 * a_x * a_y
+    root = np.sqrt(np.maximum(b * b - 4.0 * c, 0.0))
+
+    # derivatives of (s_x2, s_y2, s_z2) along the two directions orthogonal to the wave vector
+    gradients = []
+    for d_x2, d_y2, d_z2 in [(np.sin(2 * theta) * np.cos(phi)**2, np.sin(2 * theta) * np.sin(phi)**2, -np.sin(2 * theta)),
+                             (-np.sin(theta) * np.sin(2 * phi), np.sin(theta) * np.sin(2 * phi), 0.0)]:
+        d_b = d_x2 * (a_y + a_z) + d_y2 * (a_x + a_z) + d_z2 * (a_x + a_y)
+        d_c = d_x2 * a_y * a_z + d_y2 * a_x * a_z + d_z2 * a_x * a_y
+        gradients.append((d_b, d_c))
+
+    angles = []
+    for sign in (-1.0, 1.0):
+        # x = 1/n^2 solves x^2 - b x + c = 0, so dx = (x db - dc) / (2x - b) and dn / n = -dx / (2x)
+        x = 0.5 * (b + sign * root)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tangents = [(x * d_b - d_c) / ((2.0 * x - b) * 2.0 * x) for d_b, d_c in gradients]
+        # walk-off vanishes for isotropic media and is not defined along optic axes, where the two roots coincide
+        # up to the rounding error of b^2 - 4c
+        tangent = np.where(root > 1e-7 * b, np.hypot(*tangents), 0.0)
+        angles.append(np.arctan(tangent))
+    return tuple(angles)
+
+def _check_wavelength_range(wl: np.ndarray, wl_range: List[float], parameter_index: int):
+    if np.any((wl < wl_range[0]) | (wl > wl_range[1])):
+        raise ValueError(f"For {_RAY_NAMES[parameter_index]} type of ray " +
+                         f"the wavelenght should be in range between {wl_range[0]} and {wl_range[1]}")
+
+def _get_propagation_constant_derivatives(wl: np.ndarray, n_series: List[np.ndarray]) -> List[np.ndarray]:
+    """Converts Taylor coefficients of the refractive index around wavelength `wl` (in micrometers) to derivatives
+    of the propagation constant k = n * omega / c with respect to angular frequency, k^(m) in fs^m/mm"""
+    order = len(n_series) - 1
+    if order <= 3:
+        return _get_low_order_derivatives(wl, n_series)
+    omega = 2.0 * math.pi * c / (wl * 1.0e-3)
+
+    # wavelength as a function of angular frequency, wl(omega + e) = wl * sum (-e / omega)^m
+    wl_series = [wl * (-1.0 / omega) ** m for m in range(order + 1)]
+    n_omega = _compose(n_series, wl_series)
+
+    k_series = [n_omega[0] * omega / c] + [(n_omega[m] * omega + n_omega[m - 1]) / c for m in range(1, order + 1)]
+    return _to_derivatives(k_series)
+
+def _get_low_order_derivatives(wl: np.ndarray, n_series: List[np.ndarray]) -> List[np.ndarray]:
+    """Closed-form chain rule of `_get_propagation_constant_derivatives()` up to TOD, without composing series:
+    GD = (n - wl n') / c, GVD = wl^3 n'' / (2 pi c^2), TOD = -wl^4 (3 n'' + wl n''') / (4 pi^2 c^3)"""
+    order = len(n_series) - 1
+    beta = [n_series[0] * (2.0e3 * math.pi) / wl]
+    if order >= 1:
+        beta.append((n_series[0] - wl * n_series[1]) * (1.0 / c))
+    if order >= 2:
+        # n'' = 2 n_series[2] and n''' = 6 n_series[3]
+        wl_3 = wl * wl * wl
+        beta.append(n_series[2] * wl_3 * (1.0e-3 / (math.pi * c * c)))
+    if order >= 3:
+        beta.append((n_series[2] + wl * n_series[3]) * (wl_3 * wl) * (-6.0e-6 / (4.0 * math.pi * math.pi * c * c * c)))
+    return beta
+
+def _get_thermo_optic_coefficients(parameter: dict, parameter_index: int) -> Union[None, Tuple[float, float, Tuple[float, float]]]:
+    """Returns dn/dT of the axis of a ray, the reference temperature and the wavelength range of the thermo-optic data,
+    `None` if the material has no thermo-optic data or its record does not enable temperature tuning"""
+    dn_dT = parameter["DndT"]
+    if not parameter.get("TemperatureTunning") or dn_dT is None or parameter["ReferenceTemperature"] is None or not np.any(np.asarray(dn_dT) != 0):
+        return None
+    wl_range = parameter["TTunningMargins"] if parameter["TTunningMargins"] is not None else parameter["WlNRange"]
+    return float(dn_dT[parameter_index]), float(parameter["ReferenceTemperature"]), (float(wl_range[0]), float(wl_range[1]))
+
+def _get_extinction_interpolant(parameter: dict) -> Union[None, PchipInterpolator]:
+    """Returns a shape-preserving interpolant of tabulated extinction coefficient, `None` if the data are not available"""
+    if not parameter["KDefined"] or parameter["DataK"] is None or len(parameter["DataK"]) == 0:
+        return None
+    return PchipInterpolator(np.asarray(parameter["DataKWl"], dtype=np.float64), np.asarray(parameter["DataK"], dtype=np.float64))
+
+def _bind_kernel(parameter: dict, parameter_index: int) -> Union[_BoundKernel, _TabulatedKernel]:
+    formula = parameter["Formula"]
+    if formula == 0:
+        return _TabulatedKernel(parameter["DataNWl"], parameter["DataN"])
+    if formula == 10:
+        return _BoundKernel(formula, (parameter["XC"], parameter["YC"], parameter["ZC"])[parameter_index])
+    return _BoundKernel(formula, parameter["SellmeierCoeffs"])
 
 def load_material(name: str) -> Material:
    """Loads material's data.
@@ -222,11 +664,125 @@ def load_material(name: str) -> Material:
     Returns:
         Material's object
    """
+   from ..datasets import _materials, _materials_index
+
+   key = _materials_index.get(name.lower())
+   if key is None:
+      raise ValueError("Material not found")
+   return Material(_materials[key])
+
+def list_materials() -> List[str]:
+   """Lists database keys of all available materials. Each key can be passed to [scilightcon.optics.load_material][].
+
+    Examples:
+        >>> from scilightcon.optics import list_materials
+        >>> 'LiNbO3' in list_materials()
+        True
+
+    Returns:
+        A list of material keys in database order
+   """
+   from ..datasets import _materials
+
+   return list(_materials)
+
+def find_materials(query: Union[str, Callable[[dict], bool]]) -> List[str]:
+   """Finds materials by a name prefix or by a predicate on the material's record.
+
+    Examples:
+        >>> from scilightcon.optics import find_materials
+        >>> find_materials('zinc s')
+        ['ZnSe', 'ZnS', 'ZnSiAs2']
+        >>> len(find_materials(lambda info: info['Type'] == 'Glasses')) > 0
+        True
+
+    Args:
+        query (str or callable): Case-insensitive prefix of material's name, chemformula, alias or key,
+            or a function taking the material's record (dict) and returning `True` for matching materials
+
+    Returns:
+        A list of matching material keys in database order
+   """
+   from ..datasets import _materials, _materials_terms
+
+   if callable(query):
+      return [key for key in _materials if query(_materials[key])]
+
+   prefix = query.lower()
+   return [key for key in _materials_terms if any(term.startswith(prefix) for term in _materials_terms[key])]
+
+_CATALOG_QUANTITIES = {'n': 0, 'GD': 1, 'GVD': 2, 'TOD': 3}
+
+def evaluate_catalog(materials: Union[None, Sequence[str], Callable[[dict], bool]], wl: Union[float, np.ndarray], quantity: Union[str, int] = 'n', ray = 'o') -> np.ndarray:
+   """Evaluates the refractive index or a dispersion quantity of many materials at once.
+
+    Materials sharing a formula and the same set of non-zero terms are evaluated together with their
+    coefficients stacked into a matrix, so the whole catalog takes a handful of vectorized evaluations.
+
+    Examples:
+        >>> from scilightcon.optics import evaluate_catalog, find_materials
+        >>> names = find_materials(lambda info: info['Type'] == 'Glasses')
+        >>> gvd = evaluate_catalog(names, np.linspace(0.8, 1.2, 5), 'GVD')
+        >>> gvd.shape == (len(names), 5)
+        True
+        >>> evaluate_catalog(['Zinc oxide'], 1.03, 'GVD')
+        array([[283.0382719]])
+
+    Args:
+        materials (list, callable or None): Names, chemformulas or aliases of materials, a predicate on the material's record
+            as in [scilightcon.optics.find_materials][], or `None` for the whole database
+        wl (float or ndarray): Wavelength in micrometers, a scalar or a 1D array
+        quantity (str or int): `n`, `GD` (fs/mm), `GVD` (fs^2/mm), `TOD` (fs^3/mm) or a dispersion order as in `Material.get_dispersion()`
+        ray (str): `o` for ordinary, `e` for extraordinary, `z` for the third principal axis of biaxial crystals
+
+    Returns:
+        An array of shape (number of materials, number of wavelengths), rows follow the order of `materials` (database order
+        for a predicate or `None`). Wavelengths outside of a material's range and missing rays give `nan`
+   """
+   from ..datasets import _materials, _materials_index
+
+   if materials is None:
+      keys = list(_materials)
+   elif callable(materials):
+      keys = find_materials(materials)
+   else:
+      keys = []
+      for name in materials:
+         key = _materials_index.get(name.lower())
+         if key is None:
+            raise ValueError(f"Material {name} not found")
+         keys.append(key)
+
+   order = _CATALOG_QUANTITIES[quantity] if isinstance(quantity, str) else quantity
+   wl = np.atleast_1d(np.asarray(wl, dtype=np.float64))
+   values = np.full((len(keys), wl.size), np.nan)
+
+   with np.errstate(all='ignore'):
+      for rows, kernel, wl_ranges in _get_catalog_groups(tuple(keys), {'o': 0, 'e': 1, 'z': 2}[ray]):
+         series = kernel.evaluate_series(wl, order)
+         group_values = series[0] if order == 0 else _get_propagation_constant_derivatives(wl, series)[order]
+         inside = (wl >= wl_ranges[:, :1]) & (wl <= wl_ranges[:, 1:])
+         values[rows] = np.where(inside, group_values, np.nan)
+   return values
+
+@lru_cache(maxsize=16)
+def _get_catalog_groups(keys: Tuple[str, ...], parameter_index: int) -> List[Tuple[np.ndarray, Union[_BoundKernel, _TabulatedKernel], np.ndarray]]:
+   """Groups materials by formula and non-zero terms, returns rows, stacked kernel and wavelength ranges of every group"""
    from ..datasets import _materials
-   
-   name = name.lower()
-   
-   for key in _materials:
-      if _materials[key]["Name"].lower() == name or _materials[key]["Chemformula"].lower() == name or name in [alias.lower() for alias in _materials[key]['Alias']]:
-          return Material(_materials[key])
-   raise ValueError("Material not found")
\ No newline at end of file
+
+   groups = {}
+   for row, key in enumerate(keys):
+      parameters = _get_axis_parameters(_materials[key])
+      if parameter_index >= len(parameters):
+         continue
+      kernel = _bind_kernel(parameters[parameter_index], parameter_index)
+      group = (kernel.formula, tuple(kernel.terms)) if kernel.formula else ('row', row)
+      groups.setdefault(group, []).append((row, kernel, parameters[parameter_index]["WlNRange"]))
+
+   result = []
+   for members in groups.values():
+      rows = np.array([row for row, _, _ in members])
+      kernel = members[0][1] if len(members) == 1 else _stack_kernels([kernel for _, kernel, _ in members])
+      wl_ranges = np.array([wl_range for _, _, wl_range in members], dtype=np.float64)
+      result.append((rows, kernel, wl_ranges))
+   return result
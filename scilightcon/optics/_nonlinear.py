@@ -0,0 +1,62 @@
+from typing import Sequence, Tuple, Union
+import math
+import numpy as np
+from ._materials import Material
+
+# peak power of a Gaussian pulse is GAUSSIAN_PEAK_FACTOR * energy / FWHM duration
+GAUSSIAN_PEAK_FACTOR = 2.0 * math.sqrt(math.log(2.0) / math.pi)
+
+def get_peak_intensity(energy: Union[float, np.ndarray], duration: Union[float, np.ndarray], beam_radius: Union[float, np.ndarray]) -> np.ndarray:
+    """Computes the peak intensity of a pulse with Gaussian temporal and spatial profiles. All arguments are broadcast against each other.
+
+    Examples:
+        >>> from scilightcon.optics import get_peak_intensity
+        >>> round(float(get_peak_intensity(1e-3, 300, 1.0)) / 1e9, 1)
+        199.4
+
+    Args:
+        energy (float or ndarray): Pulse energy in J
+        duration (float or ndarray): Pulse duration (FWHM) in fs
+        beam_radius (float or ndarray): Beam radius at 1/e^2 intensity in mm
+
+    Returns:
+        Peak intensity in W/cm^2
+    """
+    peak_power = GAUSSIAN_PEAK_FACTOR * np.asarray(energy, dtype=np.float64) / (np.asarray(duration, dtype=np.float64) * 1.0e-15)
+    beam_radius_cm = np.asarray(beam_radius, dtype=np.float64) * 0.1
+    return 2.0 * peak_power / (math.pi * beam_radius_cm**2)
+
+def get_B_integral(elements: Sequence[Union[Tuple[Material, float], Tuple[Material, float, str]]], wl: Union[float, np.ndarray],
+                   energy: Union[float, np.ndarray], duration: Union[float, np.ndarray], beam_radius: Union[float, np.ndarray]) -> np.ndarray:
+    """Computes the B-integral accumulated by a Gaussian pulse at its peak through a stack of optical elements.
+    The nonlinear phase of the stack is summed once and then scaled by the peak intensity, so any combination
+    of broadcast arrays of wavelengths, energies, durations and beam sizes is evaluated in one operation.
+
+    Examples:
+        >>> import numpy as np
+        >>> from scilightcon.optics import load_material, get_B_integral
+        >>> fused_silica = load_material('fused_silica')
+        >>> energy = np.array([1e-4, 1e-3])[:, np.newaxis]
+        >>> beam_radius = np.array([1.0, 2.0, 4.0])
+        >>> b = get_B_integral([(fused_silica, 10.0)], 1.03, energy, 300.0, beam_radius)
+        >>> b.shape
+        (2, 3)
+
+    Args:
+        elements (list): Optical elements as tuples (material, thickness in mm) or (material, thickness in mm, ray)
+        wl (float or ndarray): Wavelength in micrometers
+        energy (float or ndarray): Pulse energy in J
+        duration (float or ndarray): Pulse duration (FWHM) in fs
+        beam_radius (float or ndarray): Beam radius at 1/e^2 intensity in mm
+
+    Returns:
+        B-integral in radians of the broadcast shape of all arguments
+    """
+    wl = np.asarray(wl, dtype=np.float64)
+    n2_length = 0.0
+    for element in elements:
+        material, thickness = element[0], element[1]
+        ray = element[2] if len(element) > 2 else 'o'
+        n2_length = n2_length + material.get_nonlinear_index(wl, ray) * np.asarray(thickness, dtype=np.float64) * 0.1
+
+    return 2.0 * math.pi / (wl * 1.0e-4) * n2_length * get_peak_intensity(energy, duration, beam_radius)
@@ -0,0 +1,192 @@
+from typing import Tuple, Union
+import math
+import numpy as np
+from scilightcon.utils import c
+from ._materials import Material, _get_effective_indices, _get_effective_index_slopes
+
+# polarizations of waves 1, 2 and 3 as slow (s) or fast (f) eigenmodes of the crystal
+_INTERACTIONS = {'I': 'ssf', 'II': 'sff'}
+
+# sinc^2(dk L / 2) falls to one half at |dk| L = 2 * 1.39156
+_ACCEPTANCE_FWHM = 4 * 1.39156
+
+class PhaseMatching:
+    """Collinear three-wave mixing 1/wl3 = 1/wl1 + 1/wl2 in a birefringent crystal.
+
+    Waves 1 and 2 are the low frequency waves (signal and idler of an OPA, fundamental of SHG) and wave 3 is the
+    high frequency wave (pump of an OPA, second harmonic). Each wave is polarized either along the slow (larger index)
+    or the fast (smaller index) eigenmode of the propagation direction. In a negative uniaxial crystal
+    type I (`ssf`) is ooe and type II (`sff`) is oee, in a positive one type I is eeo and type II is eoo.
+    The propagation direction is set by the polar angle theta, solved for, and the azimuthal angle phi, which stays
+    fixed and is not solved for, e.g. phi = 0 or pi / 2 for the principal planes of biaxial crystals.
+    All methods take wavelength arrays and solve them at once.
+
+    Examples:
+        >>> import numpy as np
+        >>> from scilightcon.optics import load_material, PhaseMatching
+        >>> shg = PhaseMatching(load_material('BBO'), interaction='I')
+        >>> theta = shg.get_phase_matching_angle(1.03, 1.03)
+        >>> round(float(np.degrees(theta)), 2)
+        23.37
+        >>> opa = PhaseMatching(load_material('BBO'), interaction='I')
+        >>> signal = np.linspace(0.65, 0.95, 31)
+        >>> theta = opa.get_phase_matching_angle(signal, 1 / (1 / 0.515 - 1 / signal))
+        >>> theta.shape
+        (31,)
+
+    Args:
+        material (Material): Crystal
+        interaction (str): `I`, `II` or polarizations of waves 1, 2 and 3 as a string of `s` (slow) and `f` (fast), e.g. `fsf`
+        phi (float): Azimuthal angle in radians
+        temperature (float): Temperature in degrees Celsius, `None` for the reference temperature of the material
+    """
+
+    def __init__(self, material: Material, interaction: str = 'I', phi: float = 0.0, temperature: Union[None, float] = None):
+        polarizations = _INTERACTIONS.get(interaction, interaction)
+        if len(polarizations) != 3 or not set(polarizations) <= {'s', 'f'}:
+            raise ValueError(f"Unknown interaction {interaction}")
+        self.material = material
+        self.polarizations = polarizations
+        self.phi = phi
+        self.temperature = temperature
+
+    def get_phase_matching_angle(self, wl1: Union[float, np.ndarray], wl2: Union[float, np.ndarray], tol: float = 1e-12, max_iterations: int = 100) -> np.ndarray:
+        """Solves the phase matching condition dk = 0 for the polar angle with safeguarded Newton iterations at the fixed
+        azimuthal angle `phi`. The slope of dk follows analytically from the Fresnel equation of wave normals, a step
+        leaving the bracket of the root falls back to bisection.
+
+        Args:
+            wl1 (float or ndarray): Wavelength of wave 1 in micrometers
+            wl2 (float or ndarray): Wavelength of wave 2 in micrometers, broadcast against `wl1`
+            tol (float): Convergence tolerance of the angle in radians
+            max_iterations (int): Maximum number of iterations
+
+        Returns:
+            Phase matching angle theta in radians, `nan` where the interaction can not be phase matched
+        """
+        wl = self._get_wavelengths(wl1, wl2)
+        principal = [self.material.get_principal_indices(x, self.temperature) for x in wl]
+
+        lo = np.zeros(wl[0].shape)
+        hi = np.full(wl[0].shape, 0.5 * math.pi)
+        dk_lo = self._get_wave_vector_mismatch(wl, principal, lo)
+        dk_hi = self._get_wave_vector_mismatch(wl, principal, hi)
+        valid = np.sign(dk_lo) != np.sign(dk_hi)
+
+        theta = 0.5 * (lo + hi)
+        for _ in range(max_iterations):
+            dk = self._get_wave_vector_mismatch(wl, principal, theta)
+            left = np.sign(dk) == np.sign(dk_lo)
+            lo = np.where(left, theta, lo)
+            dk_lo = np.where(left, dk, dk_lo)
+            hi = np.where(left, hi, theta)
+
+            slope = self._get_wave_vector_mismatch_slope(wl, principal, theta)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                step = theta - dk / slope
+            step = np.where(np.isfinite(step) & (step > lo) & (step < hi), step, 0.5 * (lo + hi))
+
+            converged = np.abs(step - theta) < tol
+            theta = step
+            if np.all(converged | ~valid):
+                break
+
+        return np.where(valid, theta, np.nan)
+
+    def get_group_velocity_mismatch(self, wl1: Union[float, np.ndarray], wl2: Union[float, np.ndarray], theta: Union[float, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Computes group velocity mismatch of waves 1 and 2 with respect to wave 3 along direction `theta`.
+
+        Examples:
+            >>> import numpy as np
+            >>> from scilightcon.optics import load_material, PhaseMatching
+            >>> shg = PhaseMatching(load_material('BBO'))
+            >>> gvm, _ = shg.get_group_velocity_mismatch(1.03, 1.03, shg.get_phase_matching_angle(1.03, 1.03))
+            >>> round(float(gvm), 1)
+            -94.8
+
+        Args:
+            wl1 (float or ndarray): Wavelength of wave 1 in micrometers
+            wl2 (float or ndarray): Wavelength of wave 2 in micrometers
+            theta (float or ndarray): Polar angle in radians
+
+        Returns:
+            A tuple (1/v1 - 1/v3, 1/v2 - 1/v3) in fs/mm
+        """
+        u1, u2, u3 = self._get_inverse_group_velocities(self._get_wavelengths(wl1, wl2), theta)
+        return u1 - u3, u2 - u3
+
+    def get_acceptance_bandwidths(self, wl1: Union[float, np.ndarray], wl2: Union[float, np.ndarray], theta: Union[float, np.ndarray],
+                                  length: Union[float, np.ndarray], fixed_wave: Union[None, int] = 3) -> Tuple[np.ndarray, np.ndarray]:
+        """Computes full widths at half maximum of the sinc^2(dk L / 2) phase matching function in angle and wavelength.
+
+        The spectral acceptance is given as a bandwidth of wave 1 while the wave `fixed_wave` keeps its frequency
+        (3 for OPA and difference frequency generation, 2 for sum frequency generation) or, if `None`, while waves 1 and 2 are
+        tuned together as in second harmonic generation.
+
+        Examples:
+            >>> import numpy as np
+            >>> from scilightcon.optics import load_material, PhaseMatching
+            >>> shg = PhaseMatching(load_material('BBO'))
+            >>> theta = shg.get_phase_matching_angle(1.03, 1.03)
+            >>> angular, spectral = shg.get_acceptance_bandwidths(1.03, 1.03, theta, length=np.array([1.0, 2.0]), fixed_wave=None)
+            >>> angular.shape
+            (2,)
+
+        Args:
+            wl1 (float or ndarray): Wavelength of wave 1 in micrometers
+            wl2 (float or ndarray): Wavelength of wave 2 in micrometers
+            theta (float or ndarray): Polar angle in radians
+            length (float or ndarray): Crystal length in millimeters
+            fixed_wave (int): Wave with a fixed frequency, 2 or 3, or `None` for tuning waves 1 and 2 together
+
+        Returns:
+            A tuple of angular acceptance in radians (internal angle) and spectral acceptance of wave 1 in micrometers
+        """
+        wl = self._get_wavelengths(wl1, wl2)
+        principal = [self.material.get_principal_indices(x, self.temperature) for x in wl]
+        theta = np.asarray(theta, dtype=np.float64)
+        length = np.asarray(length, dtype=np.float64)
+
+        dk_dtheta = self._get_wave_vector_mismatch_slope(wl, principal, theta)
+        angular = _ACCEPTANCE_FWHM / (length * np.abs(dk_dtheta))
+
+        # frequency changes of waves 1, 2 and 3 per unit frequency change of wave 1
+        rates = {3: (1.0, -1.0, 0.0), 2: (1.0, 0.0, 1.0), None: (1.0, 1.0, 2.0)}[fixed_wave]
+        u = self._get_inverse_group_velocities(wl, theta)
+        dk_domega = rates[2] * u[2] - rates[0] * u[0] - rates[1] * u[1]
+        bandwidth_omega = _ACCEPTANCE_FWHM / (length * np.abs(dk_domega))
+        spectral = wl[0]**2 * bandwidth_omega / (2 * math.pi * c * 1.0e3)
+        return angular, spectral
+
+    def _get_wavelengths(self, wl1: Union[float, np.ndarray], wl2: Union[float, np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        wl1, wl2 = np.broadcast_arrays(np.asarray(wl1, dtype=np.float64), np.asarray(wl2, dtype=np.float64))
+        return wl1, wl2, 1.0 / (1.0 / wl1 + 1.0 / wl2)
+
+    def _get_index(self, principal, theta: np.ndarray, polarization: str) -> np.ndarray:
+        n_slow, n_fast = _get_effective_indices(*principal, theta, self.phi)
+        return n_slow if polarization == 's' else n_fast
+
+    def _get_wave_vector_mismatch(self, wl, principal, theta: np.ndarray) -> np.ndarray:
+        """Returns k3 - k1 - k2 in 1/mm"""
+        n1, n2, n3 = [self._get_index(axes, theta, polarization) for axes, polarization in zip(principal, self.polarizations)]
+        return 2.0e3 * math.pi * (n3 / wl[2] - n1 / wl[0] - n2 / wl[1])
+
+    def _get_wave_vector_mismatch_slope(self, wl, principal, theta: np.ndarray) -> np.ndarray:
+        """Returns d(k3 - k1 - k2)/dtheta in 1/mm/rad"""
+        dn1, dn2, dn3 = [_get_effective_index_slopes(*axes, theta, self.phi)[0 if polarization == 's' else 1]
+                         for axes, polarization in zip(principal, self.polarizations)]
+        return 2.0e3 * math.pi * (dn3 / wl[2] - dn1 / wl[0] - dn2 / wl[1])
+
+    def _get_inverse_group_velocities(self, wl, theta: Union[float, np.ndarray]):
+        """Returns inverse group velocities (n - wl dn/dwl) / c in fs/mm of the three waves along direction `theta`.
+        The derivative of the effective index follows from the derivatives of the principal indices."""
+        epsilon = 1e-6
+        result = []
+        for x, polarization in zip(wl, self.polarizations):
+            principal = self.material._get_principal_series(x, 1, self.temperature)
+            n = self._get_index([n for n, _ in principal], theta, polarization)
+            n_plus = self._get_index([n + epsilon * x * dn for n, dn in principal], theta, polarization)
+            n_minus = self._get_index([n - epsilon * x * dn for n, dn in principal], theta, polarization)
+            dn_dwl = (n_plus - n_minus) / (2 * epsilon * x)
+            result.append((n - x * dn_dwl) / c)
+        return result
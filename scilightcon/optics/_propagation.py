@@ -0,0 +1,122 @@
+from typing import Sequence, Tuple, Union
+import math
+import numpy as np
+import scipy.fft
+from scilightcon.utils import c
+from ._materials import Material, load_material
+from ._stack import OpticalStack
+
+class PulsePropagator:
+    """Linear and nonlinear propagation of ultrashort pulses through a sequence of materials.
+
+    The spectral field is sampled on a uniform angular frequency grid. The exact spectral phase of every material,
+    with the constant and the linear (group delay) terms at `omega0` removed, is computed once at construction,
+    so linear propagation of any number of spectra is a single multiplication. With `kerr=True` each element is
+    split into steps and self-phase modulation from the database n2 is applied in the time domain between
+    linear half-steps (symmetric split-step Fourier method).
+
+    Time and frequency domains are related by `to_time()` and `to_frequency()`. For nonlinear propagation the squared
+    modulus of the time domain field is the intensity in W/cm^2.
+
+    Examples:
+        >>> import numpy as np
+        >>> from scilightcon.optics import PulsePropagator
+        >>> from scilightcon.utils import c
+        >>> omega0 = 2 * np.pi * c / 1.03e-3
+        >>> omega = omega0 + np.linspace(-0.5, 0.5, 1024, endpoint=False)
+        >>> propagator = PulsePropagator(omega, [('fused_silica', 10.0)])
+        >>> t = propagator.time
+        >>> field = np.exp(-2 * np.log(2) * (t / 50.0)**2)
+        >>> output = propagator.to_time(propagator.propagate(propagator.to_frequency(field)))
+        >>> bool(np.isclose(np.sum(np.abs(output)**2), np.sum(field**2)))
+        True
+        >>> strong = propagator.to_time(propagator.propagate(propagator.to_frequency(3e5 * field), kerr=True))
+        >>> bool(np.isclose(np.sum(np.abs(strong)**2), np.sum((3e5 * field)**2)))
+        True
+
+    Args:
+        omega (ndarray): Uniform angular frequency grid in rad/fs
+        elements (list): Elements as tuples (material, thickness in mm) or (material, thickness in mm, ray)
+        omega0 (float): Reference angular frequency in rad/fs, the center of the grid by default
+        workers (int): Number of workers of `scipy.fft`
+    """
+
+    def __init__(self, omega: np.ndarray, elements: Sequence[Union[Tuple[Union[str, Material], float], Tuple[Union[str, Material], float, str]]],
+                 omega0: Union[None, float] = None, workers: Union[None, int] = None):
+        self.omega = np.asarray(omega, dtype=np.float64)
+        d_omega = self.omega[1] - self.omega[0]
+        if not np.allclose(np.diff(self.omega), d_omega):
+            raise ValueError("Angular frequency grid should be uniform")
+
+        self.omega0 = self.omega[len(self.omega) // 2] if omega0 is None else float(omega0)
+        self.workers = workers
+        n = len(self.omega)
+        self.time = (np.arange(n) - n // 2) * (2.0 * math.pi / (n * d_omega))
+
+        grid = OpticalStack(self.omega)
+        reference = OpticalStack(np.array([self.omega0]))
+        self._thicknesses = []
+        self._n2 = []
+        self._element_phases = []
+        for element in elements:
+            material = load_material(element[0]) if isinstance(element[0], str) else element[0]
+            ray = element[2] if len(element) > 2 else 'o'
+            index = grid.add_material(material, 1.0, ray)
+            reference.add_material(material, 1.0, ray)
+            # spectral phase per millimeter without the constant and group delay terms
+            k = grid.get_element_dispersion(index)[0]
+            k0, k1 = (value[0] for value in reference.get_element_dispersion(index)[:2])
+            self._element_phases.append(k - k0 - k1 * (self.omega - self.omega0))
+            self._thicknesses.append(float(element[1]))
+            self._n2.append(_get_nonlinear_index_or_none(material, 2.0 * math.pi * c / self.omega0 * 1.0e3, ray))
+
+        self.phase = sum((thickness * phase for thickness, phase in zip(self._thicknesses, self._element_phases)), np.zeros(n))
+        self._propagator = np.exp(1j * self.phase)
+        self._half_steps = {}
+
+    def propagate(self, spectrum: np.ndarray, kerr: bool = False, n_steps: int = 20) -> np.ndarray:
+        """Propagates spectral fields through all elements.
+
+        Args:
+            spectrum (ndarray): Complex spectral field on the frequency grid, the last axis is frequency, leading axes are a batch
+            kerr (bool): Whether to include self-phase modulation
+            n_steps (int): Number of split steps per element with `kerr`
+
+        Returns:
+            Propagated spectral field of the same shape as `spectrum`
+        """
+        spectrum = np.asarray(spectrum, dtype=np.complex128)
+        if not kerr:
+            return spectrum * self._propagator
+
+        k0 = self.omega0 / c * 10.0  # rad/cm
+        for index, (thickness, n2) in enumerate(zip(self._thicknesses, self._n2)):
+            if n2 is None:
+                raise ValueError("Nonlinear refractive index is not available for all elements")
+            dz = thickness / n_steps
+            half_step = self._get_half_step(index, dz)
+            for _ in range(n_steps):
+                field = self.to_time(spectrum * half_step)
+                field = field * np.exp(1j * k0 * n2 * np.abs(field)**2 * dz * 0.1)
+                spectrum = self.to_frequency(field) * half_step
+        return spectrum
+
+    def to_time(self, spectrum: np.ndarray) -> np.ndarray:
+        """Transforms spectral fields to the time domain, sampled at `time` (fs) relative to the reference"""
+        return scipy.fft.fftshift(scipy.fft.fft(scipy.fft.ifftshift(spectrum, axes=-1), workers=self.workers), axes=-1)
+
+    def to_frequency(self, field: np.ndarray) -> np.ndarray:
+        """Transforms time domain fields to spectral fields, the inverse of `to_time()`"""
+        return scipy.fft.fftshift(scipy.fft.ifft(scipy.fft.ifftshift(field, axes=-1), workers=self.workers), axes=-1)
+
+    def _get_half_step(self, index: int, dz: float) -> np.ndarray:
+        key = (index, dz)
+        if key not in self._half_steps:
+            self._half_steps[key] = np.exp(0.5j * self._element_phases[index] * dz)
+        return self._half_steps[key]
+
+def _get_nonlinear_index_or_none(material: Material, wl: float, ray: str) -> Union[None, float]:
+    try:
+        return float(material.get_nonlinear_index(wl, ray))
+    except ValueError:
+        return None
@@ -1,32 +1,63 @@
 import numpy as np
-import csv
-from typing import List
-from scilightcon.datasets import load_csv_data
-
-def get_Hg_spectrum(wl, width) -> float:
-    data, header = load_csv_data('Hg_lines.csv')
-    wl_lines = data[:,0]
-    I_lines = data[:,1]    
-    
-    return  _get_spectrum_from_lines(wl_lines, I_lines, wl, width)
-
-def get_Ar_spectrum(wl, width) -> float:
-    data, header = load_csv_data('Ar_lines.csv')
-    wl_lines = data[:,0]
-    I_lines = data[:,1]    
-    
-    return  _get_spectrum_from_lines(wl_lines, I_lines, wl, width)
-
-def get_White_LED_spectrum(wl, width) -> float:
-    data, header = load_csv_data('White_LED_spectrum.csv')
-    wl_lines = data[:,0]
-    I_lines = data[:,1]    
-    
-    return  _get_spectrum_from_lines(wl_lines, I_lines, wl, width)
-
-def _get_spectrum_from_lines(wl_lines: List [float], I_lines: List[float], wl : float, width : float) -> float:
-
-    spectrum = np.sum(I_line * np.exp(-(wl-wl_line)**2 /(2*width**2)) 
-                   for wl_line, I_line in zip(wl_lines, I_lines))
-
-    return spectrum
+from typing import Union
+from scilightcon.datasets import load_lamp_spectrum
+
+# lines are summed only within this many widths, where exp(-x^2/2) drops below 1e-13
+_LINE_WINDOW = 8.0
+
+def get_Hg_spectrum(wl: Union[float, np.ndarray], width: Union[float, np.ndarray]) -> np.ndarray:
+    """Computes the spectrum of a mercury lamp as a sum of Gaussian lines.
+
+    Examples:
+        >>> import numpy as np
+        >>> from scilightcon.optics import get_Hg_spectrum
+        >>> spectrum = get_Hg_spectrum(np.linspace(400, 600, 2001), 0.5)
+        >>> spectrum.shape
+        (2001,)
+
+    Args:
+        wl (float or ndarray): Wavelength in the units of the line table (nm)
+        width (float or ndarray): Positive standard deviation of the lines, a scalar or an array broadcast against `wl`
+
+    Returns:
+        Spectrum of the same shape as `wl`
+    """
+    return _get_spectrum_from_lines(*load_lamp_spectrum('Hg'), wl, width)
+
+def get_Ar_spectrum(wl: Union[float, np.ndarray], width: Union[float, np.ndarray]) -> np.ndarray:
+    """Computes the spectrum of an argon lamp as a sum of Gaussian lines, see `get_Hg_spectrum()`"""
+    return _get_spectrum_from_lines(*load_lamp_spectrum('Ar'), wl, width)
+
+def get_White_LED_spectrum(wl: Union[float, np.ndarray], width: Union[float, np.ndarray]) -> np.ndarray:
+    """Computes the spectrum of a white LED smoothed by Gaussians of `width`, see `get_Hg_spectrum()`"""
+    return _get_spectrum_from_lines(*load_lamp_spectrum('White_LED'), wl, width)
+
+def _get_spectrum_from_lines(wl_lines: np.ndarray, I_lines: np.ndarray, wl: Union[float, np.ndarray], width: Union[float, np.ndarray]) -> np.ndarray:
+    wl = np.asarray(wl, dtype=np.float64)
+    width = np.asarray(width, dtype=np.float64)
+    if not np.all(width > 0):
+        raise ValueError("Line width should be positive")
+    if width.ndim > 0:
+        # a width per point, evaluated densely with broadcasting
+        wl, width = np.broadcast_arrays(wl, width)
+        x = (wl[..., np.newaxis] - wl_lines) / width[..., np.newaxis]
+        return (np.exp(-0.5 * x**2) @ I_lines)[()]
+
+    # only the points within _LINE_WINDOW widths of every line are evaluated
+    points = wl.ravel()
+    order = None if np.all(points[1:] >= points[:-1]) else np.argsort(points, kind='stable')
+    sorted_points = points if order is None else points[order]
+
+    start = np.searchsorted(sorted_points, wl_lines - _LINE_WINDOW * width, side='left')
+    stop = np.searchsorted(sorted_points, wl_lines + _LINE_WINDOW * width, side='right')
+    counts = stop - start
+    line_index = np.repeat(np.arange(len(wl_lines)), counts)
+    point_index = np.arange(line_index.size) - np.repeat(np.cumsum(counts) - counts - start, counts)
+
+    x = (sorted_points[point_index] - wl_lines[line_index]) / width
+    sorted_spectrum = np.bincount(point_index, weights=I_lines[line_index] * np.exp(-0.5 * x**2), minlength=points.size)
+
+    spectrum = sorted_spectrum if order is None else np.empty_like(sorted_spectrum)
+    if order is not None:
+        spectrum[order] = sorted_spectrum
+    return spectrum.reshape(wl.shape)[()]
@@ -0,0 +1,134 @@
+from typing import List, Tuple, Union
+import math
+import numpy as np
+from scilightcon.utils import c
+from ._materials import Material, load_material
+
+class OpticalStack:
+    """Dispersion budget of a sequence of optical elements over a fixed angular frequency grid.
+
+    Materials are evaluated once per element, as the spectral phase and its derivatives per millimeter of thickness.
+    The budget is the sum of these arrays weighted by thicknesses, so changing a thickness does not evaluate any
+    material again. Reflection or transmission curves (e.g. from `scilightcon.datasets`) contribute to the
+    spectral amplitude and are resampled onto the grid once.
+
+    Examples:
+        >>> import numpy as np
+        >>> from scilightcon.optics import OpticalStack
+        >>> from scilightcon.utils import c
+        >>> omega = 2 * np.pi * c / np.linspace(0.99e-3, 1.07e-3, 5)
+        >>> stack = OpticalStack(omega)
+        >>> window = stack.add_material('fused_silica', 5.0)
+        >>> crystal = stack.add_material('BBO', 2.0, ray='e')
+        >>> phase, gd, gdd, tod = stack.get_dispersion()
+        >>> gdd.shape
+        (5,)
+        >>> stack.set_thickness(window, 10.0)
+
+    Args:
+        omega (ndarray): Angular frequency grid in rad/fs
+    """
+
+    def __init__(self, omega: np.ndarray):
+        self.omega = np.asarray(omega, dtype=np.float64)
+        self.wl = 2.0 * math.pi * c / self.omega * 1.0e3
+        self._elements = []
+        self._stacked_elements = None
+        self._thicknesses = []
+        self._curves = []
+
+    def add_material(self, material: Union[str, Material], thickness: float, ray = 'o') -> int:
+        """Adds a slab of material.
+
+        Args:
+            material (str or Material): Material or its name, chemformula or alias
+            thickness (float): Thickness in millimeters
+            ray (str): `o` for ordinary, `e` for extraordinary, `z` for the third principal axis of biaxial crystals
+
+        Returns:
+            Index of the element, used by `set_thickness()`
+        """
+        if isinstance(material, str):
+            material = load_material(material)
+        n, gd, gvd, tod = material.get_dispersion(self.wl, orders=(0, 1, 2, 3), ray=ray)
+        # spectral phase k(omega) and its derivatives per millimeter
+        self._elements.append(np.array([n * self.omega / c, gd, gvd, tod]))
+        self._stacked_elements = None
+        self._thicknesses.append(float(thickness))
+        return len(self._elements) - 1
+
+    def add_curve(self, wl: np.ndarray, values: np.ndarray, percent: bool = True, bounces: int = 1) -> None:
+        """Adds a reflection or transmission curve, such as a mirror or a filter, applied `bounces` times.
+
+        Examples:
+            >>> import numpy as np
+            >>> from scilightcon.optics import OpticalStack
+            >>> from scilightcon.datasets import load_EKSMA_OPTICS_mirror_reflections
+            >>> from scilightcon.utils import c
+            >>> stack = OpticalStack(2 * np.pi * c / np.linspace(0.99e-3, 1.07e-3, 5))
+            >>> data, header = load_EKSMA_OPTICS_mirror_reflections('Ag')
+            >>> stack.add_curve(data[:, 0] / 1e3, data[:, 1], bounces=4)
+            >>> bool(np.all(stack.get_transmission() < 1))
+            True
+
+        Args:
+            wl (ndarray): Wavelength in micrometers
+            values (ndarray): Reflection or transmission
+            percent (bool): Whether `values` are given in percent rather than as a fraction
+            bounces (int): Number of passes
+        """
+        order = np.argsort(wl)
+        curve = np.interp(self.wl, np.asarray(wl, dtype=np.float64)[order], np.asarray(values, dtype=np.float64)[order])
+        self._curves.append((curve / 100.0 if percent else curve) ** bounces)
+
+    def set_thickness(self, index: int, thickness: float) -> None:
+        """Changes thickness of the element `index` in millimeters"""
+        self._thicknesses[index] = float(thickness)
+
+    @property
+    def thicknesses(self) -> Tuple[float, ...]:
+        """Thicknesses of the material elements in millimeters"""
+        return tuple(self._thicknesses)
+
+    def get_element_dispersion(self, index: int) -> List[np.ndarray]:
+        """Spectral phase of the element `index` and its derivatives per millimeter of thickness.
+
+        Returns:
+            A list of spectral phase (rad/mm), GD (fs/mm), GDD (fs^2/mm) and TOD (fs^3/mm) arrays
+        """
+        return list(self._elements[index])
+
+    def get_dispersion(self) -> List[np.ndarray]:
+        """Computes the spectral phase of the stack and its derivatives over the frequency grid.
+
+        Returns:
+            A list of spectral phase (rad), GD (fs), GDD (fs^2) and TOD (fs^3) arrays
+        """
+        if not self._elements:
+            return [np.zeros_like(self.omega) for _ in range(4)]
+        if self._stacked_elements is None:
+            self._stacked_elements = np.array(self._elements)
+        return list(np.tensordot(np.array(self._thicknesses), self._stacked_elements, axes=1))
+
+    def get_phase(self) -> np.ndarray:
+        """Spectral phase of the stack in radians"""
+        return self.get_dispersion()[0]
+
+    def get_GD(self) -> np.ndarray:
+        """Group delay of the stack in fs"""
+        return self.get_dispersion()[1]
+
+    def get_GDD(self) -> np.ndarray:
+        """Group delay dispersion of the stack in fs^2"""
+        return self.get_dispersion()[2]
+
+    def get_TOD(self) -> np.ndarray:
+        """Third-order dispersion of the stack in fs^3"""
+        return self.get_dispersion()[3]
+
+    def get_transmission(self) -> np.ndarray:
+        """Product of all reflection and transmission curves as a fraction"""
+        transmission = np.ones_like(self.omega)
+        for curve in self._curves:
+            transmission = transmission * curve
+        return transmission
@@ -0,0 +1,101 @@
+from typing import Callable, List, Tuple, Union
+import numpy as np
+
+# polynomial degrees tried in turn, each up to its largest number of pieces: cubic pieces are the cheapest to
+# evaluate, the higher degree reaches small tolerances over wide wavelength ranges
+TABLE_SCHEMES = ((3, 2**12), (6, 2**16))
+
+class DispersionTable:
+    """Piecewise polynomial approximation of material dispersion over a fixed wavelength range, built by `Material.tabulate()`.
+
+    The range is split into pieces of equal width, so a wavelength is mapped to its piece in constant time and
+    every quantity is evaluated with a single polynomial of the lowest degree in `TABLE_SCHEMES` that reaches the
+    tolerance. The table holds only numpy arrays, so it can be pickled and sent to other processes.
+
+    Examples:
+        >>> from scilightcon.optics import load_material
+        >>> zinc_oxide = load_material('Zinc oxide')
+        >>> table = zinc_oxide.tabulate(1.0, 2.0, tol=1e-10, orders=(0, 2))
+        >>> n, gvd = table.evaluate(1.03)
+        >>> round(float(n), 8)
+        1.94174665
+        >>> round(float(gvd), 4)
+        283.0383
+    """
+
+    def __init__(self, wl_min: float, wl_max: float, orders: Tuple[int, ...], coefficients: np.ndarray):
+        self.wl_min = wl_min
+        self.wl_max = wl_max
+        self.orders = tuple(orders)
+        self.coefficients = coefficients
+
+    @property
+    def n_pieces(self) -> int:
+        """Number of polynomial pieces"""
+        return self.coefficients.shape[2]
+
+    @property
+    def degree(self) -> int:
+        """Degree of the polynomial of every piece"""
+        return self.coefficients.shape[1] - 1
+
+    def evaluate(self, wl: Union[float, np.ndarray]) -> List[np.ndarray]:
+        """Evaluates the tabulated quantities.
+
+        Args:
+            wl (float or ndarray): Wavelength in micrometers, a scalar or an array of any shape within the tabulated range
+
+        Returns:
+            A list of tabulated quantities in the order of `orders`, each of the same shape as `wl`
+        """
+        wl = np.asarray(wl, dtype=np.float64)
+        if wl.size and not (self.wl_min <= wl.min() and wl.max() <= self.wl_max):
+            raise ValueError(f"The wavelength should be in range between {self.wl_min} and {self.wl_max}")
+
+        return _evaluate_pieces(self.coefficients, self.wl_min, self.wl_max, wl)
+
+def _build_table(function: Callable, n_quantities: int, wl_min: float, wl_max: float, tol: float) -> np.ndarray:
+    """Doubles the number of pieces until the polynomial interpolants at Chebyshev nodes of every quantity
+    returned by `function` deviate from it by less than `tol` times its largest magnitude, trying the degrees of
+    `TABLE_SCHEMES` in turn. Returns polynomial coefficients, highest power first, in the local variable `t` in
+    [0, 1] of every piece with a shape (n_quantities, degree + 1, n_pieces)."""
+    for degree, max_pieces in TABLE_SCHEMES:
+        nodes = np.cos(np.pi * (np.arange(degree + 1) + 0.5) / (degree + 1))
+        fit = np.linalg.inv(np.vander(0.5 * (nodes + 1.0), degree + 1))
+        test_points = np.linspace(-1.0, 1.0, 4 * (degree + 1))
+
+        n_pieces = 1
+        while n_pieces <= max_pieces:
+            width = (wl_max - wl_min) / n_pieces
+            centers = wl_min + width * (np.arange(n_pieces) + 0.5)
+
+            values = np.array(function(centers + 0.5 * width * nodes[:, np.newaxis]))
+            coefficients = np.einsum('kj,qjp->qkp', fit, values.reshape(n_quantities, degree + 1, n_pieces))
+
+            wl_test = np.clip(centers + 0.5 * width * test_points[:, np.newaxis], wl_min, wl_max)
+            exact = function(wl_test)
+            approximate = _evaluate_pieces(coefficients, wl_min, wl_max, wl_test)
+            if all(np.max(np.abs(a - e)) <= tol * np.max(np.abs(e)) for a, e in zip(approximate, exact)):
+                return coefficients
+            n_pieces *= 2
+
+    raise ValueError(f"Tolerance {tol} can not be reached with {TABLE_SCHEMES[-1][1]} pieces")
+
+def _evaluate_pieces(coefficients: np.ndarray, wl_min: float, wl_max: float, wl: np.ndarray) -> List[np.ndarray]:
+    n_pieces = coefficients.shape[2]
+    t = np.subtract(wl, wl_min, out=np.empty_like(wl))
+    t *= n_pieces / (wl_max - wl_min)
+    index = t.astype(np.intp)
+    np.minimum(index, n_pieces - 1, out=index)
+    t -= index
+
+    # Horner's scheme, the indices are already in range, so `take` can skip its bounds check
+    results = []
+    term = np.empty_like(t)
+    for quantity in coefficients:
+        result = quantity[0].take(index, mode='wrap')
+        for k in range(1, quantity.shape[0]):
+            result *= t
+            result += quantity[k].take(index, out=term, mode='wrap')
+        results.append(result)
+    return results
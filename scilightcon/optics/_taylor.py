@@ -0,0 +1,79 @@
+"""Truncated Taylor series arithmetic
+
+A series is a list `[f_0, f_1, ..., f_K]` of normalized Taylor coefficients `f_k = f^(k) / k!` (arrays of
+the same shape) of a function around the evaluation point. Propagating series through the arithmetic
+below gives derivatives of any order `K` of the result, at the cost of `O(K^2)` operations per product.
+"""
+import math
+from typing import List
+import numpy as np
+
+Series = List[np.ndarray]
+
+def _constant(value, like: np.ndarray, order: int) -> Series:
+    zero = 0.0 if isinstance(like, float) else np.zeros_like(like)
+    return [value + zero] + [zero] * order
+
+def _power(x: np.ndarray, p: float, order: int) -> Series:
+    """Series of `x^p` around `x`"""
+    series = [x ** p]
+    if order > 0:
+        inv_x = 1.0 / x
+    for k in range(1, order + 1):
+        series.append(series[-1] * inv_x * ((p - k + 1) / k))
+    return series
+
+def _add(a: Series, b: Series) -> Series:
+    return [x + y for x, y in zip(a, b)]
+
+def _scale(a: Series, c: float) -> Series:
+    return [c * x for x in a]
+
+def _shift(a: Series, c: float) -> Series:
+    return [a[0] + c] + a[1:]
+
+def _dot(a: Series, b: Series) -> np.ndarray:
+    """Sum of products `a[i] * b[i]` accumulated in place"""
+    result = a[0] * b[0]
+    for x, y in zip(a[1:], b[1:]):
+        product = x * y
+        try:
+            result += product
+        except ValueError:
+            # the product broadcasts to a larger shape
+            result = result + product
+    return result
+
+def _mul(a: Series, b: Series) -> Series:
+    return [_dot(a[:k + 1], b[k::-1]) for k in range(len(a))]
+
+def _inv(a: Series) -> Series:
+    h = 1.0 / a[0]
+    result = [h]
+    for k in range(1, len(a)):
+        term = _dot(a[1:k + 1], result[k - 1::-1])
+        term *= -h
+        result.append(term)
+    return result
+
+def _sqrt(a: Series) -> Series:
+    s = math.sqrt(a[0]) if isinstance(a[0], float) and a[0] >= 0.0 else np.sqrt(a[0])
+    h = 0.5 / s
+    result = [s]
+    for k in range(1, len(a)):
+        term = a[k] - _dot(result[1:k], result[k - 1:0:-1]) if k > 1 else a[k]
+        result.append(h * term)
+    return result
+
+def _compose(outer: Series, inner: Series) -> Series:
+    """Series of `f(g)` from the series of `f` around `g_0` and the series of `g`"""
+    delta = [np.zeros_like(inner[0])] + inner[1:]
+    result = _constant(0.0, inner[0], len(inner) - 1)
+    result[0] = outer[-1] + result[0]
+    for coefficient in reversed(outer[:-1]):
+        result = _shift(_mul(result, delta), coefficient)
+    return result
+
+def _to_derivatives(a: Series) -> Series:
+    """Converts normalized Taylor coefficients to derivatives `[f, f', f'', ...]`"""
+    return [math.factorial(k) * x for k, x in enumerate(a)]
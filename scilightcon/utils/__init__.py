@@ -1,13 +1,34 @@
 """A set of useful functions"""
 
-from ._interpolate_and_multiply import interpolate_and_multiply
+import importlib
+from typing import TYPE_CHECKING
 from ._constants import c
-from ._analyze_s2_data import load_s2s_data, ShotToShotData, ShotToShotOutlier
+
+if TYPE_CHECKING:
+    from ._interpolate_and_multiply import interpolate_and_multiply, evaluate_spectral_chain
+    from ._analyze_s2_data import load_s2s_data, ShotToShotData, ShotToShotOutlier
+
+_LAZY_ATTRIBUTES = {
+    "interpolate_and_multiply": "._interpolate_and_multiply",
+    "evaluate_spectral_chain": "._interpolate_and_multiply",
+    "load_s2s_data": "._analyze_s2_data",
+    "ShotToShotData": "._analyze_s2_data",
+    "ShotToShotOutlier": "._analyze_s2_data",
+}
 
 __all__ = [
     "interpolate_and_multiply",
+    "evaluate_spectral_chain",
     "load_s2s_data",
     "c",
     "ShotToShotData",
     "ShotToShotOutlier",
-    ] 
\ No newline at end of file
+    ]
+
+def __getattr__(name):
+    # scipy and matplotlib backed helpers are imported on first access
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
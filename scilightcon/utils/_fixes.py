@@ -1,5 +1,7 @@
 """Compatibility fixes for older version of python"""
 import sys
+import importlib
+import pathlib
 from importlib import resources
 
 def _open_binary(data_module, data_file_name):    
@@ -18,4 +20,12 @@ def _get_path(data_module, data_file_name):
     if sys.version_info >= (3, 9):
         return resources.files(data_module).joinpath(data_file_name)
     else:
-        return resources.path(data_module, data_file_name)
\ No newline at end of file
+        # resources.path() is a context manager, the data files of a package installed as a directory are used in place
+        module = importlib.import_module(data_module) if isinstance(data_module, str) else data_module
+        return pathlib.Path(module.__file__).parent / data_file_name
+
+def _list_files(data_module):
+    if sys.version_info >= (3, 9):
+        return sorted(entry.name for entry in resources.files(data_module).iterdir() if entry.is_file())
+    else:
+        return sorted(name for name in resources.contents(data_module) if resources.is_resource(data_module, name))
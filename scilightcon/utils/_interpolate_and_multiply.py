@@ -1,15 +1,16 @@
-from scipy.interpolate import interp1d
 import numpy as np
-from typing import Tuple, List
+from typing import Sequence, Tuple, List, Union
 
 def interpolate_and_multiply(
-        D1: Tuple[List[float], List[float]], 
+        D1: Tuple[List[float], List[float]],
         D2: Tuple[List[float], List[float]]) -> Tuple[List[float], List[float]] :
     """Takes D2 array and interpolates x an y with respect to array from D1. Then takes an array form D2 and adujsts its range according to D1
     and multiplies two arrays.
 
+    See `evaluate_spectral_chain()` for any number of curves and batches of chains.
+
     Args:
-        D1 (tuple): An array to which respect anoter array is interpolated 
+        D1 (tuple): An array to which respect anoter array is interpolated
         D2 (tuple): An array which x and y values are interpolated
 
     Returns:
@@ -18,18 +19,78 @@ def interpolate_and_multiply(
 
     #interpolates D2 values according to D1 and selecting the range
 
-    x2 = D2[0]
-    y2 = D2[1]
-    interpolated_function = interp1d(x2, y2, bounds_error = False, fill_value = None)
-
-    x1 = D1[0]
-    y1 = D1[1] 
-    y2_interpolated = interpolated_function(x1)
+    x1 = np.asarray(D1[0], dtype=np.float64)
+    y1 = np.asarray(D1[1], dtype=np.float64)
+    y2_interpolated = _interpolate(x1, D2[0], D2[1], np.nan)
 
     y3 = y1 * y2_interpolated
 
     valid_indices = ~np.isnan(y3)
 
-    D3 = (list(np.array(x1)[valid_indices]), list(np.array(y3)[valid_indices]))
+    D3 = (list(x1[valid_indices]), list(y3[valid_indices]))
 
     return D3
+
+def evaluate_spectral_chain(
+        wl: np.ndarray,
+        curves: Sequence[Tuple[Sequence[float], Sequence[float]]],
+        counts: Union[None, Sequence[int], np.ndarray] = None,
+        percent: Union[bool, Sequence[bool]] = False,
+        fill_value: float = np.nan) -> np.ndarray:
+    """Multiplies transmission and reflection curves of an optical path (filters, mirrors, atmosphere, detector QE) on a
+    common wavelength grid.
+
+    Every curve is linearly interpolated onto `wl` once. `counts` gives how many times each curve enters the chain,
+    e.g. the number of bounces off a mirror, and a 2D `counts` evaluates a batch of chains, one per row, with one
+    array operation per curve, so many permutations of an optical path can be compared at once.
+
+    Examples:
+        >>> import numpy as np
+        >>> from scilightcon.utils import evaluate_spectral_chain
+        >>> wl = np.array([400.0, 500.0, 600.0])
+        >>> mirror = ([300.0, 700.0], [90.0, 98.0])
+        >>> longpass = ([300.0, 450.0, 550.0, 700.0], [0.0, 0.0, 1.0, 1.0])
+        >>> evaluate_spectral_chain(wl, [mirror, longpass], [2, 1], percent=[True, False]).round(4)
+        array([0.    , 0.4418, 0.9216])
+        >>> evaluate_spectral_chain(wl, [mirror, longpass], [[1, 0], [3, 1]], percent=[True, False]).shape
+        (2, 3)
+
+    Args:
+        wl (ndarray): Wavelength grid of any shape, in the units of the curves
+        curves (list): Curves as tuples (x, y), `x` need not be sorted
+        counts (list or ndarray): Non-negative integer number of passes through each curve, shape (n_curves,) for one chain
+            or (n_chains, n_curves) for a batch, each curve once if `None`
+        percent (bool or list): Whether the values of all or of each curve are in percent rather than fractions
+        fill_value (float): Value of a curve outside its wavelength range, as a fraction
+
+    Returns:
+        Product of the curves as a fraction, of the shape of `wl` for one chain or (n_chains, *wl.shape) for a batch
+    """
+    wl = np.asarray(wl, dtype=np.float64)
+    n_curves = len(curves)
+    counts = np.ones(n_curves, dtype=np.int64) if counts is None else np.asarray(counts)
+    if counts.ndim not in (1, 2) or counts.shape[-1] != n_curves:
+        raise ValueError("counts should have a column per curve")
+    if np.any(counts < 0) or (not np.issubdtype(counts.dtype, np.integer) and not np.all(np.mod(counts, 1) == 0)):
+        raise ValueError("counts should be non-negative integers")
+    scales = np.where(np.broadcast_to(percent, (n_curves,)), 0.01, 1.0)
+
+    matrix = np.empty((n_curves, wl.size))
+    for row, curve, scale in zip(matrix, curves, scales):
+        row[:] = _interpolate(wl.ravel(), curve[0], np.asarray(curve[1], dtype=np.float64) * scale, fill_value)
+
+    # exact products of integer powers, a curve with zero count is a factor of one even where it is nan or infinite
+    chains = np.atleast_2d(counts).astype(np.int64)
+    product = np.ones((len(chains), wl.size))
+    for row, column in zip(matrix, chains.T):
+        product *= row ** column[:, np.newaxis]
+
+    return product.reshape(chains.shape[:1] + wl.shape) if counts.ndim == 2 else product.reshape(wl.shape)
+
+def _interpolate(x: np.ndarray, xp: Sequence[float], fp: Sequence[float], fill_value: float) -> np.ndarray:
+    xp = np.asarray(xp, dtype=np.float64)
+    fp = np.asarray(fp, dtype=np.float64)
+    if np.any(xp[1:] < xp[:-1]):
+        order = np.argsort(xp, kind='stable')
+        xp, fp = xp[order], fp[order]
+    return np.interp(x, xp, fp, left=fill_value, right=fill_value)
@@ -0,0 +1,35 @@
+import pytest
+import numpy as np
+from scilightcon.fitting import calibrate_wavelength
+from scilightcon.optics import get_Ar_spectrum
+
+def test_calibrate_wavelength():
+    pixels = np.arange(2048)
+    offsets = np.array([0.0, 0.2, -0.3, 0.4])[:, np.newaxis]
+    wl_true = 650.0 + offsets + (0.15 + 5e-5 * offsets) * pixels - 3e-6 * pixels**2
+    wl_guess = 650.2 + 0.15 * pixels - 3e-6 * pixels**2
+    spectra = get_Ar_spectrum(wl_true, 0.3) + np.random.default_rng(0).normal(0.0, 1.0, wl_true.shape)
+
+    # a spurious peak 0.3 nm from the weak 735.33 nm line of the last spectrum
+    spectra[3] += 500.0 * np.exp(-(wl_true[3] - 735.63)**2 / (2 * 0.3**2))
+
+    # 1 - a batch of spectra is calibrated in one call
+    result = calibrate_wavelength(spectra, wl_guess, lines='Ar', degree=2)
+    assert (result['wavelength'].shape == (4, 2048))
+    assert (np.max(np.abs(result['wavelength'] - wl_true)) < 0.02)
+    assert (np.all(result['n_matched'] >= 15))
+    assert (np.allclose([np.polyval(c, pixels) for c in result['coefficients']], result['wavelength']))
+
+    # 2 - the spurious peak is rejected
+    spurious = np.nanargmin(np.abs(np.interp(result['peaks'][3], pixels, wl_true[3]) - 735.63))
+    assert (np.isnan(result['matched_lines'][3, spurious]))
+
+    # 3 - a single spectrum and explicit reference lines
+    lines = result['matched_lines'][0][~np.isnan(result['matched_lines'][0])]
+    single = calibrate_wavelength(spectra[0], wl_guess, lines=lines, degree=2)
+    assert (single['wavelength'].shape == (2048,))
+    assert (np.allclose(single['wavelength'], result['wavelength'][0]))
+
+    # 4 - raises ValueError for an unknown lamp
+    with pytest.raises(ValueError):
+        calibrate_wavelength(spectra, wl_guess, lines='Ne')
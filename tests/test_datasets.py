@@ -35,6 +35,51 @@ def test_load_csv_data():
         except FileNotFoundError:
             raise ValueError
         
+def test_load_lamp_spectrum():
+    from scilightcon.datasets import load_csv_data, load_lamp_spectrum
+
+    for lamp, file_name in [('Hg', 'Hg_lines.csv'), ('Ar', 'Ar_lines.csv'), ('White_LED', 'White_LED_spectrum.csv')]:
+        wl, intensity = load_lamp_spectrum(lamp)
+        data, _ = load_csv_data(file_name)
+        assert (np.all(np.diff(wl) >= 0) and not wl.flags.writeable and not intensity.flags.writeable)
+        assert (np.array_equal(np.sort(data[:, 0]), wl) and np.isclose(np.sum(intensity), np.sum(data[:, 1])))
+        assert (load_lamp_spectrum(lamp)[0] is wl)
+
+    with pytest.raises(ValueError):
+        load_lamp_spectrum('Ne')
+
+def test_read_csv_file(tmp_path, monkeypatch):
+    from scilightcon.datasets import _base
+
+    path = tmp_path / 'data.csv'
+    values = np.arange(3000, dtype=np.float64).reshape(1000, 3) / 7
+    with open(path, 'w') as f:
+        f.write('# Wavelength (nm), Signal, Reference\n#second comment line\n')
+        np.savetxt(f, values, delimiter=', ')
+
+    # 1 - header and data, also when the file is parsed in many chunks
+    data, header = _base._read_csv_file(path)
+    assert (header == ['Wavelength (nm)', 'Signal', 'Reference'])
+    assert (np.array_equal(data, values))
+    monkeypatch.setattr(_base, 'CSV_CHUNK_SIZE', 100)
+    data, header = _base._read_csv_file(path)
+    assert (data.shape == (1000, 3) and np.array_equal(data, values))
+
+    # 2 - data type and column selection
+    data, header = _base._read_csv_file(path, dtype=np.float32, usecols=[2, 0])
+    assert (data.dtype == np.float32 and header == ['Reference', 'Wavelength (nm)'])
+    assert (np.allclose(data, values[:, [2, 0]]))
+
+    # 3 - files without a header or without data
+    with open(path, 'w') as f:
+        f.write('1.0, 2.0\n3.0, 4.0\n')
+    data, header = _base._read_csv_file(path)
+    assert (header == ['', ''] and np.array_equal(data, [[1.0, 2.0], [3.0, 4.0]]))
+    with open(path, 'w') as f:
+        f.write('# Wavelength (nm), Signal\n')
+    data, header = _base._read_csv_file(path)
+    assert (data.shape == (0, 2) and header == ['Wavelength (nm)', 'Signal'])
+
 def test_load_zipped_csv_data():
 
     actual_data, actual_header = scilightcon.datasets.load_zipped_csv_data('data_test_detect_peaks.csv.gz')
@@ -51,6 +96,73 @@ def test_load_zipped_csv_data():
         except FileNotFoundError:
             raise ValueError
 
+def test_load_compressed_csv_data(tmp_path):
+    import bz2
+    import gzip
+    import lzma
+    from scilightcon.utils._fixes import _open_binary
+    from scilightcon.datasets import _base, load_csv_data, DATA_MODULE
+
+    # 1 - gzip, bzip2 and xz files, and uncompressed ones, are parsed from the decompression stream
+    target_data, target_header = load_csv_data('data_test_detect_peaks.csv')
+    with _open_binary(DATA_MODULE, 'data_test_detect_peaks.csv') as f:
+        raw = f.read()
+    for extension, compress in [('gz', gzip.compress), ('bz2', bz2.compress), ('xz', lzma.compress), ('txt', bytes)]:
+        path = tmp_path / ('data.csv.' + extension)
+        path.write_bytes(compress(raw))
+        with open(path, 'rb') as compressed_file:
+            with _base._open_decompressed_text(compressed_file) as csv_stream:
+                data, header = _base._read_csv_stream(csv_stream)
+        assert (header == target_header)
+        assert (np.array_equal(data, target_data))
+
+    # 2 - data_module is honored
+    data, header = load_zipped_csv_data('data_test_detect_peaks.csv.gz', data_module=DATA_MODULE, usecols=[1])
+    assert (np.array_equal(data[:, 0], target_data[:, 1]))
+    with pytest.raises(FileNotFoundError):
+        load_zipped_csv_data('data_test_detect_peaks.csv.gz', data_module='scilightcon.datasets.data.EO')
+
+def test_dataset_cache(tmp_path, monkeypatch):
+    import json
+    from scilightcon.datasets import _base, load_THORLABS_filter_transmissions, set_dataset_cache_dir
+
+    # 1 - parsed datasets are shared read-only arrays
+    data, header = load_THORLABS_filter_transmissions('FEL0500')
+    again, header_again = load_THORLABS_filter_transmissions('FEL0500')
+    assert (again is data)
+    with pytest.raises(ValueError):
+        data[0, 0] = 0.0
+    header.append('changed')
+    assert (header_again == load_THORLABS_filter_transmissions('FEL0500')[1] == ['Wavelength  (nm)', 'Transmission (%)'])
+
+    # 2 - binary copies are written on first load and used by later loads
+    monkeypatch.setattr(_base, '_dataset_cache_dir', None)
+    set_dataset_cache_dir(tmp_path / 'cache')
+    _base._load_cached_csv_data.cache_clear()
+    target, _ = load_THORLABS_filter_transmissions('FEL0500')
+    data_path, meta_path = _base._get_sidecar_paths(_base.DATA_MODULE_THORLABS, 'transmission_THORLABS_FEL0500.csv')
+    assert (np.array_equal(np.load(data_path), target))
+
+    def fail(*args, **kwargs):
+        raise AssertionError('csv file parsed')
+    monkeypatch.setattr(_base, '_read_csv_file', fail)
+    _base._load_cached_csv_data.cache_clear()
+    data, header = load_THORLABS_filter_transmissions('FEL0500')
+    assert (np.array_equal(data, target) and not data.flags.writeable)
+    assert (header == ['Wavelength  (nm)', 'Transmission (%)'])
+
+    # 3 - binary copies of changed sources are not used
+    with open(meta_path) as f:
+        meta = json.load(f)
+    meta['mtime_ns'] += 1
+    meta['sha256'] = '0' * 64
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f)
+    _base._load_cached_csv_data.cache_clear()
+    with pytest.raises(AssertionError):
+        load_THORLABS_filter_transmissions('FEL0500')
+    _base._load_cached_csv_data.cache_clear()
+
 def load_EO_filter_transmissions():
     from scilightcon.datasets import load_EO_filter_transmissions
 
@@ -92,3 +204,88 @@ def load_atmospheric_data():
             _,_ = load_atmospheric_data('Other')
         except FileNotFoundError:
             raise ValueError
+
+def test_materials_store(tmp_path):
+    import pickle
+    from scilightcon.utils._fixes import _open_binary
+    from scilightcon.datasets._base import DATA_MODULE, MATERIALS_PICKLE_FILENAME
+    from scilightcon.datasets._materials_store import MaterialsStore, save_materials_store, load_materials_store
+
+    with _open_binary(DATA_MODULE, MATERIALS_PICKLE_FILENAME) as f:
+        materials = pickle.load(f)
+
+    # 1 - the bundled store is used and matches the pickle
+    store = scilightcon.datasets._materials
+    assert (isinstance(store, MaterialsStore))
+    assert (list(store) == list(materials))
+    for key in materials:
+        for actual, target in zip(store[key]['Parameters'], materials[key]['Parameters']):
+            assert (actual.keys() == target.keys())
+            for field in target:
+                if isinstance(actual[field], np.ndarray):
+                    assert (np.array_equal(actual[field], np.asarray(target[field], dtype=float)))
+                else:
+                    assert (actual[field] == target[field])
+        assert ({field: store[key][field] for field in materials[key] if field != 'Parameters'} ==
+                {field: materials[key][field] for field in materials[key] if field != 'Parameters'})
+
+    # 2 - numeric fields are read-only views
+    data_n = store['AMTIR']['Parameters'][0]['DataN']
+    assert (not data_n.flags.writeable)
+    with pytest.raises(ValueError):
+        data_n[0] = 0.0
+
+    # 3 - round trip of a subset
+    path = str(tmp_path / 'materials.npz')
+    save_materials_store({key: materials[key] for key in ['SF5', 'AMTIR', 'LiNbO3']}, path)
+    subset = load_materials_store(path)
+    assert (list(subset) == ['SF5', 'AMTIR', 'LiNbO3'])
+    assert (np.array_equal(subset['LiNbO3']['Parameters'][1]['YC'], materials['LiNbO3']['Parameters'][1]['YC']))
+    assert (subset['SF5']['Parameters'][0]['DataN'] is None)
+
+def test_get_path_before_python_3_9(monkeypatch):
+    import types
+    from scilightcon.utils import _fixes
+    from scilightcon.datasets import _base
+
+    # data files resolve to paths on disk also where importlib.resources has no files()
+    monkeypatch.setattr(_fixes, 'sys', types.SimpleNamespace(version_info=(3, 8)))
+    path = _fixes._get_path(_base.DATA_MODULE, _base.MATERIALS_STORE_FILENAME)
+    assert (path.is_file())
+    assert (list(_base.load_materials()) == list(scilightcon.datasets._materials))
+    data, header = _base.load_csv_data('Hg_lines.csv')
+    assert (data.shape == (25, 2))
+
+def test_optical_curves():
+    from scilightcon.datasets import list_optical_curves, load_optical_curves, load_THORLABS_filter_transmissions
+
+    # 1 - every bundled filter and mirror is listed with its type
+    curves = list_optical_curves()
+    assert (len(list_optical_curves(vendor='THORLABS')) == 79)
+    assert (len(list_optical_curves(vendor='EO')) == 12)
+    assert (len(list_optical_curves(quantity='reflection')) == 5)
+    assert (all(entry['type'] is not None for entry in curves))
+    entry = [entry for entry in curves if entry['name'] == 'DMLP425'][0]
+    assert (entry['vendor'] == 'THORLABS' and entry['type'] == 'dichroic longpass' and entry['wavelength'] == 425.0)
+
+    # 2 - rows are the loader data interpolated onto the grid, as fractions
+    wl = np.linspace(200.0, 3000.0, 2801)
+    matrix, loaded = load_optical_curves(wl, ['DMLP425', entry])
+    assert (matrix.shape == (2, 2801))
+    assert ([entry['name'] for entry in loaded] == ['DMLP425', 'DMLP425'])
+    data, _ = load_THORLABS_filter_transmissions('DMLP425')
+    inside = (wl >= data[:, 0].min()) & (wl <= data[:, 0].max())
+    order = np.argsort(data[:, 0])
+    assert (np.allclose(matrix[0, inside], np.interp(wl[inside], data[order, 0], data[order, 1]) / 100.0))
+    assert (np.all(np.isnan(matrix[0, ~inside])))
+    assert (np.array_equal(matrix[0], matrix[1], equal_nan=True))
+
+    # 3 - percent, fill value and grids of any shape
+    percent, _ = load_optical_curves(wl.reshape(2801, 1), ['DMLP425'], percent=True, fill_value=0.0)
+    assert (percent.shape == (1, 2801, 1))
+    assert (np.allclose(percent.ravel(), np.nan_to_num(matrix[0]) * 100.0))
+
+    # 4 - all curves by default, unknown names raise
+    assert (load_optical_curves(wl)[0].shape == (len(curves), 2801))
+    with pytest.raises(ValueError):
+        load_optical_curves(wl, ['FEL9999'])
@@ -0,0 +1,43 @@
+import subprocess
+import sys
+import json
+
+# `import scilightcon` should stay cheap for short-lived workers, the measured time is well below this budget
+IMPORT_TIME_BUDGET = 0.5 # s
+
+def _run_isolated(code):
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    return json.loads(output)
+
+def test_import_time():
+    code = (
+        "import json, sys, time\n"
+        "t = time.perf_counter()\n"
+        "import scilightcon\n"
+        "t = time.perf_counter() - t\n"
+        "print(json.dumps({'time': t, 'modules': [m for m in ('matplotlib', 'scipy') if m in sys.modules]}))\n"
+    )
+
+    # the best of a few runs to reduce the noise of a busy machine
+    results = [_run_isolated(code) for _ in range(3)]
+    assert (min(result['time'] for result in results) < IMPORT_TIME_BUDGET)
+    assert (results[0]['modules'] == [])
+
+def test_lazy_materials():
+    code = (
+        "import json\n"
+        "import scilightcon.datasets\n"
+        "loaded_on_import = '_materials' in vars(scilightcon.datasets)\n"
+        "from scilightcon.optics import load_material\n"
+        "load_material('Zinc oxide')\n"
+        "print(json.dumps([loaded_on_import, '_materials' in vars(scilightcon.datasets)]))\n"
+    )
+
+    assert (_run_isolated(code) == [False, True])
+
+def test_lazy_subpackages():
+    import scilightcon
+
+    assert (scilightcon.optics.load_material is not None)
+    assert (scilightcon.utils.interpolate_and_multiply is not None)
+    assert (set(scilightcon.__all__) <= set(dir(scilightcon)))
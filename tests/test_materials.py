@@ -5,6 +5,7 @@ def test_materials():
     assert (len(scilightcon.datasets._materials) > 0)
 
 def test_GVD():
+    import numpy as np
     from scilightcon.optics import load_material
   
     # 1 - loads material and correct refractive index of ordinary and extraordinary beams
@@ -30,12 +31,12 @@ def test_GVD():
     # assert (abs(ri[0] - GVD for e beam) < 0.1)
      
  
-    # 4 - anisotropic medium by alias
+    # 4 - tabulated material
     fs = load_material('Pb')
-    with pytest.raises(ValueError):
-        fs.get_GVD(4.6)
+    assert (np.isfinite(fs.get_GVD(4.6)[0]))
 
 def test_TOD():
+    import numpy as np
     from scilightcon.optics import load_material
   
     # 1 - loads material and correct refractive index of ordinary and extraordinary beams
@@ -60,10 +61,9 @@ def test_TOD():
     # assert (len(ri) == 1)
     # assert (abs(ri[0] - TOD for e beam) < 0.1)
 
-    # 4 - anisotropic medium by alias
+    # 4 - tabulated material
     fs = load_material('Pb')
-    with pytest.raises(ValueError):
-        fs.get_GVD(4.6)
+    assert (np.isfinite(fs.get_TOD(4.6)[0]))
 
 def test_refractive_index():
     from scilightcon.optics import load_material
@@ -105,4 +105,618 @@ def test_refractive_index():
     assert (fs.get_refractive_index(1.03)[1] == None)
     assert (len(fs.get_refractive_index(1.03, ray='o')) == 1)
     with pytest.raises(ValueError):
-        fs.get_refractive_index(1.03, ray='e')
\ No newline at end of file
+        fs.get_refractive_index(1.03, ray='e')
+
+def test_refractive_index_array():
+    import numpy as np
+    from scilightcon.optics import load_material
+
+    zinc = load_material('Zinc oxide')
+    wl = np.linspace(1.0, 2.0, 12).reshape(3, 4)
+
+    # 1 - array input returns arrays of the same shape, equal to scalar evaluation
+    n_o, n_e = zinc.get_refractive_index(wl, ray='both')
+    assert (np.shape(n_o) == (3, 4))
+    assert (np.shape(n_e) == (3, 4))
+    assert (np.allclose(n_o.ravel(), [zinc.get_refractive_index(x, ray='o')[0] for x in wl.ravel()]))
+    assert (np.allclose(n_e.ravel(), [zinc.get_refractive_index(x, ray='e')[0] for x in wl.ravel()]))
+
+    # 2 - a single out-of-range wavelength raises ValueError
+    with pytest.raises(ValueError):
+        zinc.get_refractive_index(np.array([1.0, 4.1]))
+
+    # 3 - tabulated materials
+    amtir = load_material('AMTIR')
+    n, _ = amtir.get_refractive_index(np.array([1.0, 1.5]))
+    assert (np.allclose(n, [2.5977, 2.5466]))
+
+
+def test_find_materials():
+    from scilightcon.optics import load_material, list_materials, find_materials
+
+    # 1 - every listed material can be loaded by its key
+    keys = list_materials()
+    assert (len(keys) == len(scilightcon.datasets._materials))
+    for key in keys:
+        assert (load_material(key) is not None)
+
+    # 2 - lookup is case-insensitive by name, chemformula and alias
+    assert (load_material('ZINC OXIDE')._info is load_material('zno')._info)
+
+    # 3 - prefix and predicate search
+    assert ('ZnO' in find_materials('Zinc'))
+    assert (find_materials('whatever') == [])
+    glasses = find_materials(lambda info: info['Type'] == 'Glasses')
+    assert (len(glasses) > 0)
+    assert (all(scilightcon.datasets._materials[key]['Type'] == 'Glasses' for key in glasses))
+
+
+def test_dispersion_kernels():
+    import numpy as np
+    from scilightcon.optics import load_material
+    from scilightcon.optics._kernels import _BoundKernel
+
+    # 1 - derivatives of every formula-based material agree with finite differences
+    for key in scilightcon.datasets._materials:
+        material = load_material(key)
+        for parameter_index, kernel in enumerate(material._kernels):
+            if kernel.formula == 0:
+                continue
+            wl_range = material._parameters[parameter_index]["WlNRange"]
+            wl = np.array([(2 * wl_range[0] + wl_range[1]) / 3])
+            h = 1e-4 * wl
+            n, dn, d2n, d3n = kernel.evaluate(wl, 3)
+            steps = [kernel.evaluate(wl + i * h)[0] for i in range(-2, 3)]
+            assert (np.allclose(dn, (steps[3] - steps[1]) / (2 * h), rtol=1e-4, atol=1e-7))
+            assert (np.allclose(d2n, (steps[3] - 2 * steps[2] + steps[1]) / h**2, rtol=1e-3, atol=1e-5))
+
+    # 2 - terms with zero amplitude are skipped
+    assert (_BoundKernel(2, [0.0, 1.0, 0.01]).terms == [1])
+
+    # 3 - GVD and TOD
+    zinc = load_material('Zinc oxide')
+    assert (np.allclose(zinc.get_GVD(1.03), [283.0382719]))
+    assert (np.allclose(zinc.get_TOD(1.03), [264.18233337]))
+
+
+def test_get_dispersion():
+    import numpy as np
+    from scilightcon.optics import load_material
+    from scilightcon.utils import c
+
+    zinc = load_material('Zinc oxide')
+    wl = np.linspace(1.0, 2.0, 11)
+
+    # 1 - all quantities from a single call agree with the dedicated methods
+    n, gd, gvd, tod = zinc.get_dispersion(wl, ray='e')
+    assert (np.allclose(n, zinc.get_refractive_index(wl, ray='e')[0]))
+    assert (np.allclose(gvd, zinc.get_GVD(wl, ray='e')))
+    assert (np.allclose(tod, zinc.get_TOD(wl, ray='e')))
+    assert (zinc.get_GVD(wl).shape == zinc.get_TOD(wl).shape == (11,))
+    assert (zinc.get_GVD(1.03).shape == zinc.get_TOD(1.03).shape == (1,))
+
+    # 2 - group delay from the group index, n - wl * dn/dwl
+    h = 1e-5
+    dn = (zinc.get_refractive_index(wl + h, ray='e')[0] - zinc.get_refractive_index(wl - h, ray='e')[0]) / (2 * h)
+    assert (np.allclose(gd, (n - wl * dn) / c))
+
+    # 3 - requested order is preserved
+    tod_only, n_only = zinc.get_dispersion(1.03, orders=(3, 0))
+    assert (np.isclose(n_only, 1.9417466542383048))
+    assert (np.isclose(tod_only, 264.18233337))
+
+
+def test_higher_order_dispersion():
+    import math
+    import numpy as np
+    from scilightcon.optics import load_material
+    from scilightcon.optics._taylor import _power, _inv, _sqrt, _mul, _compose, _to_derivatives
+    from scilightcon.utils import c
+
+    # 1 - series arithmetic reproduces known derivatives
+    x = np.array([0.5, 2.0])
+    assert (np.allclose(_to_derivatives(_sqrt(_power(x, 2, 5)))[1], 1.0))
+    assert (np.allclose(_to_derivatives(_inv(_power(x, 1, 5)))[5], -120 / x**6))
+    assert (np.allclose(_mul(_power(x, 2, 4), _power(x, 3, 4))[4], _power(x, 5, 4)[4]))
+    assert (np.allclose(_compose(_power(x**2, 0.5, 3), _power(x, 2, 3))[3], 0.0))
+
+    # 2 - each order is the derivative of the previous one with respect to angular frequency
+    zinc = load_material('Zinc oxide')
+    wl = 1.03
+    omega = 2 * math.pi * c / (wl * 1e-3)
+    h = omega * 1e-4
+    wl_minus, wl_plus = 2 * math.pi * c / (omega - h) * 1e3, 2 * math.pi * c / (omega + h) * 1e3
+    orders = (1, 2, 3, 4, 5)
+    center = zinc.get_dispersion(wl, orders=orders)
+    minus = zinc.get_dispersion(wl_minus, orders=orders)
+    plus = zinc.get_dispersion(wl_plus, orders=orders)
+    for i in range(len(orders) - 1):
+        assert (np.isclose(center[i + 1], (plus[i] - minus[i]) / (2 * h), rtol=1e-6))
+
+
+def test_tabulated_dispersion():
+    import numpy as np
+    from scilightcon.optics import load_material
+
+    # 1 - interpolant passes through the tabulated data and is built once per axis
+    amtir = load_material('AMTIR')
+    parameter = amtir._info["Parameters"][0]
+    interpolant = amtir._kernels[0].interpolant
+    n, _ = amtir.get_refractive_index(np.asarray(parameter["DataNWl"]))
+    assert (np.allclose(n, parameter["DataN"]))
+    amtir.get_refractive_index(np.linspace(1.0, 14.0, 50))
+    assert (amtir._kernels[0].interpolant is interpolant)
+
+    # 2 - derivatives of the interpolant
+    wl = np.linspace(2.0, 12.0, 7)
+    n, gd, gvd, tod = amtir.get_dispersion(wl)
+    assert (np.allclose(gvd, interpolant(wl, 2) * wl**3 / (2 * np.pi * scilightcon.utils.c**2) * 1e-3))
+    assert (np.all(np.isfinite(tod)))
+
+    # 3 - no overshoot between sparse data points, the index stays within its neighbouring data values
+    for name in ['Se', 'Al', 'Cu', 'SrF2']:
+        parameter = load_material(name)._info["Parameters"][0]
+        wl_data, n_data = np.asarray(parameter["DataNWl"]), np.asarray(parameter["DataN"])
+        wl = 0.5 * (wl_data[1:] + wl_data[:-1])
+        n = load_material(name).get_refractive_index(wl, ray='o')[0]
+        assert (np.all(n >= np.minimum(n_data[1:], n_data[:-1]) - 1e-12))
+        assert (np.all(n <= np.maximum(n_data[1:], n_data[:-1]) + 1e-12))
+
+
+def test_tabulate():
+    import pickle
+    import numpy as np
+    from scilightcon.optics import load_material, DispersionTable
+
+    # 1 - table agrees with direct evaluation within the requested tolerance
+    bbo = load_material('BBO')
+    table = bbo.tabulate(0.5, 2.0, tol=1e-10, ray='e')
+    assert (isinstance(table, DispersionTable))
+    assert (table.degree == 3)
+    wl = np.random.default_rng(0).uniform(0.5, 2.0, (100, 10))
+    for approximate, exact in zip(table.evaluate(wl), bbo.get_dispersion(wl, ray='e')):
+        assert (approximate.shape == wl.shape)
+        assert (np.max(np.abs(approximate - exact)) < 1e-9 * np.max(np.abs(exact)))
+
+    # 2 - table survives pickling
+    restored = pickle.loads(pickle.dumps(table))
+    assert (np.allclose(restored.evaluate(wl)[2], table.evaluate(wl)[2]))
+
+    # 3 - wavelengths outside of the tabulated range
+    with pytest.raises(ValueError):
+        table.evaluate(2.5)
+
+
+def test_evaluate_catalog():
+    import numpy as np
+    from scilightcon.optics import evaluate_catalog, load_material, list_materials
+
+    # 1 - whole catalog agrees with per-material evaluation, out of range values are nan
+    wl = np.linspace(0.4, 3.0, 27)
+    gvd = evaluate_catalog(None, wl, 'GVD')
+    keys = list_materials()
+    assert (gvd.shape == (len(keys), wl.size))
+    for row, key in enumerate(keys):
+        material = load_material(key)
+        wl_range = material._info["Parameters"][0]["WlNRange"]
+        inside = (wl >= wl_range[0]) & (wl <= wl_range[1])
+        assert (np.all(np.isnan(gvd[row, ~inside])))
+        if np.any(inside):
+            assert (np.allclose(gvd[row, inside], material.get_dispersion(wl[inside], orders=(2,))[0]))
+
+    # 2 - selection by names and by predicate, missing rays
+    n = evaluate_catalog(['Zinc oxide', 'BK7'], 1.03, ray='e')
+    assert (np.isclose(n[0, 0], 1.9565995766753679))
+    assert (np.isnan(n[1, 0]))
+    glasses = evaluate_catalog(lambda info: info['Type'] == 'Glasses', wl, 'n')
+    assert (np.all(glasses[~np.isnan(glasses)] > 1))
+
+    with pytest.raises(ValueError):
+        evaluate_catalog(['unobtainium'], wl)
+
+
+def test_temperature():
+    import numpy as np
+    from scilightcon.optics import load_material
+
+    lbo = load_material('LiB3O5')
+    wl = np.linspace(0.8, 1.2, 5)[:, np.newaxis]
+    temperature = np.array([25.0, 50.0, 75.0])
+
+    # 1 - reference temperature gives the tabulated index, other temperatures shift it by dn/dT
+    n_o, n_e = lbo.get_refractive_index(wl, temperature=temperature)
+    reference_o, reference_e = lbo.get_refractive_index(wl)
+    assert (n_o.shape == (5, 3))
+    assert (np.allclose(n_o[:, 0], reference_o[:, 0]))
+    assert (np.allclose(n_o - reference_o, -5.2e-05 * (temperature - 25.0)))
+    assert (np.allclose(n_e - reference_e, -7.98e-05 * (temperature - 25.0)))
+
+    # 2 - grid evaluation of dispersion, GVD does not depend on a constant dn/dT
+    n, gvd = lbo.get_dispersion(wl, orders=(0, 2), temperature=temperature)
+    assert (np.allclose(n, n_o))
+    assert (np.allclose(gvd, lbo.get_dispersion(wl, orders=(2,))[0]))
+
+    # 3 - materials without thermo-optic data
+    with pytest.raises(ValueError):
+        load_material('BK7').get_refractive_index(1.0, temperature=30.0)
+
+    # 4 - dn/dT data of records without temperature tuning are not used
+    kdp = load_material('KH2PO4')
+    assert (not kdp._parameters[0]["TemperatureTunning"] and kdp._parameters[0]["DndT"] is not None)
+    with pytest.raises(ValueError):
+        kdp.get_refractive_index(1.0, ray='o', temperature=30.0)
+    with pytest.raises(ValueError):
+        kdp.get_dispersion(1.0, temperature=np.array([30.0, 40.0]))
+
+    # 5 - temperatures below absolute zero or not a number, wavelengths outside of the thermo-optic data
+    for invalid in [-300.0, np.nan, np.array([25.0, -274.0])]:
+        with pytest.raises(ValueError):
+            lbo.get_refractive_index(1.0, temperature=invalid)
+    dn_dT, reference_temperature, _ = lbo._thermo_optic[0]
+    lbo._thermo_optic[0] = (dn_dT, reference_temperature, (0.5, 1.5))
+    assert (np.isfinite(lbo.get_refractive_index(1.0, ray='o', temperature=60.0)[0]))
+    with pytest.raises(ValueError):
+        lbo.get_refractive_index(np.array([1.0, 2.0]), ray='o', temperature=60.0)
+    with pytest.raises(ValueError):
+        lbo.get_dispersion(2.0, temperature=60.0)
+
+
+def test_extinction_coefficient():
+    import numpy as np
+    from scilightcon.optics import load_material
+
+    # 1 - interpolant passes through the tabulated data
+    gold = load_material('Au')
+    parameter = gold._info["Parameters"][0]
+    k, e = gold.get_extinction_coefficient(np.asarray(parameter["DataKWl"]))
+    assert (e is None)
+    assert (np.allclose(k, parameter["DataK"]))
+
+    # 2 - complex index combines n and k
+    wl = np.linspace(1.0, 2.0, 4)
+    n, = gold.get_complex_index(wl, ray='o')
+    assert (np.allclose(n.real, gold.get_refractive_index(wl, ray='o')[0]))
+    assert (np.allclose(n.imag, gold.get_extinction_coefficient(wl, ray='o')[0]))
+
+    # 3 - internal transmission over a thickness x wavelength grid
+    amtir = load_material('AMTIR')
+    thickness = np.array([0.0, 1.0, 2.0])[:, np.newaxis]
+    t = amtir.get_internal_transmission(wl, thickness)
+    assert (t.shape == (3, 4))
+    assert (np.allclose(t[0], 1.0))
+    assert (np.allclose(t[2], t[1]**2))
+
+    # 4 - materials without absorption data and wavelengths out of range
+    with pytest.raises(ValueError):
+        load_material('BK7').get_extinction_coefficient(1.0)
+    with pytest.raises(ValueError):
+        gold.get_extinction_coefficient(0.1)
+
+
+def test_biaxial():
+    import numpy as np
+    from scilightcon.optics import load_material
+
+    # 1 - third principal axis of biaxial crystals
+    lbo = load_material('LiB3O5')
+    n_x, n_y, n_z = lbo.get_principal_indices(np.array([0.8, 1.064]))
+    assert (np.allclose(n_z, lbo.get_refractive_index(np.array([0.8, 1.064]), ray='z')[0]))
+    assert (np.all(n_x < n_y) and np.all(n_y < n_z))
+    assert (np.isfinite(lbo.get_GVD(1.064, ray='z')[0]))
+    with pytest.raises(ValueError):
+        load_material('BBO').get_refractive_index(1.03, ray='z')
+
+    # 2 - propagation along principal axes and planes
+    n_1, n_2 = lbo.get_effective_index(1.064, np.array([0.0, np.pi / 2, np.pi / 2]), np.array([0.0, 0.0, np.pi / 2]))
+    assert (np.allclose(n_1, [n_y[1], n_z[1], n_z[1]]))
+    assert (np.allclose(n_2, [n_x[1], n_y[1], n_x[1]]))
+
+    # 3 - uniaxial crystals reduce to the extraordinary index ellipse
+    bbo = load_material('BBO')
+    theta = np.linspace(0.0, np.pi / 2, 7)
+    n_o, n_e = bbo.get_refractive_index(1.03)
+    n_slow, n_fast = bbo.get_effective_index(1.03, theta, 0.4)
+    assert (np.allclose(n_slow, n_o))
+    assert (np.allclose(n_fast, 1 / np.sqrt(np.cos(theta)**2 / n_o**2 + np.sin(theta)**2 / n_e**2)))
+
+    # 4 - angle x wavelength grid
+    n_1, n_2 = lbo.get_effective_index(np.linspace(0.8, 1.2, 5)[:, np.newaxis], theta, 0.0)
+    assert (n_1.shape == (5, 7))
+
+
+def test_phase_matching():
+    import numpy as np
+    from scilightcon.optics import load_material, PhaseMatching
+    from scilightcon.utils import c
+
+    bbo = load_material('BBO')
+
+    # 1 - type I SHG in a negative uniaxial crystal: n_o(w) = n_e(2w, theta)
+    shg = PhaseMatching(bbo, interaction='I')
+    wl = np.linspace(0.8, 1.6, 9)
+    theta = shg.get_phase_matching_angle(wl, wl)
+    n_o, = bbo.get_refractive_index(wl, ray='o')
+    _, n_e = bbo.get_effective_index(wl / 2, theta)
+    assert (np.allclose(n_o, n_e, atol=1e-12))
+
+    # 2 - no solution gives nan
+    assert (np.isnan(shg.get_phase_matching_angle(0.4, 0.4)))
+    with pytest.raises(ValueError):
+        PhaseMatching(bbo, interaction='III')
+
+    # 3 - group velocity mismatch of the ordinary wave agrees with the group delay
+    gvm, _ = shg.get_group_velocity_mismatch(1.03, 1.03, theta[3])
+    gd_o, = bbo.get_dispersion(1.03, orders=(1,), ray='o')
+    _, n_e_plus = bbo.get_effective_index(0.515 * (1 + 1e-6), theta[3])
+    _, n_e_minus = bbo.get_effective_index(0.515 * (1 - 1e-6), theta[3])
+    _, n_e = bbo.get_effective_index(0.515, theta[3])
+    gd_e = (n_e - 0.515 * (n_e_plus - n_e_minus) / (2e-6 * 0.515)) / c
+    assert (np.isclose(gvm, gd_o - gd_e, rtol=1e-5))
+
+    # 4 - acceptance bandwidths scale inversely with the crystal length
+    angular, spectral = shg.get_acceptance_bandwidths(1.03, 1.03, theta[3], np.array([1.0, 2.0]), fixed_wave=None)
+    assert (np.allclose(angular[0], 2 * angular[1]))
+    assert (np.allclose(spectral[0], 2 * spectral[1]))
+
+    # 5 - analytic slope of the effective indices agrees with finite differences, also for biaxial crystals
+    from scilightcon.optics._materials import _get_effective_indices, _get_effective_index_slopes
+    theta = np.linspace(0.05, 1.5, 30)
+    for material, phi in [(bbo, 0.0), (load_material('LiB3O5'), 0.3), (load_material('KTP'), np.pi / 2)]:
+        principal = material.get_principal_indices(1.03)
+        h = 1e-4
+        finite = (np.array(_get_effective_indices(*principal, theta + h, phi)) - np.array(_get_effective_indices(*principal, theta - h, phi))) / (2 * h)
+        assert (np.allclose(_get_effective_index_slopes(*principal, theta, phi), finite, rtol=0, atol=1e-8))
+
+    # 6 - Newton iterations phase match a biaxial crystal in a principal plane
+    lbo = PhaseMatching(load_material('LiB3O5'), interaction='I', phi=0.0)
+    wl = np.linspace(0.8, 1.0, 5)
+    theta = lbo.get_phase_matching_angle(wl, wl, max_iterations=8)
+    assert (np.all(np.isfinite(theta)))
+    assert (np.allclose(lbo._get_wave_vector_mismatch(lbo._get_wavelengths(wl, wl), [lbo.material.get_principal_indices(x) for x in lbo._get_wavelengths(wl, wl)], theta), 0.0, atol=1e-8))
+
+
+def test_B_integral():
+    import math
+    import numpy as np
+    from scilightcon.optics import load_material, get_peak_intensity, get_B_integral
+
+    # 1 - n2 is interpolated between measured wavelengths and constant outside
+    fused_silica = load_material('fused_silica')
+    assert (np.allclose(fused_silica.get_nonlinear_index([0.2, 0.527, 0.79, 2.0]), [3.6e-16, 3e-16, 2.87e-16, 2.74e-16]))
+    bbo = load_material('BaB2O4')
+    assert (np.isclose(bbo.get_nonlinear_index(1.064, ray='e'), 2.34e-16))
+    with pytest.raises(ValueError):
+        load_material('BK7').get_nonlinear_index(1.03)
+    with pytest.raises(ValueError):
+        fused_silica.get_nonlinear_index(1.03, ray='e')
+    with pytest.raises(ValueError):
+        load_material('KTP').get_nonlinear_index(1.03, ray='z')
+
+    # 2 - peak intensity of a Gaussian pulse
+    intensity = get_peak_intensity(1e-3, 300.0, 1.0)
+    assert (np.isclose(intensity, 0.9394 * 1e-3 / 300e-15 * 2 / (math.pi * 0.1**2), rtol=1e-4))
+
+    # 3 - B-integral of a stack over a batch of pulse parameters
+    energy = np.array([1e-4, 1e-3])[:, np.newaxis, np.newaxis]
+    duration = np.array([100.0, 300.0])[:, np.newaxis]
+    beam_radius = np.array([1.0, 2.0, 4.0])
+    b = get_B_integral([(fused_silica, 10.0), (bbo, 2.0, 'e')], 1.03, energy, duration, beam_radius)
+    assert (b.shape == (2, 2, 3))
+    single = 2 * math.pi / 1.03e-4 * get_peak_intensity(1e-3, 300.0, 2.0) * (fused_silica.get_nonlinear_index(1.03) * 1.0 + bbo.get_nonlinear_index(1.03, 'e') * 0.2)
+    assert (np.isclose(b[1, 1, 1], single))
+
+
+def test_optical_stack():
+    import numpy as np
+    from scilightcon.optics import load_material, OpticalStack
+    from scilightcon.utils import c
+
+    wl = np.linspace(0.99, 1.07, 41)
+    stack = OpticalStack(2 * np.pi * c / (wl * 1e-3))
+    fused_silica = load_material('fused_silica')
+    bbo = load_material('BBO')
+    window = stack.add_material(fused_silica, 5.0)
+    stack.add_material(bbo, 2.0, ray='e')
+
+    # 1 - budget is the thickness weighted sum of material dispersion
+    phase, gd, gdd, tod = stack.get_dispersion()
+    assert (np.allclose(gdd, 5.0 * fused_silica.get_GVD(wl) + 2.0 * bbo.get_GVD(wl, ray='e')))
+    assert (np.allclose(tod, 5.0 * fused_silica.get_TOD(wl) + 2.0 * bbo.get_TOD(wl, ray='e')))
+    assert (np.allclose(np.gradient(phase, stack.omega)[1:-1], gd[1:-1], rtol=1e-5))
+    element = stack.get_element_dispersion(window)
+    assert (len(element) == 4 and np.allclose(element[2], fused_silica.get_GVD(wl)))
+
+    # 2 - changing a thickness does not evaluate materials again
+    stack.set_thickness(window, 10.0)
+    assert (stack.thicknesses == (10.0, 2.0))
+    assert (np.allclose(stack.get_GDD(), 10.0 * fused_silica.get_GVD(wl) + 2.0 * bbo.get_GVD(wl, ray='e')))
+
+    # 3 - curves multiply the transmission
+    stack.add_curve(np.array([1.1, 0.9]), np.array([50.0, 50.0]), bounces=2)
+    assert (np.allclose(stack.get_transmission(), 0.25))
+
+
+def test_pulse_propagation():
+    import math
+    import numpy as np
+    import pytest
+    from scilightcon.optics import load_material, PulsePropagator
+    from scilightcon.utils import c
+
+    omega0 = 2 * np.pi * c / 1.03e-3
+    omega = omega0 + np.linspace(-0.5, 0.5, 2048, endpoint=False)
+    fused_silica = load_material('fused_silica')
+    propagator = PulsePropagator(omega, [(fused_silica, 10.0)])
+    t = propagator.time
+    field = np.exp(-2 * np.log(2) * (t / 30.0)**2)
+    spectrum = propagator.to_frequency(field)
+
+    # 1 - transforms are inverse of each other, linear propagation only changes the spectral phase
+    assert (np.allclose(propagator.to_time(spectrum), field))
+    output = propagator.propagate(spectrum)
+    assert (np.allclose(np.abs(output), np.abs(spectrum)))
+
+    # 2 - group delay is removed, the pulse is stretched by GDD
+    intensity = np.abs(propagator.to_time(output))**2
+    assert (abs(np.sum(t * intensity) / np.sum(intensity)) < 1.0)
+    gdd = fused_silica.get_GVD(1.03)[0] * 10.0
+    rms = lambda x: math.sqrt(np.sum(t**2 * x) / np.sum(x))
+    assert (np.isclose(rms(intensity), math.sqrt(rms(field**2)**2 + (gdd / (2 * rms(field**2)))**2), rtol=1e-3))
+
+    # 3 - batches of fields
+    batch = propagator.propagate(np.array([spectrum, 2 * spectrum]))
+    assert (batch.shape == (2, 2048) and np.allclose(batch[1], 2 * output))
+
+    # 4 - self-phase modulation of a pulse long enough to be barely dispersed gives the B-integral at the peak
+    peak_intensity = 1e11
+    long_pulse = np.exp(-2 * np.log(2) * (t / 1000.0)**2)
+    strong = propagator.propagate(np.sqrt(peak_intensity) * propagator.to_frequency(long_pulse), kerr=True, n_steps=5)
+    phase = np.angle(propagator.to_time(strong)[len(t) // 2])
+    assert (np.isclose(phase, omega0 / c * 10.0 * fused_silica.get_nonlinear_index(1.03) * peak_intensity * 1.0, rtol=1e-3))
+
+    with pytest.raises(ValueError):
+        PulsePropagator(omega, [('BK7', 1.0)]).propagate(spectrum, kerr=True)
+
+
+def test_lamp_spectra():
+    import numpy as np
+    from scilightcon.datasets import load_csv_data
+    from scilightcon.optics import get_Hg_spectrum, get_Ar_spectrum, get_White_LED_spectrum
+
+    wl = np.linspace(200, 1100, 9000)
+    for get_spectrum, file_name in [(get_Hg_spectrum, 'Hg_lines.csv'), (get_Ar_spectrum, 'Ar_lines.csv'), (get_White_LED_spectrum, 'White_LED_spectrum.csv')]:
+        data, header = load_csv_data(file_name)
+        for width in [0.1, 2.0]:
+            expected = sum(intensity * np.exp(-(wl - line)**2 / (2 * width**2)) for line, intensity in data)
+            # 1 - sorted grid, unsorted grid of any shape and a width per point
+            assert (np.allclose(get_spectrum(wl, width), expected, rtol=0, atol=1e-12 * expected.max()))
+            shuffled = np.random.default_rng(0).permutation(wl.size)
+            assert (np.allclose(get_spectrum(wl[shuffled].reshape(9, -1), width), expected[shuffled].reshape(9, -1), rtol=0, atol=1e-12 * expected.max()))
+            assert (np.allclose(get_spectrum(wl[::10], np.full(900, width)), expected[::10]))
+
+    assert (np.ndim(get_Hg_spectrum(546.0, 1.0)) == 0)
+
+    # 2 - non-positive widths
+    for width in [-1.0, 0.0, np.array([1.0, -1.0])]:
+        with pytest.raises(ValueError):
+            get_Hg_spectrum(np.array([546.0, 547.0]), width)
+
+
+def test_group_index_and_walk_off():
+    import numpy as np
+    from scilightcon.optics import load_material
+    from scilightcon.optics._materials import _get_effective_indices
+    from scilightcon.utils import c
+
+    # 1 - group index agrees with a numerical derivative of the refractive index and with GD
+    fused_silica = load_material('fused_silica')
+    wl = np.linspace(0.5, 1.5, 11)
+    n = lambda x: fused_silica.get_refractive_index(x, ray='o')[0]
+    assert (np.allclose(fused_silica.get_group_index(wl), n(wl) - wl * (n(wl + 1e-5) - n(wl - 1e-5)) / 2e-5, atol=1e-9))
+    gd, = fused_silica.get_dispersion(wl, orders=(1,))
+    assert (np.allclose(fused_silica.get_group_delay(wl), gd))
+    assert (np.allclose(fused_silica.get_group_index(wl), gd * c))
+
+    lbo = load_material('LiB3O5')
+    assert (lbo.get_group_index(wl[:3], ray='z', temperature=np.array([20.0, 60.0])[:, np.newaxis]).shape == (2, 3))
+
+    # 2 - walk-off of the extraordinary wave in a uniaxial crystal
+    bbo = load_material('BBO')
+    theta = np.radians(np.linspace(5, 85, 9))
+    rho_slow, rho_fast = bbo.get_walk_off_angle(0.515, theta)
+    n_o, n_e = bbo.get_refractive_index(0.515)
+    _, n_theta = bbo.get_effective_index(0.515, theta)
+    assert (np.allclose(rho_slow, 0.0, atol=1e-10))
+    assert (np.allclose(rho_fast, np.arctan(0.5 * n_theta**2 * (n_e**-2 - n_o**-2) * np.sin(2 * theta))))
+
+    # 3 - walk-off in a biaxial crystal agrees with numerical derivatives of the effective indices
+    wl = np.linspace(0.8, 1.2, 3)[:, np.newaxis, np.newaxis]
+    theta = np.linspace(0.1, 1.5, 4)[:, np.newaxis]
+    phi = np.linspace(0.05, 1.5, 5)
+    n_x, n_y, n_z = lbo.get_principal_indices(wl)
+    h = 1e-6
+    for rho, i in zip(lbo.get_walk_off_angle(wl, theta, phi), (0, 1)):
+        index = lambda t, p: _get_effective_indices(n_x, n_y, n_z, t, p)[i]
+        d_theta = (index(theta + h, phi) - index(theta - h, phi)) / (2 * h)
+        d_phi = (index(theta, phi + h) - index(theta, phi - h)) / (2 * h * np.sin(theta))
+        assert (rho.shape == (3, 4, 5))
+        assert (np.allclose(rho, np.arctan(np.hypot(d_theta, d_phi) / index(theta, phi)), atol=1e-7))
+
+    # 4 - no walk-off in isotropic materials
+    assert (np.all(np.array(fused_silica.get_walk_off_angle(1.0, theta, phi)) == 0.0))
+
+
+def test_scalar_refractive_index():
+    import numpy as np
+    from scilightcon.optics import load_material, list_materials
+
+    # 1 - the float fast path matches array evaluation for every material and ray
+    for key in list_materials():
+        material = load_material(key)
+        wl_min, wl_max = material._info['Parameters'][0]['WlNRange']
+        wl = float(0.5 * (wl_min + wl_max))
+        scalar = material.get_refractive_index(wl)
+        array = material.get_refractive_index(np.array(wl))
+        assert (len(scalar) == len(array) == 2)
+        for n_scalar, n_array in zip(scalar, array):
+            if n_array is None:
+                assert (n_scalar is None)
+            else:
+                assert (isinstance(n_scalar, np.float64))
+                assert (np.isclose(n_scalar, n_array, rtol=1e-13, atol=0.0, equal_nan=True))
+
+    # 2 - integers, missing rays and out-of-range wavelengths behave as for arrays
+    zinc = load_material('Zinc oxide')
+    assert (zinc.get_refractive_index(1, ray='o')[0] == zinc.get_refractive_index(np.array(1.0), ray='o')[0])
+    with pytest.raises(ValueError):
+        zinc.get_refractive_index(4.1)
+    with pytest.raises(ValueError):
+        load_material('fused_silica').get_refractive_index(1.03, ray='e')
+
+
+def test_low_order_dispersion_speed():
+    import math
+    import timeit
+    import numpy as np
+    from scilightcon.optics import load_material
+    from scilightcon.optics._materials import _get_propagation_constant_derivatives
+    from scilightcon.utils import c
+
+    bbo = load_material('BBO')
+    kernel = bbo._kernels[0]
+    wl = np.linspace(0.5, 1.5, 100000)
+
+    # 1 - the closed-form chain rule up to TOD matches the series composition used for higher orders
+    closed_form = _get_propagation_constant_derivatives(wl, kernel.evaluate_series(wl, 3))
+    composed = _get_propagation_constant_derivatives(wl, kernel.evaluate_series(wl, 4))
+    for order in range(4):
+        assert (np.allclose(closed_form[order], composed[order], rtol=1e-12, atol=1e-12 * np.abs(composed[order]).max()))
+
+    # 2 - the fused path is not slower than the wavelength derivative formulas of get_dispersion at its introduction
+    def reference():
+        n, dn, d2n, d3n = kernel.evaluate(wl, 3)
+        return [n, (n - wl * dn) / c, d2n * (wl**3 / (2.0 * math.pi * c * c)) * 1.0e-3,
+                (-wl**4 / (4 * math.pi * math.pi * c * c * c)) * (3 * d2n + wl * d3n) * 1.0e-6]
+
+    for value, target in zip(bbo.get_dispersion(wl), reference()):
+        assert (np.allclose(value, target, rtol=1e-12, atol=1e-12 * np.abs(target).max()))
+    # interleaved, so that load on the machine affects both timings alike
+    fused_time, reference_time = np.inf, np.inf
+    for _ in range(7):
+        fused_time = min(fused_time, timeit.timeit(lambda: bbo.get_dispersion(wl), number=3))
+        reference_time = min(reference_time, timeit.timeit(reference, number=3))
+    assert (fused_time < 1.5 * reference_time)
+
+
+def test_tabulate_tabulated_material():
+    import numpy as np
+    from scilightcon.optics import load_material
+
+    # 1 - materials given by tabulated data are rejected before any tabulation
+    amtir = load_material('AMTIR')
+    for orders in [(0,), (0, 1, 2, 3)]:
+        with pytest.raises(ValueError):
+            amtir.tabulate(2.0, 12.0, orders=orders)
+
+    # 2 - wide ranges fall back to higher degree polynomials
+    assert (load_material('KI').tabulate(0.25, 50.0, orders=(0, 2)).degree == 6)
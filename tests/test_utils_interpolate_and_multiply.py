@@ -43,3 +43,53 @@ def test_interpolate_and_multiply():
 
     assert (np.shape(result) == (2, 31))
     assert (np.sum(np.abs(np.array(result[:,1]))) < 1.0e-8)
+
+
+def test_evaluate_spectral_chain():
+    from scilightcon.utils import evaluate_spectral_chain
+
+    wl = np.linspace(300.0, 900.0, 601)
+    rng = np.random.default_rng(0)
+    curves = []
+    for _ in range(4):
+        x = np.sort(rng.uniform(250.0, 950.0, 50))
+        curves.append((x, rng.uniform(0.0, 100.0, 50)))
+    fractions = np.array([np.interp(wl, x, y / 100.0, left=np.nan, right=np.nan) for x, y in curves])
+
+    # 1 - a single chain with repeated elements
+    chain = evaluate_spectral_chain(wl, curves, [2, 0, 1, 3], percent=True)
+    assert (chain.shape == (601,))
+    target = fractions[0]**2 * fractions[2] * fractions[3]**3
+    assert (np.allclose(chain, target, rtol=1e-12, equal_nan=True))
+
+    # 2 - a batch of chains matches chains evaluated one by one, curves with zero count are ignored
+    counts = rng.integers(0, 3, (20, 4))
+    batch = evaluate_spectral_chain(wl.reshape(601, 1), curves, counts, percent=True)
+    assert (batch.shape == (20, 601, 1))
+    for row, count in zip(batch, counts):
+        assert (np.allclose(row[:, 0], np.prod(fractions**count[:, np.newaxis], axis=0), rtol=1e-12, equal_nan=True))
+        assert (np.array_equal(np.isnan(row[:, 0]), np.isnan(fractions[count > 0]).any(axis=0)))
+
+    # 3 - zeros, negative values, unsorted curves, fill value and units per curve
+    curves = [([700.0, 500.0, 300.0], [-0.5, 0.0, 1.0]), ([300.0, 700.0], [50.0, 50.0])]
+    chain = evaluate_spectral_chain([300.0, 500.0, 600.0, 800.0], curves, [[1, 1], [2, 0], [0, 1]], percent=[False, True], fill_value=1.0)
+    assert (np.allclose(chain, [[0.5, 0.0, -0.125, 1.0], [1.0, 0.0, 0.0625, 1.0], [0.5, 0.5, 0.5, 1.0]]))
+
+    # 4 - infinite values propagate through the chains they enter
+    chain = evaluate_spectral_chain([200.0, 500.0], [([300.0, 700.0], [0.5, 0.5]), ([300.0, 700.0], [0.0, 0.0])], [[1, 0], [2, 0], [0, 1], [1, 1]], fill_value=np.inf)
+    assert (np.array_equal(chain, [[np.inf, 0.5], [np.inf, 0.25], [np.inf, 0.0], [np.inf, 0.0]]))
+    chain = evaluate_spectral_chain([200.0, 500.0], [([300.0, 700.0], [0.5, 0.5]), ([300.0, 700.0], [-1.0, -1.0])], [[0, 0], [1, 1]], fill_value=np.inf)
+    assert (np.array_equal(chain, [[1.0, 1.0], [np.inf, -0.5]]))
+
+    # 5 - the result matches interpolate_and_multiply
+    from scilightcon.utils import interpolate_and_multiply
+    D1 = (np.linspace(0.0, 1000.0, 41), np.exp(-np.linspace(-3.0, 3.0, 41)**2))
+    D2 = (np.linspace(200.0, 950.0, 16), np.exp(-np.linspace(-2.0, 2.0, 16)**2))
+    x3, y3 = interpolate_and_multiply(D1, D2)
+    chain = evaluate_spectral_chain(D1[0], [D1, D2])
+    assert (np.allclose(chain[~np.isnan(chain)], y3) and np.array_equal(D1[0][~np.isnan(chain)], x3))
+
+    with pytest.raises(ValueError):
+        evaluate_spectral_chain(wl, curves, [1, 2, 3])
+    with pytest.raises(ValueError):
+        evaluate_spectral_chain(wl, curves, [1, -1])